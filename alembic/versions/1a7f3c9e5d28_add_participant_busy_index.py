@@ -0,0 +1,62 @@
+"""Add meeting participant busy-time index
+
+Revision ID: 1a7f3c9e5d28
+Revises: 8c4d1e6f2a95
+Create Date: 2026-10-18 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "1a7f3c9e5d28"
+down_revision: Union[str, Sequence[str], None] = "8c4d1e6f2a95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя индекса, таблица, колонки)
+INDEXES = [
+    (
+        "ix_meeting_participants_user_id_start_time",
+        "meeting_participants",
+        ["user_id", "start_time", "end_time"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Индекс занятости участников для поиска свободного времени"""
+    if op.get_context().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,69 @@
+"""Add hot path indexes
+
+Revision ID: 3f1c2a7b9d10
+Revises: 9dc67f294198
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "3f1c2a7b9d10"
+down_revision: Union[str, Sequence[str], None] = "9dc67f294198"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя индекса, таблица, колонки)
+INDEXES = [
+    ("ix_tasks_team_id_id", "tasks", ["team_id", "id"]),
+    ("ix_tasks_assignee_id_deadline", "tasks", ["assignee_id", "deadline"]),
+    (
+        "ix_meeting_participants_user_id_meeting_id",
+        "meeting_participants",
+        ["user_id", "meeting_id"],
+    ),
+    ("ix_meeting_participants_meeting_id", "meeting_participants", ["meeting_id"]),
+    ("ix_meetings_start_time_end_time", "meetings", ["start_time", "end_time"]),
+    ("ix_evaluations_task_id", "evaluations", ["task_id"]),
+    ("ix_comments_task_id", "comments", ["task_id"]),
+    ("ix_users_team_id", "users", ["team_id"]),
+]
+
+
+def upgrade() -> None:
+    """Индексы для горячих запросов (на PostgreSQL - CONCURRENTLY)"""
+    if op.get_context().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,54 @@
+"""Add evaluation daily score rollups
+
+Revision ID: 4e9b7c2d1f63
+Revises: d2b6a8f41e07
+Create Date: 2026-10-18 21:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "4e9b7c2d1f63"
+down_revision: Union[str, Sequence[str], None] = "d2b6a8f41e07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Сводка оценок по исполнителям и дням"""
+    op.create_table(
+        "evaluation_daily_scores",
+        sa.Column("assignee_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("score_sum", sa.Integer(), nullable=False),
+        sa.Column("score_count", sa.Integer(), nullable=False),
+        *[
+            sa.Column(f"count_{score}", sa.Integer(), nullable=False)
+            for score in range(1, 6)
+        ],
+        sa.ForeignKeyConstraint(["assignee_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("assignee_id", "day"),
+    )
+
+    # Заполнение по уже существующим оценкам
+    counts = ", ".join(
+        f"SUM(CASE WHEN e.score = {score} THEN 1 ELSE 0 END)"
+        for score in range(1, 6)
+    )
+    op.execute(
+        "INSERT INTO evaluation_daily_scores (assignee_id, day, score_sum, "
+        "score_count, count_1, count_2, count_3, count_4, count_5) "
+        f"SELECT t.assignee_id, DATE(e.evaluated_at), SUM(e.score), COUNT(*), {counts} "
+        "FROM evaluations e JOIN tasks t ON t.id = e.task_id "
+        "WHERE t.assignee_id IS NOT NULL "
+        "GROUP BY t.assignee_id, DATE(e.evaluated_at)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("evaluation_daily_scores")
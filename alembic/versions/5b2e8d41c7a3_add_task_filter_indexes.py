@@ -0,0 +1,61 @@
+"""Add task list filter indexes
+
+Revision ID: 5b2e8d41c7a3
+Revises: 3f1c2a7b9d10
+Create Date: 2026-10-18 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "5b2e8d41c7a3"
+down_revision: Union[str, Sequence[str], None] = "3f1c2a7b9d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя индекса, таблица, колонки)
+INDEXES = [
+    ("ix_tasks_team_id_status_id", "tasks", ["team_id", "status", "id"]),
+    ("ix_tasks_team_id_deadline_id", "tasks", ["team_id", "deadline", "id"]),
+    ("ix_tasks_team_id_created_at", "tasks", ["team_id", "created_at"]),
+    ("ix_tasks_creator_id", "tasks", ["creator_id"]),
+]
+
+
+def upgrade() -> None:
+    """Индексы фильтров и сортировок списка задач"""
+    if op.get_context().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
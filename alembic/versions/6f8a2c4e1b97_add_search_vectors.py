@@ -0,0 +1,65 @@
+"""Add full-text search vectors for tasks and comments
+
+Revision ID: 6f8a2c4e1b97
+Revises: b5d1f7a3c826
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "6f8a2c4e1b97"
+down_revision: Union[str, Sequence[str], None] = "b5d1f7a3c826"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Выражения - как в app/models/search.py на момент миграции
+TASK_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'B')"
+)
+COMMENT_VECTOR = "setweight(to_tsvector('russian', coalesce(content, '')), 'C')"
+
+
+def upgrade() -> None:
+    """
+    Вычисляемые столбцы tsvector и GIN индексы (PostgreSQL).
+    ADD COLUMN ... STORED переписывает таблицу под блокировкой,
+    индексы строятся CONCURRENTLY.
+    """
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.execute(
+        "ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({TASK_VECTOR}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE comments ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({COMMENT_VECTOR}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_team_id_search_vector "
+            "ON tasks USING gin (team_id, search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_comments_search_vector "
+            "ON comments USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_comments_search_vector")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_team_id_search_vector")
+    op.execute("ALTER TABLE comments DROP COLUMN search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN search_vector")
@@ -0,0 +1,28 @@
+"""Add task completed_at
+
+Revision ID: 7c3e5a9b2d14
+Revises: 4e9b7c2d1f63
+Create Date: 2026-10-18 22:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "7c3e5a9b2d14"
+down_revision: Union[str, Sequence[str], None] = "4e9b7c2d1f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Время выполнения задачи"""
+    op.add_column("tasks", sa.Column("completed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks", "completed_at")
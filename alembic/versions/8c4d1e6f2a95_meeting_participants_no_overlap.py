@@ -0,0 +1,95 @@
+"""Meeting participants no overlap
+
+Revision ID: 8c4d1e6f2a95
+Revises: 5b2e8d41c7a3
+Create Date: 2026-10-18 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers
+revision: str = "8c4d1e6f2a95"
+down_revision: Union[str, Sequence[str], None] = "5b2e8d41c7a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONSTRAINT = "excl_meeting_participants_no_overlap"
+
+# Изменение времени встречи (например, в админке) переносится на участников
+# в той же транзакции, поэтому пересечение при правке тоже будет отклонено.
+SYNC_FUNCTION = """
+CREATE OR REPLACE FUNCTION meeting_participants_sync_time() RETURNS trigger AS $$
+BEGIN
+    UPDATE meeting_participants
+    SET start_time = NEW.start_time, end_time = NEW.end_time
+    WHERE meeting_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SYNC_TRIGGER = """
+CREATE TRIGGER meetings_sync_participant_time
+AFTER UPDATE OF start_time, end_time ON meetings
+FOR EACH ROW EXECUTE FUNCTION meeting_participants_sync_time()
+"""
+
+
+def upgrade() -> None:
+    """
+    Копия времени встречи в meeting_participants и exclusion constraint
+    (PostgreSQL). Если в базе уже есть пересекающиеся встречи, их нужно
+    разнести до миграции - иначе ограничение не создастся.
+    """
+    op.add_column(
+        "meeting_participants", sa.Column("start_time", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "meeting_participants", sa.Column("end_time", sa.DateTime(), nullable=True)
+    )
+    op.execute(
+        """
+        UPDATE meeting_participants
+        SET start_time = (
+                SELECT start_time FROM meetings
+                WHERE meetings.id = meeting_participants.meeting_id
+            ),
+            end_time = (
+                SELECT end_time FROM meetings
+                WHERE meetings.id = meeting_participants.meeting_id
+            )
+        """
+    )
+    # Участники без встречи не нужны и не пройдут NOT NULL
+    op.execute("DELETE FROM meeting_participants WHERE start_time IS NULL")
+
+    with op.batch_alter_table("meeting_participants") as batch_op:
+        batch_op.alter_column("start_time", nullable=False)
+        batch_op.alter_column("end_time", nullable=False)
+
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.execute(
+            f"ALTER TABLE meeting_participants ADD CONSTRAINT {CONSTRAINT} "
+            "EXCLUDE USING gist "
+            "(user_id WITH =, tsrange(start_time, end_time) WITH &&)"
+        )
+        op.execute(SYNC_FUNCTION)
+        op.execute(SYNC_TRIGGER)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS meetings_sync_participant_time ON meetings")
+        op.execute("DROP FUNCTION IF EXISTS meeting_participants_sync_time()")
+        op.drop_constraint(CONSTRAINT, "meeting_participants")
+
+    with op.batch_alter_table("meeting_participants") as batch_op:
+        batch_op.drop_column("end_time")
+        batch_op.drop_column("start_time")
@@ -0,0 +1,79 @@
+"""Add covering indexes for team analytics
+
+Revision ID: a3c8e1f5d927
+Revises: f7b2d4e6a813
+Create Date: 2026-10-20 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "a3c8e1f5d927"
+down_revision: Union[str, Sequence[str], None] = "f7b2d4e6a813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя индекса, таблица, колонки)
+INDEXES = [
+    (
+        "ix_tasks_team_id_assignee_id_status",
+        "tasks",
+        ["team_id", "assignee_id", "status", "deadline", "completed_at"],
+    ),
+    (
+        "ix_evaluations_task_id_score",
+        "evaluations",
+        ["task_id", "score", "evaluated_at"],
+    ),
+]
+# Заменяется ix_evaluations_task_id_score (тот же первый столбец)
+REPLACED = [("ix_evaluations_task_id", "evaluations", ["task_id"])]
+
+
+def create_indexes(indexes) -> None:
+    if op.get_context().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        with op.get_context().autocommit_block():
+            for name, table, columns in indexes:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in indexes:
+            op.create_index(name, table, columns, unique=False)
+
+
+def drop_indexes(indexes) -> None:
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(indexes):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    else:
+        for name, table, _ in reversed(indexes):
+            op.drop_index(name, table_name=table)
+
+
+def upgrade() -> None:
+    """Покрывающие индексы: аналитика команды читает только индексы"""
+    create_indexes(INDEXES)
+    drop_indexes(REPLACED)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    create_indexes(REPLACED)
+    drop_indexes(INDEXES)
@@ -0,0 +1,58 @@
+"""Add task comment_count and ON DELETE for comments and evaluations
+
+Revision ID: b5d1f7a3c826
+Revises: 7c3e5a9b2d14
+Create Date: 2026-10-18 23:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "b5d1f7a3c826"
+down_revision: Union[str, Sequence[str], None] = "7c3e5a9b2d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Имена внешних ключей как у PostgreSQL по умолчанию; в SQLite ключи
+# без имени, batch-режим называет их по этому шаблону при пересоздании таблицы
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def replace_task_fk(table: str, ondelete=None) -> None:
+    name = f"{table}_task_id_fkey"
+    with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(name, type_="foreignkey")
+        batch_op.create_foreign_key(
+            name, "tasks", ["task_id"], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    """Счётчик комментариев задачи и удаление задачи одним DELETE"""
+    op.add_column(
+        "tasks",
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE tasks SET comment_count = (
+            SELECT count(*) FROM comments WHERE comments.task_id = tasks.id
+        )
+        """
+    )
+
+    replace_task_fk("comments", ondelete="CASCADE")
+    replace_task_fk("evaluations", ondelete="SET NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    replace_task_fk("evaluations")
+    replace_task_fk("comments")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("comment_count")
@@ -0,0 +1,44 @@
+"""Add user calendar feed columns
+
+Revision ID: d2b6a8f41e07
+Revises: 1a7f3c9e5d28
+Create Date: 2026-10-18 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers
+revision: str = "d2b6a8f41e07"
+down_revision: Union[str, Sequence[str], None] = "1a7f3c9e5d28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Токен и версия ленты календаря пользователя"""
+    op.add_column("users", sa.Column("calendar_token", sa.String(), nullable=True))
+    op.add_column(
+        "users",
+        sa.Column(
+            "calendar_version", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "users", sa.Column("calendar_updated_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_users_calendar_token"), "users", ["calendar_token"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_users_calendar_token"), table_name="users")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("calendar_updated_at")
+        batch_op.drop_column("calendar_version")
+        batch_op.drop_column("calendar_token")
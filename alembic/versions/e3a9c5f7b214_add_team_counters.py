@@ -0,0 +1,66 @@
+"""Add team member and task counters
+
+Revision ID: e3a9c5f7b214
+Revises: 6f8a2c4e1b97
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = "e3a9c5f7b214"
+down_revision: Union[str, Sequence[str], None] = "6f8a2c4e1b97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = [
+    "member_count",
+    "open_task_count",
+    "in_progress_task_count",
+    "done_task_count",
+]
+
+
+def upgrade() -> None:
+    """Счётчики участников и задач по статусам у команды"""
+    for name in COUNTERS:
+        op.add_column(
+            "teams",
+            sa.Column(name, sa.Integer(), server_default="0", nullable=False),
+        )
+    op.execute(
+        """
+        UPDATE teams SET member_count = u.count
+        FROM (
+            SELECT team_id, count(*) AS count FROM users GROUP BY team_id
+        ) AS u
+        WHERE u.team_id = teams.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE teams SET
+            open_task_count = t.open,
+            in_progress_task_count = t.in_progress,
+            done_task_count = t.done
+        FROM (
+            SELECT
+                team_id,
+                count(*) FILTER (WHERE status = 'open') AS open,
+                count(*) FILTER (WHERE status = 'in_progress') AS in_progress,
+                count(*) FILTER (WHERE status = 'done') AS done
+            FROM tasks GROUP BY team_id
+        ) AS t
+        WHERE t.team_id = teams.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(COUNTERS):
+        op.drop_column("teams", name)
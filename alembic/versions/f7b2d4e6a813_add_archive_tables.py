@@ -0,0 +1,140 @@
+"""Add archive tables for done tasks and past meetings
+
+Revision ID: f7b2d4e6a813
+Revises: e3a9c5f7b214
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision: str = "f7b2d4e6a813"
+down_revision: Union[str, Sequence[str], None] = "e3a9c5f7b214"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Архив задач с комментариями и оценками, архив встреч с участниками"""
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "status",
+            # Тип taskstatus уже создан вместе с tasks
+            postgresql.ENUM(
+                "open", "in_progress", "done", name="taskstatus", create_type=False
+            ),
+            nullable=True,
+        ),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("creator_id", sa.Integer(), nullable=True),
+        sa.Column("assignee_id", sa.Integer(), nullable=True),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["creator_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["assignee_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tasks_archive_assignee_id_deadline",
+        "tasks_archive",
+        ["assignee_id", "deadline"],
+    )
+    op.create_index("ix_tasks_archive_team_id_id", "tasks_archive", ["team_id", "id"])
+
+    op.create_table(
+        "comments_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks_archive.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_comments_archive_task_id", "comments_archive", ["task_id"])
+
+    op.create_table(
+        "evaluations_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("evaluated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks_archive.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_evaluations_archive_task_id", "evaluations_archive", ["task_id"]
+    )
+
+    op.create_table(
+        "meetings_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_meetings_archive_team_id_id", "meetings_archive", ["team_id", "id"]
+    )
+
+    op.create_table(
+        "meeting_participants_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("meeting_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["meeting_id"], ["meetings_archive.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_meeting_participants_archive_user_id_start_time",
+        "meeting_participants_archive",
+        ["user_id", "start_time", "end_time"],
+    )
+    op.create_index(
+        "ix_meeting_participants_archive_meeting_id",
+        "meeting_participants_archive",
+        ["meeting_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("meeting_participants_archive")
+    op.drop_table("meetings_archive")
+    op.drop_table("evaluations_archive")
+    op.drop_table("comments_archive")
+    op.drop_table("tasks_archive")
@@ -1,13 +1,25 @@
+from datetime import datetime
+
 from sqladmin import Admin, ModelView
 from fastapi import FastAPI
 from decouple import config
+from sqlalchemy import case, func, select, update
 from app.admin.auth import AdminAuth
-from app.database.database import engine
+from app.core.analytics_cache import analytics_cache
+from app.core.user_cache import user_cache
+from app.database.database import AsyncSessionLocal, engine
 from app.models.user import User
 from app.models.team import Team
-from app.models.task import Task
+from app.models.task import Task, TaskStatus
 from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
 from app.models.evaluation import Evaluation
+from app.services.calendar import bump_calendar_versions
+from app.services.evaluation import (
+    rebuild_score_rollups,
+    rebuild_task_score_rollups,
+)
+from app.services.team import TEAM_COUNTERS, reconcile_team_counters
 
 
 SECRET = config("SECRET_KEY")
@@ -15,6 +27,40 @@ SECRET = config("SECRET_KEY")
 # Админ-панель
 
 
+async def bump_calendars(user_ids):
+    # Правки через админку тоже меняют ETag лент ICS
+    async with AsyncSessionLocal() as db:
+        await bump_calendar_versions(db, user_ids)
+        await db.commit()
+
+
+async def rebuild_scores(assignee_ids=None, task_ids=None):
+    # Сводка оценок по дням пересчитывается для затронутых исполнителей
+    async with AsyncSessionLocal() as db:
+        if task_ids is not None:
+            await rebuild_task_score_rollups(db, task_ids)
+        else:
+            await rebuild_score_rollups(db, assignee_ids)
+        await db.commit()
+
+
+async def reconcile_teams(team_ids):
+    # Админка меняет участников и задачи напрямую - счётчики команд пересчитываются
+    async with AsyncSessionLocal() as db:
+        await reconcile_team_counters(db, team_ids)
+        await db.commit()
+
+
+async def get_participant_ids(meeting_id: int) -> list:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(MeetingParticipant.user_id).where(
+                MeetingParticipant.meeting_id == meeting_id
+            )
+        )
+        return list(result.scalars())
+
+
 class UserAdmin(ModelView, model=User):
     column_list = ["id", "email", "full_name", "role", "is_active", "team"]
     column_searchable_list = ["email", "full_name"]
@@ -26,10 +72,23 @@ class UserAdmin(ModelView, model=User):
     name_plural = "Пользователи"
     icon = "fa-solid fa-user"
 
+    async def on_model_change(self, data, model, is_created, request):
+        # Команда до изменения
+        request.state.team_id = model.team_id
+
+    async def after_model_change(self, data, model, is_created, request):
+        user_cache.invalidate(model.id)
+        await reconcile_teams([request.state.team_id, model.team_id])
+
+    async def after_model_delete(self, model, request):
+        user_cache.invalidate(model.id)
+        await reconcile_teams([model.team_id])
+
 
 class TeamAdmin(ModelView, model=Team):
     column_list = ["id", "name", "team_code", "creator"]
     column_searchable_list = ["name", "team_code"]
+    form_excluded_columns = TEAM_COUNTERS
     can_create = True
     can_edit = True
     can_delete = True
@@ -48,6 +107,42 @@ class TaskAdmin(ModelView, model=Task):
     name_plural = "Задачи"
     icon = "fa-solid fa-list-check"
 
+    async def on_model_change(self, data, model, is_created, request):
+        # Исполнитель и команда до изменения
+        request.state.calendar_users = [model.assignee_id]
+        request.state.team_id = model.team_id
+
+    async def after_model_change(self, data, model, is_created, request):
+        # Время выполнения - как при смене статуса через API
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Task)
+                .where(Task.id == model.id)
+                .values(
+                    completed_at=case(
+                        (
+                            Task.status == TaskStatus.done,
+                            func.coalesce(Task.completed_at, datetime.utcnow()),
+                        ),
+                        else_=None,
+                    )
+                )
+            )
+            await db.commit()
+        affected = request.state.calendar_users + [model.assignee_id]
+        await bump_calendars(affected)
+        if affected[0] != affected[1]:
+            await rebuild_scores(affected)
+        await reconcile_teams([request.state.team_id, model.team_id])
+        analytics_cache.invalidate(request.state.team_id)
+        analytics_cache.invalidate(model.team_id)
+
+    async def after_model_delete(self, model, request):
+        await bump_calendars([model.assignee_id])
+        await rebuild_scores([model.assignee_id])
+        await reconcile_teams([model.team_id])
+        analytics_cache.invalidate(model.team_id)
+
 
 class MeetingAdmin(ModelView, model=Meeting):
     column_list = ["id", "title", "start_time", "end_time", "team"]
@@ -59,6 +154,23 @@ class MeetingAdmin(ModelView, model=Meeting):
     name_plural = "Встречи"
     icon = "fa-solid fa-calendar-day"
 
+    async def after_model_change(self, data, model, is_created, request):
+        # Время встречи продублировано в meeting_participants
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(MeetingParticipant)
+                .where(MeetingParticipant.meeting_id == model.id)
+                .values(start_time=model.start_time, end_time=model.end_time)
+            )
+            await db.commit()
+        await bump_calendars(await get_participant_ids(model.id))
+
+    async def on_model_delete(self, model, request):
+        request.state.calendar_users = await get_participant_ids(model.id)
+
+    async def after_model_delete(self, model, request):
+        await bump_calendars(request.state.calendar_users)
+
 
 class EvaluationAdmin(ModelView, model=Evaluation):
     column_list = ["id", "task", "user", "score", "evaluated_at"]
@@ -70,6 +182,18 @@ class EvaluationAdmin(ModelView, model=Evaluation):
     name_plural = "Оценки"
     icon = "fa-solid fa-star"
 
+    async def on_model_change(self, data, model, is_created, request):
+        # Задача до изменения
+        request.state.score_tasks = [model.task_id]
+
+    async def after_model_change(self, data, model, is_created, request):
+        await rebuild_scores(task_ids=request.state.score_tasks + [model.task_id])
+        analytics_cache.clear()
+
+    async def after_model_delete(self, model, request):
+        await rebuild_scores(task_ids=[model.task_id])
+        analytics_cache.clear()
+
 
 # Функция для подключения админки к FastAPI
 def setup_admin(app: FastAPI):
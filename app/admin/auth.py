@@ -4,6 +4,7 @@ from fastapi import Request, HTTPException
 from fastapi.responses import RedirectResponse
 from app.models.user import User
 from app.database.database import AsyncSessionLocal
+from app.core.user_cache import user_cache
 from sqlalchemy import select
 
 
@@ -25,16 +26,22 @@ class AdminAuth(AuthenticationBackend):
         except ValueError:
             raise HTTPException(400, "Invalid user ID")
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(select(User).where(User.id == user_id_int))
-            user = result.scalar_one_or_none()
+        user = user_cache.get(user_id_int)
+        if user is None:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(User).where(User.id == user_id_int)
+                )
+                db_user = result.scalar_one_or_none()
+            if db_user:
+                user = user_cache.set(db_user)
 
         if not user:
             return RedirectResponse(url="/login", status_code=307)
 
-        if not user.is_active:
+        if not user["is_active"]:
             return RedirectResponse(url="/login", status_code=307)
-        if not user.is_superuser:
+        if not user["is_superuser"]:
             return RedirectResponse(url="/login", status_code=307)
 
         return True
@@ -1,132 +1,133 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import datetime, date, timedelta
+from datetime import date, timezone
+from typing import Literal
+from email.utils import format_datetime, parsedate_to_datetime
 
 
-from app.database.database import get_db
+from app.database.database import get_db, get_read_db
 from app.models.user import User
-from app.models.task import Task
-from app.models.meeting import Meeting
-from app.models.meeting_participant import MeetingParticipant
 from app.core.security import get_current_user
+from app.services import calendar as calendar_service
 
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
 
+@router.get("/range")
+async def get_calendar_range(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Календарь за период from - to (включительно): задачи и встречи по дням.
+    Встречи, пересекающие границы периода, тоже попадают в результат.
+    format=ndjson - потоком, по строке JSON на день, без сборки всего ответа.
+    """
+    if response_format == "ndjson":
+        calendar_service.check_range(date_from, date_to)
+        return StreamingResponse(
+            calendar_service.range_ndjson(db, current_user, date_from, date_to),
+            media_type="application/x-ndjson",
+        )
+    return await calendar_service.get_range(db, current_user, date_from, date_to)
+
+
 @router.get("/day")
 async def get_calendar_day(
     target_date: date = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Календарь на день: задачи и встречи.
     """
-
-    if not target_date:
-        target_date = date.today()
-
-    start = datetime.combine(target_date, datetime.min.time())
-    end = datetime.combine(target_date, datetime.max.time())
-
-    # Задачи (с дедалйном на этот день)
-    task_result = await db.execute(
-        select(Task).where(
-            Task.assignee_id == current_user.id,
-            Task.deadline >= start,
-            Task.deadline <= end,
-        )
-    )
-    tasks = task_result.scalars().all()
-
-    # Встречи
-    meetings_result = await db.execute(
-        select(Meeting)
-        .join(Meeting.participants)
-        .where(
-            MeetingParticipant.user_id == current_user.id,
-            Meeting.start_time >= start,
-            Meeting.end_time <= end,
-        )
-    )
-
-    meetings = meetings_result.scalars().all()
-
-    return {
-        "date": target_date,
-        "tasks": [{"id": t.id, "title": t.title, "status": t.status} for t in tasks],
-        "meetings": [
-            {
-                "id": m.id,
-                "title": m.title,
-                "time": f"{m.start_time.time()} - {m.end_time.time()}",
-            }
-            for m in meetings
-        ],
-    }
+    return await calendar_service.get_day(db, current_user, target_date)
 
 
 @router.get("/month")
 async def get_calendar_month(
     target_month: int = None,
     target_year: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Календаль на месяц: группировка по дням.
     """
-
-    now = datetime.now()
-    month = target_month or now.month
-    year = target_year or now.year
-
-    start = datetime(year, month, 1)
-    if month == 12:
-        end = datetime(year + 1, 1, 1)
-    else:
-        end = datetime(year, month + 1, 1)
-
-    # Задачи
-    tasks_result = await db.execute(
-        select(Task).where(
-            Task.assignee_id == current_user.id,
-            Task.deadline >= start,
-            Task.deadline < end,
-        )
+    return await calendar_service.get_month(
+        db, current_user, target_month, target_year
     )
 
-    tasks = tasks_result.scalars().all()
 
-    # Встречи
-    meetings_result = await db.execute(
-        select(Meeting)
-        .join(Meeting.participants)
-        .where(
-            MeetingParticipant.user_id == current_user.id,
-            Meeting.start_time >= start,
-            Meeting.end_time < end,
-        )
+@router.get("/feed")
+async def get_calendar_feed(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Ссылка на ленту ICS для подписки из календаря (Google, Outlook, iOS).
+    """
+    token = await calendar_service.get_feed_token(db, current_user)
+    return {"url": str(request.url_for("get_calendar_ics", user_token=token))}
+
+
+@router.post("/feed/reset")
+async def reset_calendar_feed(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Новая ссылка на ленту ICS; старая перестаёт работать.
+    """
+    token = await calendar_service.get_feed_token(db, current_user, reset=True)
+    return {"url": str(request.url_for("get_calendar_ics", user_token=token))}
+
+
+def not_modified(request: Request, etag: str, last_modified) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since.replace(tzinfo=None) >= last_modified
+
+
+@router.get("/{user_token}.ics")
+async def get_calendar_ics(
+    user_token: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Лента ICS по секретной ссылке (без авторизации). Клиенты календарей
+    опрашивают её часто, поэтому поддержаны If-None-Match и
+    If-Modified-Since: без изменений ответ 304 без чтения задач и встреч.
+    """
+    state = await calendar_service.get_feed_state(db, user_token)
+    headers = {
+        "ETag": state["etag"],
+        "Last-Modified": format_datetime(
+            state["last_modified"].replace(tzinfo=timezone.utc), usegmt=True
+        ),
+        "Cache-Control": "private, no-cache",
+    }
+    if not_modified(request, state["etag"], state["last_modified"]):
+        return Response(status_code=304, headers=headers)
+
+    body = await calendar_service.get_feed_body(db, state)
+    return Response(
+        content=body, media_type="text/calendar; charset=utf-8", headers=headers
     )
-    meetings = meetings_result.scalars().all()
-
-    calendar = {}
-    current = start
-    while current < end:
-        day = current.date()
-        calendar[day] = {"tasks": [], "meetings": []}
-        current += timedelta(days=1)
-
-    for t in tasks:
-        day = t.deadline.date()
-        if day in calendar:
-            calendar[day]["tasks"].append({"id": t.id, "title": t.title})
-
-    for m in meetings:
-        day = m.start_time.date()
-        if day in calendar:
-            calendar[day]["meetings"].append({"id": m.id, "title": m.title})
-
-    return {"year": year, "month": month, "calendar": calendar}
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal, Optional
+
+from app.database.database import get_db, get_read_db
+from app.models.user import User
+from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
+from app.schemas.pagination import Page
+from app.core.security import get_current_user
+from app.services import comment as comment_service
+from app.utils.pagination import set_link_header
+
+router = APIRouter(prefix="/tasks/{task_id}/comments", tags=["comments"])
+
+
+@router.get("/", response_model=Page[CommentOut])
+async def get_comments(
+    task_id: int,
+    request: Request,
+    response: Response,
+    sort: Literal["id", "-id"] = "id",
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Комментарии задачи своей команды: sort=id - от старых к новым,
+    sort=-id - от новых к старым. Пагинация: cursor, limit.
+    Число комментариев без загрузки - comment_count у задачи.
+    """
+    page = await comment_service.get_task_comments(
+        db, current_user, task_id, cursor, limit, sort == "-id", with_total
+    )
+    set_link_header(request, response, page["next_cursor"])
+    return page
+
+
+@router.post("/", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
+async def create_comment(
+    task_id: int,
+    comment_data: CommentCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await comment_service.create_comment(
+        db, current_user, task_id, comment_data
+    )
+
+
+@router.patch("/{comment_id}", response_model=CommentOut)
+async def update_comment(
+    task_id: int,
+    comment_id: int,
+    comment_data: CommentUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Изменить комментарий может только автор.
+    """
+    return await comment_service.update_comment(
+        db, current_user, task_id, comment_id, comment_data
+    )
+
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    task_id: int,
+    comment_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Удалить комментарий может автор, manager или admin.
+    """
+    await comment_service.delete_comment(db, current_user, task_id, comment_id)
+    return
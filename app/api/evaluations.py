@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from datetime import datetime, timedelta
+from datetime import date
+from typing import Literal, Optional, Union
 
-from app.database.database import get_db
+from app.database.database import get_db, get_read_db
 from app.models.user import User
-from app.models.task import Task, TaskStatus
-from app.models.evaluation import Evaluation
-from app.schemas.evaluation import EvaluationCreate, EvaluationOut
+from app.schemas.evaluation import (
+    EvaluationCreate,
+    EvaluationOut,
+    EvaluationExpandedOut,
+)
+from app.schemas.pagination import Page
 from app.core.security import manager_required, get_current_user
+from app.services import evaluation as evaluation_service
+from app.utils.pagination import set_link_header
 
 router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 
@@ -24,85 +29,90 @@ async def create_evaluation(
     Задача должна быть в статусе 'done'.
     Оценка от 1 до 5.
     """
-    if not (1 <= evaluation_data.score <= 5):
-        raise HTTPException(status_code=400, detail="Оценка должны быть от 1 до 5")
-
-    result = await db.execute(
-        select(Task).where(
-            Task.id == evaluation_data.task_id, Task.team_id == current_user.team_id
-        )
-    )
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(
-            status_code=404, detail="Задача не найдена или вы не в команде"
-        )
-
-    if task.status != TaskStatus.done:
-        raise HTTPException(
-            status_code=400, detail="Оценивать можно только выполненые задачи"
-        )
-
-    result = await db.execute(
-        select(Evaluation).where(Evaluation.task_id == evaluation_data.task_id)
-    )
-
-    if result.scalars().first():
-        raise HTTPException(status_code=400, detail="Задача уже оценена")
-
-    evaluation = Evaluation(
-        task_id=evaluation_data.task_id,
-        user_id=current_user.id,
-        score=evaluation_data.score,
+    return await evaluation_service.create_evaluation(
+        db, current_user, evaluation_data
     )
 
-    db.add(evaluation)
-    await db.commit()
-    await db.refresh(evaluation)
-    return evaluation
 
-
-@router.get("/my", response_model=list[EvaluationOut])
+@router.get(
+    "/my", response_model=Page[Union[EvaluationExpandedOut, EvaluationOut]]
+)
 async def get_my_evaluations(
-    db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    expand: Optional[Literal["task"]] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Пользователь видит все свои оцененные задачи.
+    expand=task - добавить название, статус, дедлайн задачи и имя оценившего.
+    Пагинация: cursor, limit
     """
+    if expand == "task":
+        page = await evaluation_service.get_user_evaluations_expanded(
+            db, current_user, cursor, limit, with_total
+        )
+        page["items"] = [
+            EvaluationExpandedOut.model_validate(row) for row in page["items"]
+        ]
+    else:
+        page = await evaluation_service.get_user_evaluations(
+            db, current_user, cursor, limit, with_total
+        )
 
-    result = await db.execute(
-        select(Evaluation).join(Task).where(Task.assignee_id == current_user.id)
-    )
-    evaluations = result.scalars().all()
-    return evaluations
+    set_link_header(request, response, page["next_cursor"])
+    return page
 
 
 @router.get("/average")
 async def get_average_score(
-    period: str = "week",  # week, month
-    db: AsyncSession = Depends(get_db),
+    period: str = "week",  # week, month, quarter, custom
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Средняя оценка за период.
+    period=custom - окно date_from - date_to (включительно).
     """
+    return await evaluation_service.get_average_score(
+        db, current_user, period, date_from, date_to
+    )
 
-    now = datetime.utcnow()
-    if period == "week":
-        start_date = now - timedelta(days=7)
-    elif period == "month":
-        start_date = now - timedelta(days=30)
-    else:
-        raise HTTPException(
-            status_code=400, detail="period должен быть 'week' или 'monrh'"
-        )
 
-    result = await db.execute(
-        select(func.avg(Evaluation.score))
-        .join(Task)
-        .where(
-            Task.assignee_id == current_user.id, Evaluation.evaluated_at >= start_date
-        )
+@router.get("/trend")
+async def get_score_trend(
+    period: str = "month",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    bucket: Literal["day", "week"] = "day",
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Динамика средней оценки по дням или неделям периода.
+    """
+    return await evaluation_service.get_score_trend(
+        db, current_user, period, date_from, date_to, bucket
+    )
+
+
+@router.get("/percentiles")
+async def get_score_percentiles(
+    period: str = "month",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Процентили оценок за период (p25, p50, p75, p90).
+    """
+    return await evaluation_service.get_score_percentiles(
+        db, current_user, period, date_from, date_to
     )
-    avg = result.scalar()
-    return {"average_score": round(avg, 2) if avg else 0.0}
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.database import get_db
 from app.core.auth import current_active_user
 from app.models.user import User
+from app.services import calendar as calendar_service
 
 router = APIRouter(tags=["frontend"])
 
@@ -13,24 +15,14 @@ templates = Jinja2Templates(directory="app/templates")
 
 @router.get("/calendar/view/day", response_class=HTMLResponse)
 async def calendar_day_page(
-    request: Request, user: User = Depends(current_active_user)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
 ):
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "http://localhost:8000/calendar/day", cookies=request.cookies
-            )
-            if response.status_code == 200:
-                data = response.json()
-
-            else:
-                data = {"date": "—", "tasks": [], "meetings": []}
-                request.session["messages"] = ["Не удалось загрузить календарь."]
-        except Exception:
-            data = {"date": "—", "tasks": [], "meetings": []}
-            request.session["messages"] = ["Ошибка подключения."]
+    data = await calendar_service.get_day(db, user)
 
     return templates.TemplateResponse(
+        request,
         "calendar/day.html", {"request": request, "user": user, "data": data}
     )
 
@@ -40,5 +32,6 @@ async def calendar_month_page(
     request: Request, user: User = Depends(current_active_user)
 ):
     return templates.TemplateResponse(
+        request,
         "calendar/month.html", {"request": request, "user": user}
     )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Request, Depends, Form
+from fastapi import APIRouter, Request, Depends, Form, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from fastapi_users import BaseUserManager
@@ -6,7 +6,7 @@ from fastapi_users.authentication.strategy import Strategy
 
 from app.core.auth import get_user_manager, auth_backend_cookie
 from app.models.user import User
-from app.utils.security import verify_password
+from app.utils.security import verify_password_async
 
 router = APIRouter(tags=["frontend"])
 
@@ -15,7 +15,9 @@ templates = Jinja2Templates(directory="app/templates")
 
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
-    return templates.TemplateResponse("auth/login.html", {"request": request})
+    return templates.TemplateResponse(
+        request, "auth/login.html", {"request": request}
+    )
 
 
 @router.post("/login", response_class=RedirectResponse)
@@ -35,7 +37,16 @@ async def login_form(
         request.session["messages"] = ["Неверный email или пароль."]
         return RedirectResponse("/login", status_code=303)
 
-    if not verify_password(password, user.hashed_password):
+    try:
+        verified = await verify_password_async(password, user.hashed_password)
+    except HTTPException as e:
+        if e.status_code != 503:
+            raise
+        # Пул хэширования переполнен - сообщение на странице вместо JSON
+        request.session["messages"] = ["Сервер перегружен, попробуйте позже"]
+        return RedirectResponse("/login", status_code=303)
+
+    if not verified:
         request.session["messages"] = ["Неверный email или пароль."]
         return RedirectResponse("/login", status_code=303)
 
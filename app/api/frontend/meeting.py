@@ -1,11 +1,16 @@
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Form, HTTPException, Request, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.database import get_db
 from app.core.auth import current_active_user
 from app.models.user import User, RoleEnum
+from app.schemas.meeting import MeetingCreate
+from app.services import meeting as meeting_service
+from app.services import team as team_service
 
 router = APIRouter(tags=["frontend"])
 
@@ -13,29 +18,31 @@ templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("/view/meetings", response_class=HTMLResponse)
-async def meetings_page(request: Request, user: User = Depends(current_active_user)):
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "http://localhost:8000/meetings/", cookies=request.cookies
-            )
-            if response.status_code == 200:
-                meetings = response.json()
-            else:
-                meetings = []
-                request.session["messages"] = ["Не удалось загрузить встречи."]
-        except Exception:
-            meetings = []
-            request.session["messages"] = ["Сервер встреч недоступен."]
+async def meetings_page(
+    request: Request,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
+):
+    page = await meeting_service.get_user_meetings(db, user, cursor)
 
     return templates.TemplateResponse(
-        "meetings/list.html", {"request": request, "user": user, "meetings": meetings}
+        request,
+        "meetings/list.html",
+        {
+            "request": request,
+            "user": user,
+            "meetings": page["items"],
+            "next_cursor": page["next_cursor"],
+        },
     )
 
 
 @router.get("/view/meetings/create", response_class=HTMLResponse)
 async def create_meeting_page(
-    request: Request, user: User = Depends(current_active_user)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
 ):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
         request.session["messages"] = [
@@ -47,21 +54,10 @@ async def create_meeting_page(
         request.session["messages"] = ["Сначала присоединитесь к команде."]
         return RedirectResponse("/view/teams/join", status_code=303)
 
-    team_members = []
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"http://localhost:8000/users/",
-                params={"skip": 0, "limit": 100},
-                cookies=request.cookies,
-            )
-            if response.status_code == 200:
-                all_users = response.json()
-                team_members = [u for u in all_users if u["team_id"] == user.team_id]
-        except Exception:
-            request.session["messages"] = ["Не удалось загрузить участников команды."]
+    team_members = await team_service.get_team_members(db, user)
 
     return templates.TemplateResponse(
+        request,
         "meetings/create.html",
         {"request": request, "user": user, "team_members": team_members},
     )
@@ -75,6 +71,7 @@ async def create_meeting_form(
     start_time: datetime = Form(...),
     end_time: datetime = Form(...),
     participant_ids: list[int] = Form(...),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(current_active_user),
 ):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
@@ -90,28 +87,25 @@ async def create_meeting_form(
         ]
         return RedirectResponse("/view/meetings/create", status_code=303)
 
-    meeting_data = {
-        "title": title,
-        "description": description,
-        "start_time": start_time.isoformat(),
-        "end_time": end_time.isoformat(),
-        "participant_ids": participant_ids,
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "http://localhost:8000/meetings/",
-                json=meeting_data,
-                cookies=request.cookies,
-            )
-            if response.status_code == 201:
-                request.session["messages"] = ["Встреча успешно назначена!"]
-                return RedirectResponse("/view/meetings", status_code=303)
-            else:
-                error = response.json().get("detail", "Неизвестная ошибка")
-                request.session["messages"] = [f"Ошибка: {error}"]
-                return RedirectResponse("/view/meetings/create", status_code=303)
-        except Exception as e:
-            request.session["messages"] = [f"Сервер недоступен: {str(e)}"]
-            return RedirectResponse("/view/meetings/create", status_code=303)
+    meeting_data = MeetingCreate(
+        title=title,
+        description=description,
+        start_time=start_time,
+        end_time=end_time,
+        participant_ids=participant_ids,
+    )
+
+    try:
+        await meeting_service.create_meeting(db, user, meeting_data)
+    except HTTPException as e:
+        if isinstance(e.detail, dict):
+            request.session["messages"] = [f"Ошибка: {e.detail['message']}"] + [
+                f"{c['email']}: {c['title']} ({c['start_time']} — {c['end_time']})"
+                for c in e.detail["conflicts"]
+            ]
+        else:
+            request.session["messages"] = [f"Ошибка: {e.detail}"]
+        return RedirectResponse("/view/meetings/create", status_code=303)
+
+    request.session["messages"] = ["Встреча успешно назначена!"]
+    return RedirectResponse("/view/meetings", status_code=303)
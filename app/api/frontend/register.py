@@ -14,7 +14,9 @@ templates = Jinja2Templates(directory="app/templates")
 
 @router.get("/register", response_class=HTMLResponse)
 async def register_page(request: Request):
-    return templates.TemplateResponse("auth/register.html", {"request": request})
+    return templates.TemplateResponse(
+        request, "auth/register.html", {"request": request}
+    )
 
 
 @router.post("/register", response_class=RedirectResponse)
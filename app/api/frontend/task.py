@@ -1,16 +1,19 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.templating import Jinja2Templates
-import httpx
-from datetime import date, datetime
+from pydantic import ValidationError
+from datetime import date, datetime, time
+from typing import Optional
 
 from app.database.database import get_db
 from app.core.auth import current_active_user
 from app.models.user import User, RoleEnum
-from app.models.task import Task, TaskStatus
+from app.models.task import TaskStatus
+from app.schemas.task import TaskCreate, TaskUpdate
 from app.core.security import get_current_user
+from app.services import task as task_service
+from app.services import team as team_service
 
 router = APIRouter(tags=["frontend"])
 
@@ -18,34 +21,36 @@ templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("/view/tasks", response_class=HTMLResponse)
-async def tasks_page(request: Request, user: User = Depends(current_active_user)):
+async def tasks_page(
+    request: Request,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
+):
     if not user.team_id:
         request.session["messages"] = ["Сначала присоединитесь к команде."]
         return RedirectResponse("/view/teams/join", status_code=303)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "http://localhost:8000/tasks/", cookies=request.cookies
-            )
-            if response.status_code == 200:
-                tasks = response.json()
-            else:
-                tasks = []
-                request.session["messages"] = ["Не удалось загрузить задачи."]
-        except Exception as ex:
-            print(ex)
-
-            tasks = []
-            request.session["messages"] = ["Сервер задач недоступен."]
+    page = await task_service.get_team_tasks(db, user, cursor)
 
     return templates.TemplateResponse(
-        "tasks/list.html", {"request": request, "user": user, "tasks": tasks}
+        request,
+        "tasks/list.html",
+        {
+            "request": request,
+            "user": user,
+            "tasks": page["items"],
+            "next_cursor": page["next_cursor"],
+        },
     )
 
 
 @router.get("/view/tasks/create", response_class=HTMLResponse)
-async def create_task_page(request: Request, user: User = Depends(current_active_user)):
+async def create_task_page(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
+):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
         request.session["messages"] = [
             "Только менеджеры и администраторы могут создавать задачи."
@@ -56,22 +61,10 @@ async def create_task_page(request: Request, user: User = Depends(current_active
         request.session["messages"] = ["Сначала присоединитесь к команде."]
         return RedirectResponse("/view/teams/join", status_code=303)
 
-    team_members = []
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"http://localhost:8000/users/",
-                params={"skip": 0, "limit": 100},
-                cookies=request.cookies,
-            )
-            if response.status_code == 200:
-                all_users = response.json()
-                team_members = [u for u in all_users if u["team_id"] == user.team_id]
-
-        except Exception:
-            request.session["messages"] = ["Не удалось загрузить участников команды."]
+    team_members = await team_service.get_team_members(db, user)
 
     return templates.TemplateResponse(
+        request,
         "tasks/create.html",
         {"request": request, "user": user, "team_members": team_members},
     )
@@ -84,6 +77,7 @@ async def create_task_form(
     description: str = Form(None),
     deadline: date = Form(None),
     assignee_id: int = Form(None),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(current_active_user),
 ):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
@@ -93,146 +87,77 @@ async def create_task_form(
         request.session["messages"] = ["Сначала присоединитесь к команде."]
         return RedirectResponse("/teams/join", status_code=303)
 
-    task_data = {
-        "title": title,
-        "description": description,
-        "deadline": deadline.isoformat() if deadline else None,
-        "assignee_id": assignee_id,
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "http://localhost:8000/tasks/", json=task_data, cookies=request.cookies
-            )
-            if response.status_code == 201:
-                request.session["messages"] = ["Задача успешно создана!"]
-                return RedirectResponse("/view/tasks", status_code=303)
-            else:
-                error = response.json().get("detail", "Неизвестная ошибка")
-                request.session["messages"] = [f"Ошибка: {error}"]
-                return RedirectResponse("/view/tasks/create", status_code=303)
-        except Exception as e:
-            request.session["messages"] = [f"Сервер недоступен: {str(e)}"]
-            return RedirectResponse("/view/tasks/create", status_code=303)
+    task_data = TaskCreate(
+        title=title,
+        description=description,
+        deadline=datetime.combine(deadline, time.min) if deadline else None,
+        assignee_id=assignee_id,
+    )
+
+    try:
+        await task_service.create_task(db, user, task_data)
+    except HTTPException as e:
+        request.session["messages"] = [f"Ошибка: {e.detail}"]
+        return RedirectResponse("/view/tasks/create", status_code=303)
+
+    request.session["messages"] = ["Задача успешно создана!"]
+    return RedirectResponse("/view/tasks", status_code=303)
 
 
 @router.get("/view/tasks/{task_id}", response_class=HTMLResponse)
 async def task_detail_page(
-    request: Request, task_id: int, user: User = Depends(current_active_user)
+    request: Request,
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
 ):
-    async with httpx.AsyncClient() as client:
-        try:
-            task_response = await client.get(
-                f"http://localhost:8000/tasks/{task_id}", cookies=request.cookies
-            )
-            if task_response.status_code != 200:
-                request.session["messages"] = ["Задача не найдена."]
-                return RedirectResponse("/view/tasks", status_code=303)
-            task = task_response.json()
-            print(task)
-
-            if isinstance(task["created_at"], str):
-                task["created_at"] = datetime.fromisoformat(
-                    task["created_at"].replace("Z", "+00:00")
-                )
-
-            if task["deadline"] and isinstance(task["deadline"], str):
-                task["deadline"] = datetime.fromisoformat(task["deadline"]).date()
-
-            if task["team_id"] != user.team_id:
-                request.session["messages"] = ["У вас нет доступа к этой задаче."]
-                return RedirectResponse("/view/tasks", status_code=303)
-
-            creator_response = await client.get(
-                f"http://localhost:8000/users/{task['creator_id']}",
-                cookies=request.cookies,
-            )
-            print(creator_response)
-            creator = (
-                creator_response.json()
-                if creator_response.status_code == 200
-                else {"email": "Unknown"}
-            )
-
-            assignee = None
-            if task["assignee_id"]:
-                assignee_response = await client.get(
-                    f"http://localhost:8000/users/{task['assignee_id']}",
-                    cookies=request.cookies,
-                )
-                assignee = (
-                    assignee_response.json()
-                    if assignee_response.status_code == 200
-                    else None
-                )
-
-        except Exception as e:
-            request.session["messages"] = [f"Ошибка загрузки данных: {str(e)}"]
-            return RedirectResponse("/view/tasks", status_code=303)
+    try:
+        task = await task_service.get_task_detail(db, user, task_id)
+    except HTTPException:
+        request.session["messages"] = ["Задача не найдена."]
+        return RedirectResponse("/view/tasks", status_code=303)
 
-    print(creator)
-    print(assignee)
     return templates.TemplateResponse(
+        request,
         "tasks/detail.html",
         {
             "request": request,
             "user": user,
             "task": task,
-            "creator": creator,
-            "assignee": assignee,
+            "creator": task.creator or {"email": "Unknown"},
+            "assignee": task.assignee,
         },
     )
 
 
 @router.get("/view/tasks/{task_id}/edit", response_class=HTMLResponse)
 async def edit_task_page(
-    request: Request, task_id: int, user: User = Depends(current_active_user)
+    request: Request,
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
 ):
-    async with httpx.AsyncClient() as client:
-        try:
-            task_response = await client.get(
-                f"http://localhost:8000/tasks/{task_id}", cookies=request.cookies
-            )
-            if task_response.status_code != 200:
-                request.session["messages"] = ["Задача не найдена."]
-                return RedirectResponse("/view/tasks", status_code=303)
-            task = task_response.json()
-
-            if isinstance(task["created_at"], str):
-                task["created_at"] = datetime.fromisoformat(
-                    task["created_at"].replace("Z", "+00:00")
-                )
-
-            if task["deadline"] and isinstance(task["deadline"], str):
-                task["deadline"] = datetime.fromisoformat(task["deadline"]).date()
-
-            if user.id != task["creator_id"] and user.role not in [
-                RoleEnum.manager,
-                RoleEnum.admin,
-            ]:
-                request.session["messages"] = [
-                    "У вас нет прав на редактирование этой задачи."
-                ]
-                return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
-
-            team_members = []
-            users_response = await client.get(
-                "http://localhost:8000/users/",
-                params={"skip": 0, "limit": 100},
-                cookies=request.cookies,
-            )
-            if users_response.status_code == 200:
-                all_users = users_response.json()
-                team_members = [u for u in all_users if u["team_id"] == user.team_id]
-
-        except Exception as e:
-            request.session["messages"] = [f"Ошибка загрузки данных: {str(e)}"]
-            return RedirectResponse("/view/tasks", status_code=303)
+    try:
+        task = await task_service.get_task_detail(db, user, task_id)
+    except HTTPException:
+        request.session["messages"] = ["Задача не найдена."]
+        return RedirectResponse("/view/tasks", status_code=303)
+
+    if not task_service.can_edit_task(user, task):
+        request.session["messages"] = [
+            "У вас нет прав на редактирование этой задачи."
+        ]
+        return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
 
     return templates.TemplateResponse(
+        request,
         "tasks/edit.html",
-        {"request": request, "user": user, "task": task, "team_members": team_members},
+        {
+            "request": request,
+            "user": user,
+            "task": task,
+            "team_members": task.team_members,
+        },
     )
 
 
@@ -245,56 +170,40 @@ async def update_task_form(
     status: str = Form(None),
     deadline: date = Form(None),
     assignee_id: int = Form(None),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(current_active_user),
 ):
-    async with httpx.AsyncClient() as client:
-        try:
-            task_response = await client.get(
-                f"http://localhost:8000/tasks/{task_id}", cookies=request.cookies
-            )
-            if task_response.status_code != 200:
-                request.session["messages"] = ["Задача не найдена."]
-                return RedirectResponse("/view/tasks", status_code=303)
-            task = task_response.json()
-
-            if user.id != task["creator_id"] and user.role not in [
-                RoleEnum.manager,
-                RoleEnum.admin,
-            ]:
-                request.session["messages"] = ["Нет прав на редактирование."]
-                return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
-
-            update_data = {}
-            if title:
-                update_data["title"] = title
-            if description is not None:
-                update_data["description"] = description
-            if status:
-                update_data["status"] = status
-            if deadline:
-                update_data["deadline"] = deadline.isoformat()
-            if assignee_id is not None:
-                update_data["assignee_id"] = assignee_id
-
-            response = await client.patch(
-                f"http://localhost:8000/tasks/{task_id}",
-                json=update_data,
-                cookies=request.cookies,
-            )
-
-            if response.status_code == 200:
-                request.session["messages"] = ["Задача успешно обновлена."]
-            else:
-                error = response.json().get("detail", "Неизвестная ошибка")
-                request.session["messages"] = [f"Ошибка при сохранении: {error}"]
-
-        except Exception as e:
-            request.session["messages"] = [f"Сервер недоступен: {str(e)}"]
+    update_data = {}
+    if title:
+        update_data["title"] = title
+    if description is not None:
+        update_data["description"] = description
+    if status:
+        update_data["status"] = status
+    if deadline:
+        update_data["deadline"] = datetime.combine(deadline, time.min)
+    if assignee_id is not None:
+        update_data["assignee_id"] = assignee_id
+
+    try:
+        await task_service.update_task(
+            db, user, task_id, TaskUpdate(**update_data)
+        )
+        request.session["messages"] = ["Задача успешно обновлена."]
+    except ValidationError as e:
+        request.session["messages"] = [
+            f"Некорректное значение поля {error['loc'][0]}: {error['msg']}"
+            for error in e.errors()
+        ]
+    except HTTPException as e:
+        if e.status_code == 404:
+            request.session["messages"] = ["Задача не найдена."]
+            return RedirectResponse("/view/tasks", status_code=303)
+        request.session["messages"] = [f"Ошибка при сохранении: {e.detail}"]
 
     return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
 
 
-
 @router.get("/view/tasks/{task_id}/start")
 async def start_task(
     task_id: int,
@@ -306,26 +215,18 @@ async def start_task(
     Статус меняется на 'in_progress'.
     Только исполнитель может начать задачу.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Задача не найдена")
-
-    # Проверка: пользователь — исполнитель
-    if task.assignee_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Вы не назначены на эту задачу")
-
-    # Проверка: задача должна быть в статусе 'open'
-    if task.status != TaskStatus.open:
-        raise HTTPException(status_code=400, detail="Задача уже в работе или выполнена")
-
-    task.status = TaskStatus.in_progress
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
+    await task_service.change_task_status(
+        db,
+        current_user,
+        task_id,
+        from_status=TaskStatus.open,
+        to_status=TaskStatus.in_progress,
+        error_detail="Задача уже в работе или выполнена",
+    )
 
     return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
 
+
 @router.get("/view/tasks/{task_id}/complete")
 async def complete_task(
     task_id: int,
@@ -337,22 +238,13 @@ async def complete_task(
     Статус меняется на 'done'.
     Только исполнитель может завершить задачу.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Задача не найдена")
-
-    # Проверка: пользователь — исполнитель
-    if task.assignee_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Вы не назначены на эту задачу")
-
-    # Проверка: задача должна быть в статусе 'in_progress'
-    if task.status != TaskStatus.in_progress:
-        raise HTTPException(status_code=400, detail="Задача не начата или уже выполнена")
-
-    task.status = TaskStatus.done
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
+    await task_service.change_task_status(
+        db,
+        current_user,
+        task_id,
+        from_status=TaskStatus.in_progress,
+        to_status=TaskStatus.done,
+        error_detail="Задача не начата или уже выполнена",
+    )
 
-    return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
\ No newline at end of file
+    return RedirectResponse(f"/view/tasks/{task_id}", status_code=303)
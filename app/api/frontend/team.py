@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Request, Depends, Form, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.database import get_db
 from app.core.auth import current_active_user
 from app.models.user import User, RoleEnum
+from app.schemas.team import TeamCreate
+from app.services import team as team_service
 
 router = APIRouter(tags=["frontend"])
 
@@ -17,6 +20,7 @@ async def join_team_page(request: Request, user: User = Depends(current_active_u
         request.session["messages"] = ["Вы уже состоите в команде."]
         return RedirectResponse("/", status_code=303)
     return templates.TemplateResponse(
+        request,
         "teams/join.html", {"request": request, "user": user}
     )
 
@@ -25,29 +29,21 @@ async def join_team_page(request: Request, user: User = Depends(current_active_u
 async def join_team_form(
     request: Request,
     team_code: str = Form(...),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(current_active_user),
 ):
     if user.team_id:
         request.session["messages"] = ["Вы уже состоите в команде."]
         return RedirectResponse("/", status_code=303)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "http://localhost:8000/team/join",
-                params={"team_code": team_code},
-                cookies=request.cookies,
-            )
-            if response.status_code == 200:
-                request.session["messages"] = ["Вы успешно присоединились к команде!"]
-                return RedirectResponse("/", status_code=303)
-            else:
-                error = response.json().get("detail", "Неизвестная ошибка")
-                request.session["messages"] = [f"Ошибка: {error}"]
-                return RedirectResponse("/view/teams/join", status_code=303)
-        except Exception as e:
-            request.session["messages"] = [f"Сервер недоступен: {str(e)}"]
-            return RedirectResponse("/view/teams/join", status_code=303)
+    try:
+        await team_service.join_team(db, user, team_code)
+    except HTTPException as e:
+        request.session["messages"] = [f"Ошибка: {e.detail}"]
+        return RedirectResponse("/view/teams/join", status_code=303)
+
+    request.session["messages"] = ["Вы успешно присоединились к команде!"]
+    return RedirectResponse("/", status_code=303)
 
 
 @router.get("/view/teams/create", response_class=HTMLResponse)
@@ -58,34 +54,28 @@ async def create_team_page(request: Request, user: User = Depends(current_active
         ]
         return RedirectResponse("/", status_code=303)
     return templates.TemplateResponse(
+        request,
         "teams/create.html", {"request": request, "user": user}
     )
 
 
 @router.post("/view/teams/create", response_class=RedirectResponse)
 async def create_team_form(
-    request: Request, name: str = Form(...), user: User = Depends(current_active_user)
+    request: Request,
+    name: str = Form(...),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(current_active_user),
 ):
     if user.role != RoleEnum.admin:
         raise HTTPException(status_code=403, detail="Доступ запрещён")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "http://localhost:8000/team/",
-                json={"name": name},
-                cookies=request.cookies,
-            )
-            if response.status_code == 201:
-                data = response.json()
-                request.session["messages"] = [
-                    f"Команда '{data['name']}' создана! Код: {data['team_code']}"
-                ]
-                return RedirectResponse("/", status_code=303)
-            else:
-                error = response.json().get("detail", "Неизвестная ошибка")
-                request.session["messages"] = [f"Ошибка: {error}"]
-                return RedirectResponse("/view/teams/create", status_code=303)
-        except Exception as e:
-            request.session["messages"] = [f"Сервер недоступен: {str(e)}"]
-            return RedirectResponse("/view/teams/create", status_code=303)
+    try:
+        team = await team_service.create_team(db, user, TeamCreate(name=name))
+    except HTTPException as e:
+        request.session["messages"] = [f"Ошибка: {e.detail}"]
+        return RedirectResponse("/view/teams/create", status_code=303)
+
+    request.session["messages"] = [
+        f"Команда '{team.name}' создана! Код: {team.team_code}"
+    ]
+    return RedirectResponse("/", status_code=303)
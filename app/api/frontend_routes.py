@@ -23,7 +23,9 @@ templates = Jinja2Templates(directory="app/templates")
 
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request, user: User = Depends(current_active_user)):
-    return templates.TemplateResponse("index.html", {"request": request, "user": user})
+    return templates.TemplateResponse(
+        request, "index.html", {"request": request, "user": user}
+    )
 
 
 router.include_router(user.router)
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends
+
+from app.core.analytics_cache import analytics_cache
+from app.core.auth import current_superuser
+from app.core.calendar_cache import calendar_cache
+from app.core.user_cache import user_cache
+from app.database.database import get_pool_status, read_engine
+from app.models.user import User
+from app.utils.security import hash_pool
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/cache/users")
+async def get_user_cache_stats(user: User = Depends(current_superuser)):
+    """
+    Счётчики кэша аутентифицированных пользователей.
+    """
+    return user_cache.stats()
+
+
+@router.get("/cache/calendar")
+async def get_calendar_cache_stats(user: User = Depends(current_superuser)):
+    """
+    Счётчики кэша лент ICS.
+    """
+    return calendar_cache.stats()
+
+
+@router.get("/cache/analytics")
+async def get_analytics_cache_stats(user: User = Depends(current_superuser)):
+    """
+    Счётчики кэша аналитики команд.
+    """
+    return analytics_cache.stats()
+
+
+@router.get("/hashing")
+async def get_hashing_stats(user: User = Depends(current_superuser)):
+    """
+    Очередь и задержка пула хэширования паролей.
+    """
+    return hash_pool.stats()
+
+
+@router.get("/db/pool")
+async def get_db_pool_stats(user: User = Depends(current_superuser)):
+    """
+    Состояние пула соединений: занятые, overflow, время ожидания.
+    """
+    status = get_pool_status()
+    if read_engine is not None:
+        status["replica"] = get_pool_status(read_engine)
+    return status
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import List
+from datetime import date
+from typing import List, Optional
 
-from app.database.database import get_db
-from app.models.user import User, RoleEnum
-from app.models.meeting import Meeting
-from app.models.meeting_participant import MeetingParticipant
-from app.schemas.meeting import MeetingCreate, MeetingOut
+from app.database.database import get_db, get_read_db
+from app.models.user import User
+from app.schemas.meeting import MeetingCreate, MeetingOut, FreeSlot
+from app.schemas.pagination import Page
 from app.core.security import get_current_user, manager_required
+from app.services import meeting as meeting_service
+from app.utils.pagination import set_link_header
 
 router = APIRouter(prefix="/meetings", tags=["meetings"])
 
@@ -23,98 +24,47 @@ async def create_meeting(
     Создание встречи с проверкой пересечения времени для всех участников.
     Только manager может создать.
     """
-    # Проверка: пользователь в команде
-    if not current_user.team_id:
-        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
-
-    # Проверка: все участники - из одной команды
-    participants = await db.execute(
-        select(User).where(User.id.in_(meeting_data.participant_ids))
-    )
-    participants = participants.scalars().all()
-
-    if len(participants) != len(meeting_data.participant_ids):
-        raise HTTPException(
-            status_code=400, detail="Один или несколько участников не найдены"
-        )
-
-    for p in participants:
-        if p.team_id != current_user.team_id:
-            raise HTTPException(
-                status_code=400, detail="Все участники должны быть в одной команде"
-            )
-
-    if meeting_data.start_time >= meeting_data.end_time:
-        raise HTTPException(
-            status_code=400,
-            detail="Время начала должно быть раньше времени окончания"
-        )
-    
-    # Проверяем, что start_time и end_time в один и тот же день
-    if meeting_data.start_time.date() != meeting_data.end_time.date():
-        raise HTTPException(
-            status_code=400,
-            detail="Встреча должна начинаться и заканчиваться в один день"
-        )
-    
-    # Проверка пересечения времени
-    for participant in participants:
-        # Ищем все встречи участника в тот же день
-        result = await db.execute(
-            select(Meeting)
-            .join(Meeting.participants)
-            .where(
-                MeetingParticipant.user_id == participant.id,
-                func.date(Meeting.start_time) == meeting_data.start_time.date(),
-                Meeting.start_time < meeting_data.end_time,
-                Meeting.end_time > meeting_data.start_time,
-            )
-        )
-        overlapping = result.scalars().all()
-
-        if overlapping:
-            raise HTTPException(
-                status_code=400,
-                detail=f"У участника {participant.email} есть пересекающаяся встреча",
-            )
-
-    # Создаем встречу
-    meeting = Meeting(
-        title=meeting_data.title,
-        description=meeting_data.description,
-        start_time=meeting_data.start_time,
-        end_time=meeting_data.end_time,
-        team_id=current_user.team_id,
-    )
-
-    db.add(meeting)
-    await db.flush()  # Чтобы получить ID
-
-    # Добавляем участников
-
-    for p in participants:
-        participant_link = MeetingParticipant(meeting_id=meeting.id, user_id=p.id)
-        db.add(participant_link)
-
-    await db.commit()
-    await db.refresh(meeting)
-    return meeting
+    return await meeting_service.create_meeting(db, current_user, meeting_data)
 
 
-@router.get("/", response_model=List[MeetingOut])
+@router.get("/", response_model=Page[MeetingOut])
 async def get_meetings(
-    db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Получить встречи, в которых учавствует пользователь (по времени начала).
+    Пагинация: cursor, limit
+    """
+    page = await meeting_service.get_user_meetings(
+        db, current_user, cursor, limit, with_total
+    )
+    set_link_header(request, response, page["next_cursor"])
+    return page
+
+
+@router.get("/availability", response_model=List[FreeSlot])
+async def get_availability(
+    participant_ids: List[int] = Query(...),
+    date_from: date = Query(...),
+    date_to: date = Query(...),
+    duration: int = Query(..., ge=1, le=24 * 60),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
-    Получить все встречи, в которых учавствует пользователь.
+    Ближайшие общие свободные слоты участников длиной duration минут
+    в рабочее время (WORK_DAY_START - WORK_DAY_END, рабочие дни).
     """
-    result = await db.execute(
-        select(Meeting)
-        .join(Meeting.participants)
-        .where(MeetingParticipant.user_id == current_user.id)
+    return await meeting_service.find_free_slots(
+        db, current_user, participant_ids, date_from, date_to, duration, limit
     )
-    meetings = result.scalars().all()
-    return meetings
 
 
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -126,18 +76,5 @@ async def delete_meting(
     """
     Удалить встречу. Только создатель или admin может удалить.
     """
-
-    result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-
-    meeting = result.scalars().first()
-
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Встреча не найдена")
-
-    # Проверка прав
-    if meeting.team.creator_id != current_user.id and current_user.role != RoleEnum.admin:
-        raise HTTPException(status_code=403, detail="Нет парв на удаление")
-
-    await db.delete(meeting)
-    await db.commit()
+    await meeting_service.delete_meeting(db, current_user, meeting_id)
     return
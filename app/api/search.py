@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.database.database import get_read_db
+from app.models.user import User
+from app.schemas.pagination import Page
+from app.schemas.search import SearchHit
+from app.core.security import get_current_user
+from app.services import search as search_service
+from app.utils.pagination import set_link_header
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/", response_model=Page[SearchHit])
+async def search(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Полнотекстовый поиск по задачам (название, описание) и комментариям
+    своей команды. Слова запроса ищутся как префиксы, нужны все.
+    Результаты - по релевантности, совпадения выделены <mark>...</mark>.
+    Пагинация: cursor (next_cursor из предыдущего ответа), limit.
+    """
+    page = await search_service.search(db, current_user, q, cursor, limit)
+    set_link_header(request, response, page["next_cursor"])
+    return page
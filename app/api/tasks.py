@@ -1,12 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-
-from app.database.database import get_db
-from app.models.task import Task, TaskStatus
-from app.models.user import User, RoleEnum
-from app.schemas.task import TaskCreate, TaskUpdate, TaskOut
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from app.database.database import get_db, get_read_db
+from app.models.task import TaskStatus
+from app.models.user import User
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskUpdate,
+    TaskOut,
+    TaskDetailOut,
+    TaskFilter,
+)
+from app.schemas.pagination import Page
 from app.core.security import manager_required, get_current_user
+from app.services import task as task_service
+from app.utils.pagination import set_link_header
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -21,69 +34,104 @@ async def created_task(
     Толкько manager может создавать задачи в своей команде.
     Можно назначить испольнителя.
     """
-    # Проверка: команда сущуствует и пользователь в ней
-    if not current_user.team_id:
-        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
-
-    # Проверка исполнителя (если указан)
-    if task_data.assignee_id:
-        result = await db.execute(
-            select(User).where(
-                User.id == task_data.assignee_id, User.team_id == current_user.team_id
-            )
-        )
-        assignee = result.scalars().first()
-        if not assignee:
-            raise HTTPException(
-                status_code=400, detail="Исполнитель не найден или не в вашей команде"
-            )
-
-    task = Task(
-        **task_data.model_dump(exclude_unset=True),
-        creator_id=current_user.id,
-        team_id=current_user.team_id,
-        status=TaskStatus.open
-    )
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
-    return task
+    return await task_service.create_task(db, current_user, task_data)
 
 
-@router.get("/", response_model=list[TaskOut])
-async def get_tasks(
-    skip: int = 0,
-    limit: int = 100,
+@router.post("/bulk", response_model=TaskBulkResult)
+async def create_tasks_bulk(
+    bulk_data: TaskBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(manager_required),
+):
+    """
+    Создание нескольких задач одним запросом (только manager).
+    mode=atomic - при любой ошибке ничего не создаётся (400 со списком ошибок),
+    mode=best_effort - создаются корректные, ошибки - в результатах по позициям.
+    """
+    return await task_service.create_tasks_bulk(db, current_user, bulk_data)
+
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+async def update_tasks_bulk(
+    bulk_data: TaskBulkUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+):
+    """
+    Изменение нескольких задач одним запросом: items - id и изменяемые поля.
+    Режимы mode - как у POST /tasks/bulk.
+    """
+    return await task_service.update_tasks_bulk(db, current_user, bulk_data)
+
+
+@router.get("/", response_model=Page[TaskOut])
+async def get_tasks(
+    request: Request,
+    response: Response,
+    status: Optional[List[TaskStatus]] = Query(None),
+    assignee_id: Optional[int] = None,
+    creator_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    overdue: bool = False,
+    mine: bool = False,
+    sort: Literal[
+        "id", "-id", "created_at", "-created_at", "deadline", "-deadline"
+    ] = "id",
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Получить задачи своей команды.
+    Фильтры: status (можно несколько), assignee_id, creator_id,
+    deadline_from/deadline_to, created_from/created_to, overdue, mine.
+    Сортировка: sort (id, created_at, deadline; "-" - по убыванию).
+    Пагинация: cursor (next_cursor из предыдущего ответа или заголовок Link), limit.
+    with_total=true - добавить оценку общего числа задач.
     """
-    result = await db.execute(
-        select(Task)
-        .where(Task.team_id == current_user.team_id)
-        .offset(skip)
-        .limit(limit)
+    filters = TaskFilter(
+        status=status,
+        assignee_id=assignee_id,
+        creator_id=creator_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        created_from=created_from,
+        created_to=created_to,
+        overdue=overdue,
+        mine=mine,
+    )
+    page = await task_service.get_team_tasks(
+        db, current_user, cursor, limit, with_total, filters, sort
     )
-    tasks = result.scalars().all()
-    return tasks
+    set_link_header(request, response, page["next_cursor"])
+    return page
+
+
+@router.get("/{task_id}/detail", response_model=TaskDetailOut)
+async def get_task_detail(
+    task_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Задача вместе с создателем, исполнителем, комментариями, оценками
+    и составом команды (id, имя, email) для выбора исполнителя.
+    """
+    return await task_service.get_task_detail(db, current_user, task_id)
 
 
 @router.get("/{task_id}", response_model=TaskOut)
 async def get_tasks(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task).where(Task.id == task_id, Task.team_id == current_user.team_id)
-    )
-
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Задача не найдена")
-    return task
+    return await task_service.get_team_task(db, current_user, task_id)
 
 
 @router.patch("/{task_id}", response_model=TaskOut)
@@ -93,27 +141,7 @@ async def update_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task).where(Task.id == task_id, Task.team_id == current_user.team_id)
-    )
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Задача не найдена")
-
-    # Проверка: автор или менеджер
-    if current_user.id != task.creator_id and not current_user.role in [
-        RoleEnum.manager,
-        RoleEnum.admin,
-    ]:
-        raise HTTPException(status_code=403, detail="Нет прав на редактивроение")
-
-    for key, value in task_data.dict(exclude_unset=True).items():
-        setattr(task, key, value)
-
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
-    return task
+    return await task_service.update_task(db, current_user, task_id, task_data)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -122,16 +150,5 @@ async def delete_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task).where(Task.id == task_id, Task.team_id == current_user.team_id)
-    )
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Задача не найдена")
-
-    if current_user.id != task.creator_id and current_user.role != RoleEnum.manager:
-        raise HTTPException(status_code=403, detail="Нет прав на удаление")
-
-    await db.delete(task)
-    await db.commit()
+    await task_service.delete_task(db, current_user, task_id)
     return
@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from uuid import uuid4
 
-from app.database.database import get_db
-from app.models.team import Team
+from app.database.database import get_db, get_read_db
 from app.models.user import User
-from app.schemas.team import TeamCreate, TeamOut
-from app.core.security import admin_required, get_current_user
+from app.schemas.team import TeamCreate, TeamOut, TeamSummary
+from app.core.security import admin_required, get_current_user, manager_required
+from app.services import analytics as analytics_service
+from app.services import export as export_service
+from app.services import team as team_service
 
 router = APIRouter(prefix="/team", tags=["teams"])
 
@@ -22,20 +25,7 @@ async def create_team(
     Только admin может создать конмаду.
     Генерируется уникальный team_code.
     """
-
-    # Поверка: имя команды уникально
-    result = await db.execute(select(Team).where(Team.name == team_data.name))
-    if result.scalars().first():
-        raise HTTPException(
-            status_code=400, detail="Команда с таким имененм уже существует"
-        )
-
-    team_code = str(uuid4()).split("-")[0]  # уникальный код
-    team = Team(name=team_data.name, team_code=team_code, creator_id=user.id)
-    db.add(team)
-    await db.commit()
-    await db.refresh(team)
-    return team
+    return await team_service.create_team(db, user, team_data)
 
 
 @router.post("/join", response_model=TeamOut)
@@ -48,22 +38,58 @@ async def join_team_by_code(
     Присоединение пользователя к команде по коду.
     Нельзя менять команду, если уже в составе.
     """
+    return await team_service.join_team(db, current_user, team_code)
 
-    if current_user.team_id is not None:
-        raise HTTPException(status_code=400, detail="Вы уже состоите в команде")
 
-    result = await db.execute(select(Team).where(Team.team_code == team_code))
-    team = result.scalars().first()
+@router.get("/{team_id}/summary", response_model=TeamSummary)
+async def get_team_summary(
+    team_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Число участников и задач команды по статусам для главной и списков.
+    Берётся из счётчиков команды, без подсчёта строк.
+    """
+    return await team_service.get_team_summary(db, current_user, team_id)
 
-    if not team:
-        raise HTTPException(status_code=404, detail="Команда с таким кодом не найдена")
-    result = await db.execute(select(User).where(User.id == current_user.id))
-    user = result.scalar_one()
 
-    user.team_id = team.id
-    db.add(user)
+@router.get("/{team_id}/analytics")
+async def get_team_analytics(
+    team_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(manager_required),
+):
+    """
+    Аналитика команды для manager: средние оценки и распределение по
+    участникам, доля задач в срок, просроченные, динамика со скользящим
+    средним. Кэшируется до изменения задач или оценок команды.
+    """
+    return await analytics_service.get_team_analytics(db, current_user, team_id)
 
-    await db.commit()
-    await db.refresh(user)
 
-    return team
+@router.get("/{team_id}/export")
+async def export_team(
+    team_id: int,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    entities: str = ",".join(export_service.EXPORT_ENTITIES),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(manager_required),
+):
+    """
+    Выгрузка задач, встреч и оценок команды для отчётов (только manager).
+    entities - через запятую: tasks, meetings, evaluations.
+    Ответ отдаётся потоком по мере чтения из БД: следующая пачка строк
+    читается, только когда клиент принял предыдущую.
+    """
+    names = export_service.parse_entities(entities)
+    await export_service.check_export_access(db, current_user, team_id)
+    return StreamingResponse(
+        export_service.export_team(db, team_id, names, export_format),
+        media_type=export_service.EXPORT_FORMATS[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="team-{team_id}.{export_format}"'
+            )
+        },
+    )
@@ -1,43 +1,45 @@
 # app/api/users.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import Optional
 
-from app.database.database import get_db
+from app.database.database import get_read_db
 from app.models.user import User
 from app.schemas.user import UserRead
+from app.schemas.pagination import Page
 from app.core.security import get_current_user
+from app.services import team as team_service
+from app.utils.pagination import set_link_header
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("/", response_model=List[UserRead])
+@router.get("/", response_model=Page[UserRead])
 async def get_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Получить список пользователей своей команды.
-    Пагинация: skip, limit
+    Пагинация: cursor, limit
     """
-    if not current_user.team_id:
-        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
-
-    result = await db.execute(
-        select(User).where(User.team_id == current_user.team_id)
-        .offset(skip).limit(limit)
+    page = await team_service.get_team_members_page(
+        db, current_user, cursor, limit, with_total
     )
-    users = result.scalars().all()
-    return users
+    set_link_header(request, response, page["next_cursor"])
+    return page
 
 
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
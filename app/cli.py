@@ -7,7 +7,15 @@ from typing import Optional
 
 from app.database.database import get_db
 from app.models.user import User
-from app.utils.security import get_password_hash
+from app.services.archive import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, run_archive
+from app.services.evaluation import check_score_rollups, rebuild_score_rollups
+from app.services.team import reconcile_team_counters
+from app.services.user_import import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_HASH_WORKERS,
+    import_users,
+)
+from app.utils.security import get_password_hash_async
 
 
 async def create_superuser(email: str, password: str, full_name: Optional[str] = None):
@@ -27,7 +35,7 @@ async def create_superuser(email: str, password: str, full_name: Optional[str] =
         # Создаём суперпользователя
         superuser = User(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=await get_password_hash_async(password),
             full_name=full_name or "ADMIN",
             is_active=True,
             is_superuser=True,
@@ -42,6 +50,85 @@ async def create_superuser(email: str, password: str, full_name: Optional[str] =
         break
 
 
+async def rebuild_scores():
+    async for db in get_db():
+        rows = await rebuild_score_rollups(db)
+        await db.commit()
+        print(f"✅ Сводка оценок пересчитана: {rows} строк.")
+        break
+
+
+async def check_scores() -> bool:
+    async for db in get_db():
+        mismatches = await check_score_rollups(db)
+        for item in mismatches:
+            print(
+                f"❌ исполнитель {item['assignee_id']}, {item['day']}: "
+                f"ожидалось {item['expected']}, в сводке {item['actual']}"
+            )
+        if not mismatches:
+            print("✅ Сводка оценок совпадает с оценками.")
+        return not mismatches
+
+
+async def reconcile_teams():
+    async for db in get_db():
+        drift = await reconcile_team_counters(db)
+        await db.commit()
+        for item in drift:
+            print(
+                f"❌ команда {item['team_id']}: было {item['actual']}, "
+                f"исправлено на {item['expected']}"
+            )
+        if not drift:
+            print("✅ Счётчики команд совпадают с данными.")
+        break
+
+
+def print_archive_progress(stats: dict):
+    print(f"… задач {stats['tasks']}, встреч {stats['meetings']}")
+
+
+async def archive(days: int, batch_size: int) -> bool:
+    async for db in get_db():
+        try:
+            stats = await run_archive(db, days, batch_size, print_archive_progress)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return False
+        print(
+            f"✅ В архив перенесено: задач {stats['tasks']} "
+            f"(комментариев {stats['comments']}, оценок {stats['evaluations']}), "
+            f"встреч {stats['meetings']}; {stats['seconds']:.1f} с"
+        )
+        return True
+
+
+def print_import_progress(progress: dict):
+    print(
+        f"… {progress['done']}/{progress['total']}, "
+        f"создано {progress['created']}, {progress['rate']:.0f} польз./с"
+    )
+
+
+async def run_import(
+    path: str, file_format: Optional[str], batch_size: int, workers: int
+):
+    async for db in get_db():
+        stats = await import_users(
+            db, path, file_format, batch_size, workers, print_import_progress
+        )
+        for error in stats["errors"]:
+            print(f"❌ строка {error['line']}: {error['error']}")
+        print(
+            f"✅ Импорт завершён: создано {stats['created']}, "
+            f"уже были {stats['existing']}, с ошибками {stats['invalid']}, "
+            f"команд {stats['teams']}; {stats['seconds']:.1f} с, "
+            f"{stats['rate']:.0f} польз./с"
+        )
+        break
+
+
 def main():
     parser = argparse.ArgumentParser(description="Утилиты командной строки для приложения")
     subparsers = parser.add_subparsers(dest="command", help="Доступные команды")
@@ -51,6 +138,49 @@ def main():
     create_parser.add_argument("--email", type=str, help="Email пользователя")
     create_parser.add_argument("--full-name", type=str, help="Полное имя (опционально)")
 
+    # Команды: сводка оценок (evaluation_daily_scores)
+    subparsers.add_parser(
+        "rebuild-score-rollups", help="Пересчитать сводку оценок по дням"
+    )
+    subparsers.add_parser(
+        "check-score-rollups", help="Сверить сводку оценок с оценками"
+    )
+
+    # Команда: сверка счётчиков команд (участники, задачи по статусам)
+    subparsers.add_parser(
+        "reconcile-team-counters", help="Сверить и исправить счётчики команд"
+    )
+
+    # Команда: archive (старые выполненные задачи и прошедшие встречи)
+    archive_parser = subparsers.add_parser(
+        "archive", help="Перенести старые выполненные задачи и встречи в архив"
+    )
+    archive_parser.add_argument(
+        "--days",
+        type=int,
+        default=ARCHIVE_AFTER_DAYS,
+        help="Старше скольких дней (не меньше ARCHIVE_AFTER_DAYS)",
+    )
+    archive_parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+
+    # Команда: import (пользователи и команды из CSV/JSONL)
+    import_parser = subparsers.add_parser(
+        "import", help="Импортировать пользователей и команды из CSV/JSONL"
+    )
+    import_parser.add_argument("path", type=str, help="Путь к файлу")
+    import_parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl"],
+        help="Формат (по умолчанию - по расширению)",
+    )
+    import_parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        default=IMPORT_HASH_WORKERS,
+        help="Процессы для хэширования",
+    )
+
     args = parser.parse_args()
 
     if args.command == "createsuperuser":
@@ -69,6 +199,18 @@ def main():
             return
 
         asyncio.run(create_superuser(email, password, args.full_name))
+    elif args.command == "rebuild-score-rollups":
+        asyncio.run(rebuild_scores())
+    elif args.command == "check-score-rollups":
+        if not asyncio.run(check_scores()):
+            raise SystemExit(1)
+    elif args.command == "reconcile-team-counters":
+        asyncio.run(reconcile_teams())
+    elif args.command == "archive":
+        if not asyncio.run(archive(args.days, args.batch_size)):
+            raise SystemExit(1)
+    elif args.command == "import":
+        asyncio.run(run_import(args.path, args.format, args.batch_size, args.workers))
     else:
         parser.print_help()
 
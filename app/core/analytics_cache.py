@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from decouple import config
+
+ANALYTICS_CACHE_SIZE = int(config("ANALYTICS_CACHE_SIZE", 1000))
+ANALYTICS_CACHE_TTL = int(config("ANALYTICS_CACHE_TTL", 300))
+
+
+class TeamAnalyticsCache:
+    """
+    LRU-кэш готовой аналитики команды. Ключ - id команды. Сбрасывается
+    при изменении задач и оценок команды; TTL ограничивает устаревание
+    в других воркерах, где сброса не было.
+    """
+
+    def __init__(
+        self, maxsize: int = ANALYTICS_CACHE_SIZE, ttl: int = ANALYTICS_CACHE_TTL
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, team_id: int) -> Optional[dict]:
+        entry = self._data.get(team_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[team_id]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(team_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, team_id: int, analytics: dict) -> None:
+        self._data[team_id] = (time.monotonic() + self.ttl, analytics)
+        self._data.move_to_end(team_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, team_id: int) -> None:
+        self._data.pop(team_id, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+analytics_cache = TeamAnalyticsCache()
@@ -8,26 +8,46 @@ from fastapi_users.authentication import (
 )
 from fastapi_users.db import SQLAlchemyUserDatabase
 from fastapi_users.manager import BaseUserManager
-from fastapi_users.exceptions import InvalidID
+from fastapi_users.exceptions import InvalidID, UserAlreadyExists, UserNotExists
 from decouple import config
-from typing import AsyncGenerator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Optional
 
 from app.models.user import User
-from app.database.database import AsyncSessionLocal
+from app.schemas.user import UserCreate
+from app.database.database import get_db
+from app.utils.security import hash_pool
+from app.core.user_cache import user_cache
 
 SECRET = config("SECRET_KEY")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(config("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
 
-# Асинхронная сессия
-async def get_async_session() -> AsyncGenerator[AsyncSessionLocal, None]:
-    async with AsyncSessionLocal() as session:
-        yield session
+class CachedUserDatabase(SQLAlchemyUserDatabase):
+    """
+    get() по id сначала смотрит в user_cache. При попадании объект User
+    собирается из кэша и присоединяется к сессии без запроса к БД.
+    """
 
+    async def get(self, id) -> Optional[User]:
+        fields = user_cache.get(id)
+        if fields is not None:
+            user = User(**fields)
+            make_transient_to_detached(user)
+            return await self.session.merge(user, load=False)
 
-# Получение пользователя из БД
-async def get_user_db(session: AsyncSessionLocal = Depends(get_async_session)):
-    yield SQLAlchemyUserDatabase(session, User)
+        user = await super().get(id)
+        if user:
+            user_cache.set(user)
+        return user
+
+
+# Получение пользователя из БД.
+# Та же сессия get_db, что и у обработчиков: FastAPI кэширует зависимость
+# в пределах запроса, поэтому на запрос берётся одно соединение из пула.
+async def get_user_db(session: AsyncSession = Depends(get_db)):
+    yield CachedUserDatabase(session, User)
 
 
 # User Manager
@@ -44,8 +64,12 @@ class UserManager(BaseUserManager[User, int]):
         update_dict: dict,
         request: Optional[Request] = None,
     ):
+        user_cache.invalidate(user.id)
         print(f"Пользователь {user.id} обновлён.")
 
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        user_cache.invalidate(user.id)
+
     async def on_after_login(
         self,
         user: User,
@@ -59,6 +83,64 @@ class UserManager(BaseUserManager[User, int]):
     ):
         print(f"Пользователь {user.id} забыл пароль. Токен: {token}")
 
+    # Хэширование паролей - в пуле hash_pool, а не в event loop
+
+    async def authenticate(self, credentials) -> Optional[User]:
+        try:
+            user = await self.get_by_email(credentials.username)
+        except UserNotExists:
+            # Хэшируем в любом случае - защита от timing-атаки
+            await hash_pool.run(self.password_helper.hash, credentials.password)
+            return None
+
+        verified, updated_password_hash = await hash_pool.run(
+            self.password_helper.verify_and_update,
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
+        return user
+
+    async def create(
+        self,
+        user_create: UserCreate,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await hash_pool.run(
+            self.password_helper.hash, password
+        )
+
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def _update(self, user: User, update_dict: dict) -> User:
+        password = update_dict.pop("password", None)
+        if password is not None:
+            await self.validate_password(password, user)
+            update_dict["hashed_password"] = await hash_pool.run(
+                self.password_helper.hash, password
+            )
+        return await super()._update(user, update_dict)
+
     def parse_id(self, value: str) -> int:
         try:
             return int(value)
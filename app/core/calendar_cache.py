@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Optional
+
+from decouple import config
+
+CALENDAR_CACHE_SIZE = int(config("CALENDAR_CACHE_SIZE", 10000))
+
+
+class CalendarFeedCache:
+    """
+    LRU-кэш готовых ICS-лент: по одной записи на пользователя.
+    Запись годится, пока совпадает ключ (версия календаря и день окна),
+    поэтому сбрасывать её при изменениях не нужно - новая версия
+    просто не найдёт старую запись.
+    """
+
+    def __init__(self, maxsize: int = CALENDAR_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, key: str) -> Optional[str]:
+        entry = self._data.get(user_id)
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user_id: int, key: str, body: str) -> None:
+        self._data[user_id] = (key, body)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+calendar_cache = CalendarFeedCache()
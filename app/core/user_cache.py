@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from decouple import config
+
+from app.models.user import User
+
+USER_CACHE_SIZE = int(config("USER_CACHE_SIZE", 10000))
+USER_CACHE_TTL = int(config("USER_CACHE_TTL", 60))
+
+# Поля пользователя, нужные для авторизации и шаблонов.
+# hashed_password в кэш не попадает.
+CACHED_FIELDS = (
+    "id",
+    "email",
+    "full_name",
+    "is_active",
+    "is_superuser",
+    "role",
+    "team_id",
+)
+
+
+class UserCache:
+    """
+    Ограниченный LRU-кэш с TTL для полей аутентифицированного пользователя.
+    Ключ - id пользователя. Сбрасывается при изменении пользователя
+    (UserManager, вступление в команду, правки в админке).
+    """
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: int = USER_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[dict]:
+        entry = self._data.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[user_id]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user: User) -> dict:
+        fields = {name: getattr(user, name) for name in CACHED_FIELDS}
+        self._data[user.id] = (time.monotonic() + self.ttl, fields)
+        self._data.move_to_end(user.id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return fields
+
+    def invalidate(self, user_id: int) -> None:
+        self._data.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+user_cache = UserCache()
@@ -1,5 +1,12 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from decouple import config
 
 
@@ -12,23 +19,218 @@ TESTING = str_to_bool(config("TESTING", default="false"))
 
 if TESTING:
     DATABASE_URL = config("DATABASE_TEST_URL")
+    DATABASE_REPLICA_URL = config("DATABASE_TEST_REPLICA_URL", default="")
 else:
     DATABASE_URL = config("DATABASE_URL")
+    DATABASE_REPLICA_URL = config("DATABASE_REPLICA_URL", default="")
+
+# Сколько секунд после изменяющего запроса читать из primary
+REPLICA_STICKY_SECONDS = int(config("REPLICA_STICKY_SECONDS", 5))
+# Сколько клиентов с недавними записями помнить (см. sticky_clients)
+REPLICA_STICKY_CLIENTS = int(config("REPLICA_STICKY_CLIENTS", 10000))
+
+
+# Настройки пула соединений (для PostgreSQL)
+DB_POOL_SIZE = int(config("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(config("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(config("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(config("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = str_to_bool(config("DB_POOL_PRE_PING", default="true"))
+DB_POOL_PREWARM = int(config("DB_POOL_PREWARM", 0))
+# Кэш подготовленных выражений asyncpg на соединение (0 - выключен,
+# нужно при pgbouncer в режиме transaction)
+DB_STATEMENT_CACHE_SIZE = int(config("DB_STATEMENT_CACHE_SIZE", 100))
+
+
+class PoolWaitStats:
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool, который замеряет время получения соединения
+    (ожидание свободного соединения или подключение нового).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
 
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - start)
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+def engine_options(url: str) -> dict:
+    # SQLite (тесты) работает со своим пулом, настройки пула к нему не относятся
+    if url.startswith("sqlite"):
+        return {}
+
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if "+asyncpg" in url:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+engine = create_async_engine(
+    DATABASE_URL, echo=False, future=True, **engine_options(DATABASE_URL)
+)
 
 
 AsyncSessionLocal = async_sessionmaker(
-    bind=engine, 
-    class_=AsyncSession, 
+    bind=engine,
+    class_=AsyncSession,
     expire_on_commit=False
 )
 
 
+# Реплика для чтения (если не задана - все запросы идут в primary)
+if DATABASE_REPLICA_URL:
+    read_engine = create_async_engine(
+        DATABASE_REPLICA_URL,
+        echo=False,
+        future=True,
+        **engine_options(DATABASE_REPLICA_URL),
+    )
+    ReadSessionLocal = async_sessionmaker(
+        bind=read_engine, class_=AsyncSession, expire_on_commit=False
+    )
+else:
+    read_engine = None
+    ReadSessionLocal = None
+
+
 Base = declarative_base()
 
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+PRIMARY_STICKY_KEY = "primary_until"
+
+# Отметки о записи по клиенту: хэш учётных данных (Bearer-токен или кука
+# auth) -> время, до которого читать из primary. API-клиенты куку сессии
+# не возвращают, а токен присылают с каждым запросом. Хранится в памяти
+# воркера, поэтому кука сессии остаётся: браузер попадает в primary и
+# на другом воркере.
+sticky_clients: OrderedDict = OrderedDict()
+
+
+def client_key(request: Request) -> Optional[str]:
+    credentials = request.headers.get("authorization") or request.cookies.get("auth")
+    if not credentials:
+        return None
+    return hashlib.sha256(credentials.encode()).hexdigest()
+
+
+def stick_to_primary(request: Request):
+    """
+    Помечает клиента: ближайшие REPLICA_STICKY_SECONDS чтения идут в primary,
+    чтобы он увидел собственные изменения (реплика может отставать).
+    """
+    until = time.time() + REPLICA_STICKY_SECONDS
+    if "session" in request.scope:
+        request.session[PRIMARY_STICKY_KEY] = until
+    key = client_key(request)
+    if key is not None:
+        sticky_clients[key] = until
+        sticky_clients.move_to_end(key)
+        while len(sticky_clients) > REPLICA_STICKY_CLIENTS:
+            sticky_clients.popitem(last=False)
+
+
+def reads_from_primary(request: Request) -> bool:
+    now = time.time()
+    if "session" in request.scope and request.session.get(PRIMARY_STICKY_KEY, 0) > now:
+        return True
+    key = client_key(request)
+    return key is not None and sticky_clients.get(key, 0) > now
+
+
+async def get_read_db(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Сессия для read-only обработчиков: реплика, если она настроена и клиент
+    недавно ничего не менял. Иначе - та же сессия, что и get_db.
+    """
+    if ReadSessionLocal is None or reads_from_primary(request):
+        yield db
+        return
+
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+def get_pool_status(target_engine=engine) -> dict:
+    pool = target_engine.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(0, pool.overflow()),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            }
+        )
+
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status["wait"] = {
+            "count": wait_stats.count,
+            "avg_ms": (
+                round(wait_stats.total_seconds / wait_stats.count * 1000, 2)
+                if wait_stats.count
+                else 0.0
+            ),
+            "max_ms": round(wait_stats.max_seconds * 1000, 2),
+        }
+    return status
+
+
+async def prewarm_pool(count: int = DB_POOL_PREWARM, target_engine=engine):
+    """
+    Открывает count соединений заранее, чтобы первые запросы после деплоя
+    не ждали подключения к БД.
+    """
+    pool = target_engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        count = min(count, pool.size())
+    count = max(count, 1)
+
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await target_engine.connect())
+    finally:
+        for conn in connections:
+            await conn.close()
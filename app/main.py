@@ -1,5 +1,5 @@
 from app.admin import setup_admin
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -8,16 +8,19 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from decouple import config
 
-from app.database.database import engine
+from app.database.database import engine, prewarm_pool, stick_to_primary
 from app.api import (
     auth,
     frontend_routes,
     users,
     teams,
     tasks,
+    comments,
     meetings,
     evaluations,
     calendar,
+    search,
+    internal,
 )
 
 SECRET = config("SECRET_KEY")
@@ -28,8 +31,8 @@ DEBUG = config("DEBUG")
 # Жизненный цикл приложения
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    async with engine.begin() as conn:
-        pass
+    # Открываем соединения заранее (DB_POOL_PREWARM)
+    await prewarm_pool()
     yield
     await engine.dispose()
 
@@ -42,6 +45,18 @@ app = FastAPI(
     debug=DEBUG,
 )
 
+
+# Чтение своих записей: после успешного изменяющего запроса клиент
+# какое-то время читает из primary, а не из реплики.
+# Объявлен до SessionMiddleware, чтобы изменения сессии попали в куку.
+@app.middleware("http")
+async def stick_to_primary_after_write(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        stick_to_primary(request)
+    return response
+
+
 # Разрешаем CORS (на всякий случай, если будет фронтенд)
 app.add_middleware(
     CORSMiddleware,
@@ -79,9 +94,12 @@ app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(teams.router)
 app.include_router(tasks.router)
+app.include_router(comments.router)
 app.include_router(meetings.router)
 app.include_router(evaluations.router)
 app.include_router(calendar.router)
+app.include_router(search.router)
+app.include_router(internal.router)
 app.include_router(frontend_routes.router)
 
 
@@ -5,3 +5,30 @@ from app.models.comment import Comment
 from app.models.meeting import Meeting
 from app.models.meeting_participant import MeetingParticipant
 from app.models.evaluation import Evaluation
+from app.models.evaluation_score import EvaluationDailyScore
+from app.models.search import SEARCH_CONFIG
+from app.models.archive import (
+    CommentArchive,
+    EvaluationArchive,
+    MeetingArchive,
+    MeetingParticipantArchive,
+    TaskArchive,
+)
+
+# Импорт регистрирует все модели в Base.metadata (Alembic, create_all)
+__all__ = [
+    "User",
+    "Team",
+    "Task",
+    "Comment",
+    "Meeting",
+    "MeetingParticipant",
+    "Evaluation",
+    "EvaluationDailyScore",
+    "SEARCH_CONFIG",
+    "CommentArchive",
+    "EvaluationArchive",
+    "MeetingArchive",
+    "MeetingParticipantArchive",
+    "TaskArchive",
+]
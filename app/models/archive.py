@@ -0,0 +1,97 @@
+# Архив: выполненные задачи (с комментариями и оценками) и прошедшие встречи
+# (с участниками), старше ARCHIVE_AFTER_DAYS. Строки переносятся с теми же id
+# (app/services/archive.py), горячие таблицы и их индексы не растут.
+#
+# Архив не меняется, поэтому связей и каскадов нет - только индексы под
+# чтения, которые объединяют горячие и архивные строки.
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    Enum as SQLEnum,
+)
+
+from app.database.database import Base
+from app.models.task import TaskStatus
+
+
+class TaskArchive(Base):
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        # Календарь и оценки исполнителя
+        Index("ix_tasks_archive_assignee_id_deadline", "assignee_id", "deadline"),
+        # Выгрузка и счётчики команды
+        Index("ix_tasks_archive_team_id_id", "team_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(SQLEnum(TaskStatus))
+    deadline = Column(DateTime, nullable=True)
+    created_at = Column(DateTime)
+    completed_at = Column(DateTime, nullable=True)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    creator_id = Column(Integer, ForeignKey("users.id"))
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    team_id = Column(Integer, ForeignKey("teams.id"))
+    archived_at = Column(DateTime, server_default=func.now())
+
+
+class CommentArchive(Base):
+    __tablename__ = "comments_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    task_id = Column(Integer, ForeignKey("tasks_archive.id"), index=True)
+
+
+class EvaluationArchive(Base):
+    __tablename__ = "evaluations_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    task_id = Column(Integer, ForeignKey("tasks_archive.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    score = Column(Integer, nullable=False)
+    evaluated_at = Column(DateTime)
+
+
+class MeetingArchive(Base):
+    __tablename__ = "meetings_archive"
+    __table_args__ = (Index("ix_meetings_archive_team_id_id", "team_id", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"))
+    archived_at = Column(DateTime, server_default=func.now())
+
+
+class MeetingParticipantArchive(Base):
+    __tablename__ = "meeting_participants_archive"
+    __table_args__ = (
+        # Календарь пользователя за период
+        Index(
+            "ix_meeting_participants_archive_user_id_start_time",
+            "user_id",
+            "start_time",
+            "end_time",
+        ),
+        Index("ix_meeting_participants_archive_meeting_id", "meeting_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    meeting_id = Column(Integer, ForeignKey("meetings_archive.id"))
+    user_id = Column(Integer, ForeignKey("users.id"))
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
@@ -10,7 +10,7 @@ class Comment(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     user_id = Column(Integer, ForeignKey("users.id"))
-    task_id = Column(Integer, ForeignKey("tasks.id"))
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), index=True)
 
     user = relationship("User")
     task = relationship("Task", back_populates="comments")
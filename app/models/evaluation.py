@@ -1,13 +1,17 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
 
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # Оценки задачи; балл и время - для аналитики команды без чтения строк
+        Index("ix_evaluations_task_id_score", "task_id", "score", "evaluated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id"))
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="SET NULL"))
     user_id = Column(Integer, ForeignKey("users.id"))  # кто оценил (менеджер)
     score = Column(Integer, nullable=False)  # от 1 до 5
     evaluated_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from app.database.database import Base
+
+# Допустимые оценки (по столбцу count_N на каждую)
+SCORES = range(1, 6)
+
+
+class EvaluationDailyScore(Base):
+    """
+    Сводка оценок исполнителя за день: сумма, количество и число оценок
+    каждого значения (для процентилей). Обновляется в той же транзакции,
+    что и создание оценки, поэтому запросы за период читают O(дней) строк.
+    """
+
+    __tablename__ = "evaluation_daily_scores"
+
+    assignee_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+    score_sum = Column(Integer, nullable=False, default=0)
+    score_count = Column(Integer, nullable=False, default=0)
+    count_1 = Column(Integer, nullable=False, default=0)
+    count_2 = Column(Integer, nullable=False, default=0)
+    count_3 = Column(Integer, nullable=False, default=0)
+    count_4 = Column(Integer, nullable=False, default=0)
+    count_5 = Column(Integer, nullable=False, default=0)
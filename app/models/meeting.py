@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        Index("ix_meetings_start_time_end_time", "start_time", "end_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -15,4 +18,6 @@ class Meeting(Base):
     team_id = Column(Integer, ForeignKey("teams.id"))
     team = relationship("Team", back_populates="meetings")
 
-    participants = relationship("MeetingParticipant", back_populates="meeting")
+    participants = relationship(
+        "MeetingParticipant", back_populates="meeting", cascade="all, delete-orphan"
+    )
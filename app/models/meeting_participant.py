@@ -1,14 +1,42 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
+MEETING_OVERLAP_CONSTRAINT = "excl_meeting_participants_no_overlap"
+
 
 class MeetingParticipant(Base):
     __tablename__ = "meeting_participants"
+    __table_args__ = (
+        # Встречи пользователя (покрывающий: meeting_id берётся из индекса)
+        Index("ix_meeting_participants_user_id_meeting_id", "user_id", "meeting_id"),
+        Index("ix_meeting_participants_meeting_id", "meeting_id"),
+        # Занятость участников за период (поиск свободного времени)
+        Index(
+            "ix_meeting_participants_user_id_start_time",
+            "user_id",
+            "start_time",
+            "end_time",
+        ),
+        # Пользователь не может быть на двух пересекающихся встречах.
+        # Только PostgreSQL (нужно расширение btree_gist), на SQLite -
+        # проверка в сервисе перед вставкой.
+        ExcludeConstraint(
+            ("user_id", "="),
+            (text("tsrange(start_time, end_time)"), "&&"),
+            name=MEETING_OVERLAP_CONSTRAINT,
+            using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     meeting_id = Column(Integer, ForeignKey("meetings.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
 
+    # Копия времени встречи для ограничения на пересечения
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+
     meeting = relationship("Meeting", back_populates="participants")
     user = relationship("User", back_populates="meeting_participants")
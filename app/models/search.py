@@ -0,0 +1,122 @@
+# Полнотекстовый поиск по задачам и комментариям.
+#
+# PostgreSQL: вычисляемые (GENERATED) столбцы search_vector у tasks и comments
+# пересчитывает сама БД при изменении строки; по ним - GIN индексы. У задач
+# индекс составной (team_id, search_vector), чтобы поиск в команде был одним
+# проходом по индексу (расширение btree_gin). Для существующей базы то же
+# делает миграция 6f8a2c4e1b97.
+#
+# SQLite (тесты): виртуальная таблица FTS5 search_index, её ведут триггеры.
+# rowid: задача - id * 2, комментарий - id * 2 + 1, так что вид и id строки
+# известны без чтения записи. team_id индексируется как слово: фильтр по
+# команде - часть MATCH, а не проверка каждого совпадения.
+#
+# В ORM эти столбцы и таблица не отображаются, запросы - в app/services/search.py.
+
+from sqlalchemy import DDL, event
+
+from app.database.database import Base
+from app.models.comment import Comment
+from app.models.task import Task
+
+SEARCH_CONFIG = "russian"
+
+TASK_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+# Совпадение в комментарии весит меньше, чем в названии и описании задачи
+COMMENT_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')"
+)
+
+POSTGRES_TASKS_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    "ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+    f"GENERATED ALWAYS AS ({TASK_VECTOR}) STORED",
+    "CREATE INDEX ix_tasks_team_id_search_vector ON tasks "
+    "USING gin (team_id, search_vector)",
+]
+POSTGRES_COMMENTS_DDL = [
+    "ALTER TABLE comments ADD COLUMN search_vector tsvector "
+    f"GENERATED ALWAYS AS ({COMMENT_VECTOR}) STORED",
+    "CREATE INDEX ix_comments_search_vector ON comments USING gin (search_vector)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        title, body, team_id, tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_search_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO search_index (rowid, title, body, team_id)
+        VALUES (NEW.id * 2, NEW.title, coalesce(NEW.description, ''), NEW.team_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_search_update
+    AFTER UPDATE OF title, description, team_id ON tasks
+    BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+        INSERT INTO search_index (rowid, title, body, team_id)
+        VALUES (NEW.id * 2, NEW.title, coalesce(NEW.description, ''), NEW.team_id);
+        UPDATE search_index SET team_id = NEW.team_id
+        WHERE OLD.team_id IS NOT NEW.team_id
+            AND rowid IN (SELECT id * 2 + 1 FROM comments WHERE task_id = NEW.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_search_delete AFTER DELETE ON tasks
+    BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_insert AFTER INSERT ON comments
+    BEGIN
+        INSERT INTO search_index (rowid, title, body, team_id)
+        VALUES (
+            NEW.id * 2 + 1, '', NEW.content,
+            (SELECT team_id FROM tasks WHERE id = NEW.task_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_update
+    AFTER UPDATE OF content ON comments
+    BEGIN
+        UPDATE search_index SET body = NEW.content WHERE rowid = NEW.id * 2 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_delete AFTER DELETE ON comments
+    BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+    END
+    """,
+]
+
+for statement in POSTGRES_TASKS_DDL:
+    event.listen(
+        Task.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in POSTGRES_COMMENTS_DDL:
+    event.listen(
+        Comment.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+
+# Триггерам нужны обе таблицы, поэтому - после создания всей схемы
+for statement in SQLITE_DDL:
+    event.listen(
+        Base.metadata, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS search_index").execute_if(dialect="sqlite"),
+)
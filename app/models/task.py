@@ -6,6 +6,7 @@ from sqlalchemy import (
     func,
     DateTime,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
 )
 from sqlalchemy.orm import relationship
@@ -21,6 +22,27 @@ class TaskStatus(enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Список задач команды
+        Index("ix_tasks_team_id_id", "team_id", "id"),
+        # Календарь и оценки исполнителя, фильтры assignee_id и mine
+        Index("ix_tasks_assignee_id_deadline", "assignee_id", "deadline"),
+        # Фильтры и сортировки списка задач (GET /tasks/)
+        Index("ix_tasks_team_id_status_id", "team_id", "status", "id"),
+        Index("ix_tasks_team_id_deadline_id", "team_id", "deadline", "id"),
+        Index("ix_tasks_team_id_created_at", "team_id", "created_at"),
+        Index("ix_tasks_creator_id", "creator_id"),
+        # Аналитика команды: группировка по исполнителю и статусу
+        # только по индексу, без чтения строк задач
+        Index(
+            "ix_tasks_team_id_assignee_id_status",
+            "team_id",
+            "assignee_id",
+            "status",
+            "deadline",
+            "completed_at",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -28,6 +50,10 @@ class Task(Base):
     status = Column(SQLEnum(TaskStatus), default=TaskStatus.open)
     deadline = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
+    # Когда задача переведена в done (для доли выполненных в срок)
+    completed_at = Column(DateTime, nullable=True)
+    # Число комментариев: меняется вместе с ними, списки задач без COUNT
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     creator_id = Column(Integer, ForeignKey("users.id"))
     creator = relationship(
@@ -40,7 +66,14 @@ class Task(Base):
     team_id = Column(Integer, ForeignKey("teams.id"))
     team = relationship("Team", back_populates="tasks")
 
+    # Комментарии удаляет, а у оценок обнуляет task_id сама БД (ondelete):
+    # удаление задачи не загружает их в сессию
     comments = relationship(
-        "Comment", back_populates="task", cascade="all, delete-orphan"
+        "Comment",
+        back_populates="task",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    evaluations = relationship(
+        "Evaluation", back_populates="task", passive_deletes=True
     )
-    evaluations = relationship("Evaluation", back_populates="task")
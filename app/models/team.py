@@ -10,6 +10,16 @@ class Team(Base):
     name = Column(String, nullable=False)
     team_code = Column(String, unique=True, index=True)  # для приглошения
 
+    # Счётчики для главной и списков: меняются в той же транзакции, что
+    # участники и задачи (count + delta); расхождения чинит
+    # reconcile_team_counters (app/cli.py reconcile-team-counters)
+    member_count = Column(Integer, nullable=False, default=0, server_default="0")
+    open_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_task_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    done_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     creator_id = Column(Integer, ForeignKey("users.id"))
     creator = relationship(
         "User", back_populates="owned_teams", foreign_keys=[creator_id]
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 import enum
@@ -21,7 +29,13 @@ class User(Base):
     is_superuser = Column(Boolean, default=False)
     role = Column(SQLEnum(RoleEnum), default=RoleEnum.user)
 
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
+    # Лента календаря (ICS): секретный токен ссылки и версия данных,
+    # которая растёт при каждом изменении задач и встреч пользователя
+    calendar_token = Column(String, unique=True, index=True, nullable=True)
+    calendar_version = Column(Integer, nullable=False, default=0, server_default="0")
+    calendar_updated_at = Column(DateTime, nullable=True)
+
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True, index=True)
     team = relationship("Team", back_populates="members", foreign_keys=[team_id])
     owned_teams = relationship(
         "Team", back_populates="creator", foreign_keys="Team.creator_id"
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+from datetime import datetime
+
+
+class CommentCreate(BaseModel):
+    content: str = Field(min_length=1)
+
+
+class CommentUpdate(BaseModel):
+    content: str = Field(min_length=1)
+
+
+class CommentOut(BaseModel):
+    id: int
+    content: str
+    created_at: Optional[datetime] = None
+    user_id: Optional[int] = None
+    task_id: int
+
+    model_config = ConfigDict(from_attributes=True)
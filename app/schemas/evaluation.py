@@ -1,6 +1,9 @@
 from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
 from datetime import datetime
 
+from app.models.task import TaskStatus
+
 
 class EvaluationCreate(BaseModel):
     task_id: int
@@ -15,3 +18,10 @@ class EvaluationOut(BaseModel):
     evaluated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class EvaluationExpandedOut(EvaluationOut):
+    task_title: str
+    task_status: TaskStatus
+    task_deadline: Optional[datetime] = None
+    evaluator_name: Optional[str] = None
@@ -19,6 +19,11 @@ class MeetingUpdate(BaseModel):
     participant_ids: Optional[List[int]] = None
 
 
+class FreeSlot(BaseModel):
+    start_time: datetime
+    end_time: datetime
+
+
 class MeetingOut(BaseModel):
     id: int
     title: str
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+
+class SearchHit(BaseModel):
+    kind: Literal["task", "comment"]
+    id: int  # id задачи или комментария
+    task_id: int
+    title: str  # название задачи
+    snippet: Optional[str] = None  # фрагмент описания или комментария
+    rank: float
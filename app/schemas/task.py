@@ -1,8 +1,11 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
 from datetime import datetime
 
 from app.models.task import TaskStatus
+from app.schemas.comment import CommentOut
+from app.schemas.evaluation import EvaluationOut
+from app.schemas.user import UserShort
 
 
 class TaskCreate(BaseModel):
@@ -20,6 +23,18 @@ class TaskUpdate(BaseModel):
     assignee_id: Optional[int] = None
 
 
+class TaskFilter(BaseModel):
+    status: Optional[List[TaskStatus]] = None
+    assignee_id: Optional[int] = None
+    creator_id: Optional[int] = None
+    deadline_from: Optional[datetime] = None
+    deadline_to: Optional[datetime] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    overdue: bool = False  # дедлайн прошёл, задача не выполнена
+    mine: bool = False  # назначены на текущего пользователя
+
+
 class TaskOut(BaseModel):
     id: int
     title: str
@@ -27,8 +42,47 @@ class TaskOut(BaseModel):
     status: TaskStatus
     deadline: Optional[datetime] = None
     created_at: datetime
+    completed_at: Optional[datetime] = None
+    comment_count: int = 0
     creator_id: int
     assignee_id: Optional[int] = None
     team_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskDetailOut(TaskOut):
+    creator: Optional[UserShort] = None
+    assignee: Optional[UserShort] = None
+    comments: List[CommentOut] = []
+    evaluations: List[EvaluationOut] = []
+    team_members: List[UserShort] = []
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkCreate(BaseModel):
+    items: List[TaskCreate] = Field(min_length=1)
+    # atomic - всё или ничего, best_effort - сохранить корректные
+    mode: Literal["atomic", "best_effort"] = "atomic"
+
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(min_length=1)
+    mode: Literal["atomic", "best_effort"] = "atomic"
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int  # позиция в items запроса
+    status_code: int
+    task: Optional[TaskOut] = None
+    error: Optional[str] = None
+
+
+class TaskBulkResult(BaseModel):
+    mode: str
+    succeeded: int
+    failed: int
+    items: List[TaskBulkItemResult]
@@ -10,5 +10,21 @@ class TeamOut(BaseModel):
     name: str
     team_code: str
     creator_id: int
+    member_count: int = 0
+    open_task_count: int = 0
+    in_progress_task_count: int = 0
+    done_task_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TeamSummary(BaseModel):
+    id: int
+    name: str
+    member_count: int
+    open_task_count: int
+    in_progress_task_count: int
+    done_task_count: int
+    task_count: int
 
     model_config = ConfigDict(from_attributes=True)
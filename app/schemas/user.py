@@ -1,5 +1,5 @@
 # app/schemas/user.py
-from pydantic import EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from fastapi_users import schemas
@@ -51,3 +51,11 @@ class UserUpdate(schemas.BaseUserUpdate):
     full_name: Optional[str] = None
     password: Optional[str] = None
     role: Optional[RoleEnum] = None
+
+
+class UserShort(BaseModel):
+    id: int
+    full_name: Optional[str] = None
+    email: str
+
+    model_config = ConfigDict(from_attributes=True)
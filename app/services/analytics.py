@@ -0,0 +1,335 @@
+from datetime import datetime, timedelta
+from itertools import chain
+
+import numpy as np
+from decouple import config
+from fastapi import HTTPException
+from sqlalchemy import Date, Integer, case, cast, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.analytics_cache import analytics_cache
+from app.models.archive import EvaluationArchive, TaskArchive
+from app.models.evaluation import Evaluation
+from app.models.task import Task, TaskStatus
+from app.models.team import Team
+from app.models.user import User, RoleEnum
+
+# Окно динамики оценок и ширина скользящего среднего, дней
+ANALYTICS_DAYS = int(config("ANALYTICS_DAYS", 90))
+MOVING_AVERAGE_DAYS = int(config("ANALYTICS_MOVING_AVERAGE_DAYS", 7))
+
+STATUSES = list(TaskStatus)
+# Значение NULL в столбцах (id неотрицательные)
+MISSING = -1
+EPOCH = datetime(1970, 1, 1)
+
+
+def trend_window(now: datetime) -> tuple:
+    """
+    Окно динамики: ANALYTICS_DAYS дней по сегодняшний включительно.
+    """
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=ANALYTICS_DAYS - 1), today + timedelta(days=1)
+
+
+def window_day(db: AsyncSession, column, start: datetime):
+    # Номер дня от начала окна (для строк внутри окна)
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(column, Date) - start.date()
+    # Юлианский день начала окна считается здесь, а не в SQLite
+    start_julian = (start - EPOCH).total_seconds() / 86400 + 2440587.5
+    return cast(func.julianday(column) - start_julian, Integer)
+
+
+def count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+# Горячие и архивные таблицы: аналитика, как и счётчики команды,
+# учитывает архив
+TASK_SOURCES = (Task, TaskArchive)
+SCORE_SOURCES = ((Task, Evaluation), (TaskArchive, EvaluationArchive))
+
+
+def member_tasks_query(db: AsyncSession, team_id: int, now: datetime):
+    """
+    Задачи по исполнителю и статусу: всего, просрочено, выполнено
+    при заданном дедлайне и из них в срок. Группировка идёт в порядке
+    индекса ix_tasks_team_id_assignee_id_status.
+    """
+    parts = []
+    for task in TASK_SOURCES:
+        done = task.status == TaskStatus.done
+        finished = (
+            done & task.deadline.is_not(None) & task.completed_at.is_not(None)
+        )
+        parts.append(
+            select(
+                func.coalesce(task.assignee_id, MISSING),
+                case(*[(task.status == s, i) for i, s in enumerate(STATUSES)]),
+                func.count(),
+                count_if(~done & (task.deadline < now)),
+                count_if(finished),
+                count_if(finished & (task.completed_at <= task.deadline)),
+            )
+            .where(task.team_id == team_id)
+            .group_by(task.assignee_id, task.status)
+        )
+    return union_all(*parts)
+
+
+def completed_days_query(db: AsyncSession, team_id: int, now: datetime):
+    """
+    Выполненные задачи по дням окна динамики.
+    """
+    start, end = trend_window(now)
+    parts = []
+    for task in TASK_SOURCES:
+        day = window_day(db, task.completed_at, start)
+        parts.append(
+            select(day, func.count())
+            .where(
+                task.team_id == team_id,
+                task.status == TaskStatus.done,
+                task.completed_at >= start,
+                task.completed_at < end,
+            )
+            .group_by(day)
+        )
+    return union_all(*parts)
+
+
+def scores_query(db: AsyncSession, team_id: int, now: datetime):
+    """
+    Оценки задач команды по исполнителю задачи, баллу и дню окна динамики
+    (MISSING - раньше окна). Один проход по оценкам вместо двух.
+    """
+    start, end = trend_window(now)
+    parts = []
+    for task, evaluation in SCORE_SOURCES:
+        evaluated_at = evaluation.evaluated_at
+        day = case(
+            (
+                (evaluated_at >= start) & (evaluated_at < end),
+                window_day(db, evaluated_at, start),
+            ),
+            else_=MISSING,
+        )
+        parts.append(
+            select(
+                func.coalesce(task.assignee_id, MISSING),
+                evaluation.score,
+                day,
+                func.count(),
+            )
+            .join(task, evaluation.task_id == task.id)
+            .where(task.team_id == team_id)
+            .group_by(task.assignee_id, evaluation.score, day)
+        )
+    return union_all(*parts)
+
+
+# Запросы аналитики и столбцы их строк. Каждый возвращает группы
+# (сотни-тысячи строк, а не строку на задачу) отдельно для горячих
+# и архивных таблиц - одинаковые группы складываются в NumPy.
+ANALYTICS_QUERIES = {
+    "member_tasks": (
+        member_tasks_query,
+        ("assignee_id", "status", "count", "overdue", "finished", "on_time"),
+    ),
+    "completed_days": (completed_days_query, ("day", "count")),
+    "scores": (scores_query, ("assignee_id", "score", "day", "count")),
+}
+
+
+async def load_groups(db: AsyncSession, team_id: int, now: datetime) -> dict:
+    """
+    Группы для compute_analytics: по массиву int64 на столбец.
+    """
+    groups = {}
+    for name, (build, columns) in ANALYTICS_QUERIES.items():
+        result = await db.execute(build(db, team_id, now))
+        groups[name] = parse_columns(result.all(), columns)
+    return groups
+
+
+def parse_columns(rows: list, columns: tuple) -> dict:
+    """
+    Строки запроса групп в массивы int64 по именам столбцов.
+    """
+    values = np.fromiter(
+        chain.from_iterable(rows), dtype=np.int64, count=len(rows) * len(columns)
+    )
+    matrix = np.ascontiguousarray(values.reshape(len(rows), len(columns)).T)
+    return dict(zip(columns, matrix))
+
+
+def ratio(numerator, denominator):
+    """
+    Поэлементное деление, где знаменатель 0 - NaN (в ответе null).
+    """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def to_json(values, digits: int = 2) -> list:
+    return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+
+def weighted_count(index, weights, size: int):
+    """
+    np.bincount с весами (числом строк в группе) - снова целые числа.
+    """
+    counts = np.bincount(index, weights=weights, minlength=size)[:size]
+    return np.rint(counts).astype(np.int64)
+
+
+def compute_analytics(groups: dict, member_ids: list, now: datetime) -> dict:
+    """
+    Статистика по группам задач и оценок (load_groups): средние,
+    гистограммы, скользящее среднее и доля задач, выполненных в срок.
+    Без циклов по строкам.
+    """
+    tasks, scores = groups["member_tasks"], groups["scores"]
+    t_count, s_count = tasks["count"], scores["count"]
+    done = tasks["status"] == STATUSES.index(TaskStatus.done)
+
+    # Участники: индекс строки по assignee_id, -1 - не участник команды
+    members = np.array(sorted(member_ids), dtype=np.int64)
+    m = len(members)
+
+    def member_index(values):
+        if not m:
+            return np.full(values.shape, -1)
+        index = np.minimum(np.searchsorted(members, values), m - 1)
+        return np.where(members[index] == values, index, -1)
+
+    t_member = member_index(tasks["assignee_id"])
+    s_member = member_index(scores["assignee_id"])
+    t_known, s_known = t_member >= 0, s_member >= 0
+
+    def per_member(weights):
+        return weighted_count(t_member[t_known], weights[t_known], m)
+
+    score_weight = scores["score"] * s_count
+    member_score_sum = weighted_count(s_member[s_known], score_weight[s_known], m)
+    member_score_count = weighted_count(s_member[s_known], s_count[s_known], m)
+    member_histogram = weighted_count(
+        s_member[s_known] * 5 + scores["score"][s_known] - 1,
+        s_count[s_known],
+        m * 5,
+    ).reshape(m, 5)
+
+    member_tasks = per_member(t_count)
+    member_done = per_member(t_count * done)
+    member_finished = per_member(tasks["finished"])
+    member_on_time = per_member(tasks["on_time"])
+    member_overdue = per_member(tasks["overdue"])
+    member_average = ratio(member_score_sum, member_score_count)
+    member_hit = ratio(member_on_time, member_finished)
+
+    # Динамика за ANALYTICS_DAYS дней: суммы и количества по дням,
+    # скользящее среднее - свёртка с окном MOVING_AVERAGE_DAYS
+    start, _ = trend_window(now)
+    in_window = scores["day"] != MISSING
+    day = scores["day"][in_window]
+    day_sum = weighted_count(day, score_weight[in_window], ANALYTICS_DAYS)
+    day_count = weighted_count(day, s_count[in_window], ANALYTICS_DAYS)
+    window = np.ones(MOVING_AVERAGE_DAYS)
+    moving = ratio(
+        np.convolve(day_sum, window)[:ANALYTICS_DAYS],
+        np.convolve(day_count, window)[:ANALYTICS_DAYS],
+    )
+    completed = groups["completed_days"]
+    day_completed = weighted_count(
+        completed["day"], completed["count"], ANALYTICS_DAYS
+    )
+
+    status_counts = weighted_count(tasks["status"], t_count, len(STATUSES))
+    histogram = weighted_count(scores["score"] - 1, s_count, 5)
+    total_finished = int(tasks["finished"].sum())
+    total_on_time = int(tasks["on_time"].sum())
+    score_count = int(s_count.sum())
+    hit_ratio = ratio([total_on_time], [total_finished])
+    average = ratio([score_weight.sum()], [score_count])
+
+    return {
+        "tasks": {
+            "total": int(t_count.sum()),
+            "by_status": {
+                s.value: int(status_counts[i]) for i, s in enumerate(STATUSES)
+            },
+            "overdue": int(tasks["overdue"].sum()),
+            "completed_with_deadline": total_finished,
+            "on_time": total_on_time,
+            "deadline_hit_ratio": to_json(hit_ratio)[0],
+        },
+        "scores": {
+            "count": score_count,
+            "average": to_json(average)[0],
+            "histogram": {str(s + 1): int(c) for s, c in enumerate(histogram)},
+        },
+        "members": [
+            {
+                "user_id": int(members[i]),
+                "tasks": int(member_tasks[i]),
+                "done": int(member_done[i]),
+                "overdue": int(member_overdue[i]),
+                "deadline_hit_ratio": to_json([member_hit[i]])[0],
+                "evaluations": int(member_score_count[i]),
+                "average_score": to_json([member_average[i]])[0],
+                "histogram": {
+                    str(s + 1): int(c) for s, c in enumerate(member_histogram[i])
+                },
+            }
+            for i in range(m)
+        ],
+        "trend": {
+            "from": start.date(),
+            "days": ANALYTICS_DAYS,
+            "moving_average_days": MOVING_AVERAGE_DAYS,
+            "daily_average": to_json(ratio(day_sum, day_count)),
+            "daily_count": day_count.tolist(),
+            "moving_average": to_json(moving),
+            "daily_completed": day_completed.tolist(),
+        },
+    }
+
+
+async def get_team_analytics(db: AsyncSession, current_user: User, team_id: int):
+    """
+    Аналитика команды для менеджера: из кэша или по группам задач и оценок,
+    посчитанным в БД, с расчётом в NumPy.
+    """
+    if current_user.role != RoleEnum.admin and not current_user.is_superuser:
+        if current_user.team_id != team_id:
+            raise HTTPException(
+                status_code=403, detail="Нет доступа к объекту из другой команды"
+            )
+
+    cached = analytics_cache.get(team_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(select(Team.id).where(Team.id == team_id))
+    if result.scalar() is None:
+        raise HTTPException(status_code=404, detail="Команда не найдена")
+
+    members = await db.execute(
+        select(User.id, User.full_name, User.email).where(User.team_id == team_id)
+    )
+    names = {m.id: m.full_name or m.email for m in members}
+
+    now = datetime.utcnow()
+    groups = await load_groups(db, team_id, now)
+    analytics = compute_analytics(groups, list(names), now)
+    for member in analytics["members"]:
+        member["name"] = names[member["user_id"]]
+    analytics["team_id"] = team_id
+    analytics["generated_at"] = now
+
+    analytics_cache.set(team_id, analytics)
+    return analytics
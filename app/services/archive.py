@@ -0,0 +1,244 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from decouple import config
+from sqlalchemy import delete, exists, insert, or_, select, func, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.analytics_cache import analytics_cache
+from app.models.archive import (
+    CommentArchive,
+    EvaluationArchive,
+    MeetingArchive,
+    MeetingParticipantArchive,
+    TaskArchive,
+)
+from app.models.comment import Comment
+from app.models.evaluation import Evaluation
+from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
+from app.models.task import Task, TaskStatus
+from app.utils.pagination import paginate
+
+# Через сколько дней выполненные задачи и прошедшие встречи уходят в архив.
+# Чтения обращаются к архиву, только если запрошенный период или страница
+# заходит за эту границу, поэтому архивировать более свежие строки нельзя.
+ARCHIVE_AFTER_DAYS = int(config("ARCHIVE_AFTER_DAYS", 365))
+# Задач или встреч на одну транзакцию переноса
+ARCHIVE_BATCH_SIZE = int(config("ARCHIVE_BATCH_SIZE", 1000))
+
+
+def archive_boundary() -> datetime:
+    """
+    Всё, что лежит в архиве, старше этого момента.
+    """
+    return datetime.utcnow() - timedelta(days=ARCHIVE_AFTER_DAYS)
+
+
+def copy_columns(archive_model, model) -> tuple:
+    """
+    Общие столбцы архивной и горячей таблицы (для INSERT ... SELECT).
+    """
+    table = model.__table__
+    names = [c.name for c in archive_model.__table__.columns if c.name in table.c]
+    return names, [table.c[name] for name in names]
+
+
+async def move_rows(db: AsyncSession, archive_model, model, condition) -> int:
+    """
+    INSERT INTO <архив> SELECT ... и DELETE тех же строк из горячей таблицы.
+    """
+    names, columns = copy_columns(archive_model, model)
+    result = await db.execute(
+        insert(archive_model).from_select(names, select(*columns).where(condition))
+    )
+    await db.execute(
+        delete(model).where(condition).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def archivable_tasks(cutoff: datetime):
+    """
+    Выполненные задачи старше cutoff: и выполнение, и дедлайн (календарь),
+    и оценки (список оценок) - до границы.
+    """
+    return select(Task.id).where(
+        Task.status == TaskStatus.done,
+        func.coalesce(Task.completed_at, Task.created_at) < cutoff,
+        or_(Task.deadline.is_(None), Task.deadline < cutoff),
+        ~exists().where(
+            Evaluation.task_id == Task.id, Evaluation.evaluated_at >= cutoff
+        ),
+    )
+
+
+async def archive_tasks_batch(
+    db: AsyncSession, cutoff: datetime, batch_size: int
+) -> dict:
+    """
+    Перенос одной пачки задач вместе с комментариями и оценками.
+    Строки задач блокируются (на PostgreSQL занятые пропускаются):
+    параллельное изменение задачи дождётся переноса или не помешает ему.
+    Вызывающий код делает commit и сбрасывает кэш команд из "team_ids".
+    """
+    result = await db.execute(
+        archivable_tasks(cutoff)
+        .add_columns(Task.team_id)
+        .order_by(Task.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    rows = result.all()
+    task_ids = [row.id for row in rows]
+    team_ids = {row.team_id for row in rows if row.team_id is not None}
+    if not task_ids:
+        return {"tasks": 0, "comments": 0, "evaluations": 0, "team_ids": team_ids}
+
+    # Порядок - из-за внешних ключей: задача в архиве раньше её комментариев,
+    # из горячей таблицы уходит после них
+    names, columns = copy_columns(TaskArchive, Task)
+    await db.execute(
+        insert(TaskArchive).from_select(
+            names, select(*columns).where(Task.id.in_(task_ids))
+        )
+    )
+    comments = await move_rows(
+        db, CommentArchive, Comment, Comment.task_id.in_(task_ids)
+    )
+    evaluations = await move_rows(
+        db, EvaluationArchive, Evaluation, Evaluation.task_id.in_(task_ids)
+    )
+    await db.execute(
+        delete(Task)
+        .where(Task.id.in_(task_ids))
+        .execution_options(synchronize_session=False)
+    )
+    return {
+        "tasks": len(task_ids),
+        "comments": comments,
+        "evaluations": evaluations,
+        "team_ids": team_ids,
+    }
+
+
+async def archive_meetings_batch(
+    db: AsyncSession, cutoff: datetime, batch_size: int
+) -> dict:
+    """
+    Перенос одной пачки закончившихся встреч вместе с участниками.
+    Вызывающий код делает commit.
+    """
+    result = await db.execute(
+        select(Meeting.id)
+        .where(Meeting.end_time < cutoff)
+        .order_by(Meeting.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    meeting_ids = list(result.scalars())
+    if not meeting_ids:
+        return {"meetings": 0}
+
+    names, columns = copy_columns(MeetingArchive, Meeting)
+    await db.execute(
+        insert(MeetingArchive).from_select(
+            names, select(*columns).where(Meeting.id.in_(meeting_ids))
+        )
+    )
+    await move_rows(
+        db,
+        MeetingParticipantArchive,
+        MeetingParticipant,
+        MeetingParticipant.meeting_id.in_(meeting_ids),
+    )
+    await db.execute(
+        delete(Meeting)
+        .where(Meeting.id.in_(meeting_ids))
+        .execution_options(synchronize_session=False)
+    )
+    return {"meetings": len(meeting_ids)}
+
+
+async def run_archive(
+    db: AsyncSession,
+    days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Перенос в архив выполненных задач и встреч старше days дней.
+    Каждая пачка - отдельная транзакция, так что блокировки короткие,
+    а прерванный запуск продолжается со следующей пачки. После commit
+    сбрасывается кэш аналитики команд, чьи задачи ушли в архив.
+    """
+    if days < ARCHIVE_AFTER_DAYS:
+        raise ValueError(
+            f"days не меньше ARCHIVE_AFTER_DAYS ({ARCHIVE_AFTER_DAYS}): "
+            "более свежие строки чтения в архиве не ищут"
+        )
+    start = time.perf_counter()
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    stats = {"tasks": 0, "comments": 0, "evaluations": 0, "meetings": 0}
+
+    for archive_batch, key in [
+        (archive_tasks_batch, "tasks"),
+        (archive_meetings_batch, "meetings"),
+    ]:
+        while True:
+            moved = await archive_batch(db, cutoff, batch_size)
+            await db.commit()
+            for team_id in moved.pop("team_ids", ()):
+                analytics_cache.invalidate(team_id)
+            for name, count in moved.items():
+                stats[name] += count
+            if progress:
+                progress(stats)
+            if moved[key] < batch_size:
+                break
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+async def paginate_with_archive(
+    db: AsyncSession,
+    hot,
+    archived,
+    time_key: str,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+) -> dict:
+    """
+    Страница по id от новых к старым (id растёт вместе со временем time_key).
+    Сначала - только горячая таблица; архив объединяется (UNION ALL), если
+    горячие строки кончились или страница доходит до границы архива.
+    Оценке числа строк архив нужен всегда.
+    """
+    if not with_total:
+        page = await paginate(
+            db,
+            hot,
+            [hot.selected_columns.id],
+            cursor,
+            limit,
+            descending=True,
+            scalars=False,
+        )
+        items = page["items"]
+        if page["next_cursor"] and getattr(items[-1], time_key) >= archive_boundary():
+            return page
+
+    items = union_all(hot, archived).subquery()
+    return await paginate(
+        db,
+        select(items),
+        [items.c.id],
+        cursor,
+        limit,
+        descending=True,
+        with_total=with_total,
+        scalars=False,
+    )
@@ -0,0 +1,338 @@
+import json
+import secrets
+from typing import AsyncIterator
+
+from decouple import config
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, literal, union_all, update
+from datetime import datetime, date, timedelta
+
+from app.core.calendar_cache import calendar_cache
+from app.models.archive import MeetingArchive, MeetingParticipantArchive, TaskArchive
+from app.models.user import User
+from app.models.task import Task
+from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
+from app.services.archive import archive_boundary
+from app.utils import ics
+
+# Максимальная длина окна /calendar/range, дней
+CALENDAR_MAX_DAYS = 92
+
+# Окно ленты ICS относительно текущего дня
+ICS_PAST_DAYS = int(config("ICS_PAST_DAYS", 30))
+ICS_FUTURE_DAYS = int(config("ICS_FUTURE_DAYS", 180))
+
+
+def calendar_query(user_id: int, start: datetime, end: datetime):
+    """
+    Задачи (по дедлайну) и встречи пользователя в окне [start, end)
+    одним UNION ALL: только нужные столбцы, без загрузки сущностей.
+    Встречи отбираются по пересечению с окном, поэтому попадают
+    и те, что начались до окна или закончатся после него.
+    Архивные таблицы добавляются, только если окно начинается раньше
+    границы архива.
+    """
+    sources = [(Task, Meeting, MeetingParticipant)]
+    if start < archive_boundary():
+        sources.append((TaskArchive, MeetingArchive, MeetingParticipantArchive))
+
+    parts = []
+    for task, meeting, participant in sources:
+        tasks = select(
+            task.id,
+            task.title,
+            literal("task").label("kind"),
+            task.deadline.label("start_time"),
+            task.deadline.label("end_time"),
+            task.status,
+        ).where(
+            task.assignee_id == user_id,
+            task.deadline >= start,
+            task.deadline < end,
+        )
+        # Время встречи берётся из meeting_participants
+        # (индекс ix_meeting_participants_user_id_start_time)
+        meetings = (
+            select(
+                meeting.id,
+                meeting.title,
+                literal("meeting").label("kind"),
+                participant.start_time,
+                participant.end_time,
+                literal(None).label("status"),
+            )
+            .join(meeting, participant.meeting_id == meeting.id)
+            .where(
+                participant.user_id == user_id,
+                participant.start_time < end,
+                participant.end_time > start,
+            )
+        )
+        parts += [tasks, meetings]
+    items = union_all(*parts).subquery()
+    return select(items).order_by(items.c.start_time, items.c.kind, items.c.id)
+
+
+def _item_days(row, date_from: date, date_to: date):
+    first = max(row.start_time.date(), date_from)
+    last = row.start_time.date()
+    if row.end_time > row.start_time:
+        # встреча до 00:00 следующего дня на него не попадает
+        last = (row.end_time - timedelta(microseconds=1)).date()
+    last = min(last, date_to)
+    return (first + timedelta(days=i) for i in range((last - first).days + 1))
+
+
+def check_range(date_from: date, date_to: date) -> None:
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="from должна быть не позже to")
+    if (date_to - date_from).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Период не больше {CALENDAR_MAX_DAYS} дней"
+        )
+
+
+async def iter_range_days(
+    db: AsyncSession, current_user: User, date_from: date, date_to: date
+) -> AsyncIterator[tuple]:
+    """
+    Дни периода [date_from, date_to] по порядку: (день, задачи и встречи).
+    Строки идут по времени начала, поэтому день готов, как только пришла
+    строка следующего дня; в памяти - только дни, куда ещё могут попасть
+    начавшиеся раньше встречи.
+    """
+    start = datetime.combine(date_from, datetime.min.time())
+    end = datetime.combine(date_to + timedelta(days=1), datetime.min.time())
+
+    days = {}
+    current = date_from
+
+    def ready(before: date):
+        nonlocal current
+        while current < before and current <= date_to:
+            yield current, days.pop(current, {"tasks": [], "meetings": []})
+            current += timedelta(days=1)
+
+    def day(value: date) -> dict:
+        return days.setdefault(value, {"tasks": [], "meetings": []})
+
+    result = await db.stream(calendar_query(current_user.id, start, end))
+    async for row in result:
+        for item in ready(row.start_time.date()):
+            yield item
+        if row.kind == "task":
+            day(row.start_time.date())["tasks"].append(
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "status": row.status,
+                    "time": str(row.start_time.time()),
+                }
+            )
+        else:
+            item = {
+                "id": row.id,
+                "title": row.title,
+                "time": f"{row.start_time.time()} - {row.end_time.time()}",
+                "start_time": row.start_time,
+                "end_time": row.end_time,
+            }
+            for value in _item_days(row, date_from, date_to):
+                day(value)["meetings"].append(item)
+
+    for item in ready(date_to + timedelta(days=1)):
+        yield item
+
+
+async def get_range(
+    db: AsyncSession, current_user: User, date_from: date, date_to: date
+):
+    """
+    Календарь за период [date_from, date_to]: задачи и встречи по дням.
+    Строки читаются потоком и сразу раскладываются по дням.
+    """
+    check_range(date_from, date_to)
+    days = {
+        day: items
+        async for day, items in iter_range_days(db, current_user, date_from, date_to)
+    }
+    return {"from": date_from, "to": date_to, "days": days}
+
+
+async def range_ndjson(
+    db: AsyncSession, current_user: User, date_from: date, date_to: date
+) -> AsyncIterator[str]:
+    """
+    Тот же календарь построчно: {"date": ..., "tasks": [...], "meetings": [...]}
+    на день. День отдаётся, как только готов; период проверяет check_range.
+    """
+    async for day, items in iter_range_days(db, current_user, date_from, date_to):
+        yield (
+            json.dumps(jsonable_encoder({"date": day, **items}), ensure_ascii=False)
+            + "\n"
+        )
+
+
+async def get_day(db: AsyncSession, current_user: User, target_date: date = None):
+    """
+    Календарь на день: задачи и встречи.
+    """
+    if not target_date:
+        target_date = date.today()
+
+    data = await get_range(db, current_user, target_date, target_date)
+    return {"date": target_date, **data["days"][target_date]}
+
+
+async def get_month(
+    db: AsyncSession,
+    current_user: User,
+    target_month: int = None,
+    target_year: int = None,
+):
+    """
+    Календаль на месяц: группировка по дням.
+    """
+    now = datetime.now()
+    month = target_month or now.month
+    year = target_year or now.year
+
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="Месяц должен быть от 1 до 12")
+
+    start = date(year, month, 1)
+    if month == 12:
+        end = date(year + 1, 1, 1)
+    else:
+        end = date(year, month + 1, 1)
+
+    data = await get_range(db, current_user, start, end - timedelta(days=1))
+    return {"year": year, "month": month, "calendar": data["days"]}
+
+
+async def bump_calendar_versions(db: AsyncSession, user_ids) -> None:
+    """
+    Отмечает, что календарь пользователей изменился (ETag ленты ICS).
+    Вызывается в той же транзакции, что и само изменение.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+
+    await db.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(
+            calendar_version=User.calendar_version + 1,
+            calendar_updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_feed_token(
+    db: AsyncSession, current_user: User, reset: bool = False
+) -> str:
+    """
+    Токен ссылки на ленту ICS; создаётся при первом запросе.
+    reset=True выдаёт новый токен, старая ссылка перестаёт работать.
+    """
+    result = await db.execute(
+        select(User.calendar_token).where(User.id == current_user.id)
+    )
+    token = result.scalar()
+    if token and not reset:
+        return token
+
+    token = secrets.token_urlsafe(24)
+    await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(calendar_token=token)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return token
+
+
+async def get_feed_state(db: AsyncSession, user_token: str) -> dict:
+    """
+    Валидаторы ленты по токену: ETag и Last-Modified.
+    Только запрос к users - таблицы задач и встреч не затрагиваются.
+    """
+    result = await db.execute(
+        select(
+            User.id,
+            User.email,
+            User.full_name,
+            User.calendar_version,
+            User.calendar_updated_at,
+        ).where(User.calendar_token == user_token, User.is_active.is_(True))
+    )
+    user = result.first()
+    if not user:
+        raise HTTPException(status_code=404, detail="Календарь не найден")
+
+    # Окно ленты сдвигается каждый день, поэтому день входит в ETag
+    today = datetime.utcnow().date()
+    day_start = datetime.combine(today, datetime.min.time())
+    key = f"{user.id}-{user.calendar_version}-{today:%Y%m%d}"
+    last_modified = max(user.calendar_updated_at or day_start, day_start)
+    return {
+        "user_id": user.id,
+        "name": user.full_name or user.email,
+        "today": today,
+        "key": key,
+        "etag": f'"{key}"',
+        "last_modified": last_modified.replace(microsecond=0),
+    }
+
+
+async def get_feed_body(db: AsyncSession, state: dict) -> str:
+    """
+    Лента ICS пользователя: из кэша или построчно из потока строк
+    того же запроса, что и /calendar/range.
+    """
+    body = calendar_cache.get(state["user_id"], state["key"])
+    if body is not None:
+        return body
+
+    start = datetime.combine(
+        state["today"] - timedelta(days=ICS_PAST_DAYS), datetime.min.time()
+    )
+    end = datetime.combine(
+        state["today"] + timedelta(days=ICS_FUTURE_DAYS), datetime.min.time()
+    )
+    stamp = state["last_modified"]
+
+    events = []
+    result = await db.stream(calendar_query(state["user_id"], start, end))
+    async for row in result:
+        if row.kind == "task":
+            events.append(
+                ics.event_lines(
+                    uid=f"task-{row.id}@team-app",
+                    summary=f"Дедлайн: {row.title}",
+                    start=row.start_time,
+                    end=row.start_time,
+                    stamp=stamp,
+                    description=f"Статус: {row.status.value}",
+                )
+            )
+        else:
+            events.append(
+                ics.event_lines(
+                    uid=f"meeting-{row.id}@team-app",
+                    summary=row.title,
+                    start=row.start_time,
+                    end=row.end_time,
+                    stamp=stamp,
+                )
+            )
+
+    body = ics.render(ics.calendar_lines(f"Календарь: {state['name']}", events))
+    calendar_cache.set(state["user_id"], state["key"], body)
+    return body
@@ -0,0 +1,117 @@
+from fastapi import HTTPException
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User, RoleEnum
+from app.schemas.comment import CommentCreate, CommentUpdate
+from app.services.task import get_team_task
+from app.utils.pagination import paginate
+
+
+async def change_comment_count(db: AsyncSession, task_id: int, delta: int) -> None:
+    """
+    Счётчик комментариев меняется в БД (comment_count + delta), без
+    чтения-изменения-записи: параллельные комментарии не теряются.
+    """
+    await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(comment_count=Task.comment_count + delta)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def get_task_comments(
+    db: AsyncSession,
+    current_user: User,
+    task_id: int,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    descending: bool = False,
+    with_total: bool = False,
+):
+    """
+    Комментарии задачи своей команды по id (по времени добавления).
+    """
+    await get_team_task(db, current_user, task_id)
+    return await paginate(
+        db,
+        select(Comment).where(Comment.task_id == task_id),
+        [Comment.id],
+        cursor,
+        limit,
+        descending=descending,
+        with_total=with_total,
+    )
+
+
+async def create_comment(
+    db: AsyncSession, current_user: User, task_id: int, comment_data: CommentCreate
+):
+    """
+    Комментарий к задаче своей команды.
+    """
+    await get_team_task(db, current_user, task_id)
+
+    comment = Comment(
+        content=comment_data.content, user_id=current_user.id, task_id=task_id
+    )
+    db.add(comment)
+    await change_comment_count(db, task_id, 1)
+    await db.commit()
+    await db.refresh(comment)
+    return comment
+
+
+async def get_task_comment(
+    db: AsyncSession, current_user: User, task_id: int, comment_id: int
+) -> Comment:
+    await get_team_task(db, current_user, task_id)
+    result = await db.execute(
+        select(Comment).where(Comment.id == comment_id, Comment.task_id == task_id)
+    )
+    comment = result.scalars().first()
+    if not comment:
+        raise HTTPException(status_code=404, detail="Комментарий не найден")
+    return comment
+
+
+async def update_comment(
+    db: AsyncSession,
+    current_user: User,
+    task_id: int,
+    comment_id: int,
+    comment_data: CommentUpdate,
+):
+    """
+    Изменить комментарий может только его автор.
+    """
+    comment = await get_task_comment(db, current_user, task_id, comment_id)
+    if comment.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Нет прав на изменение")
+
+    comment.content = comment_data.content
+    await db.commit()
+    await db.refresh(comment)
+    return comment
+
+
+async def delete_comment(
+    db: AsyncSession, current_user: User, task_id: int, comment_id: int
+):
+    """
+    Удалить комментарий может автор, manager или admin команды.
+    """
+    comment = await get_task_comment(db, current_user, task_id, comment_id)
+    if comment.user_id != current_user.id and current_user.role not in (
+        RoleEnum.manager,
+        RoleEnum.admin,
+    ):
+        raise HTTPException(status_code=403, detail="Нет прав на удаление")
+
+    await db.delete(comment)
+    await change_comment_count(db, task_id, -1)
+    await db.commit()
@@ -0,0 +1,419 @@
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Date,
+    case,
+    delete,
+    insert,
+    select,
+    func,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from app.core.analytics_cache import analytics_cache
+from app.models.archive import EvaluationArchive, TaskArchive
+from app.models.user import User
+from app.models.task import Task, TaskStatus
+from app.models.evaluation import Evaluation
+from app.models.evaluation_score import EvaluationDailyScore, SCORES
+from app.schemas.evaluation import EvaluationCreate
+from app.services.archive import paginate_with_archive
+
+# Окна статистики оценок, дней (включая сегодня)
+SCORE_PERIODS = {"week": 7, "month": 30, "quarter": 90}
+SCORE_PERIOD_MAX_DAYS = 366
+SCORE_PERCENTILES = (25, 50, 75, 90)
+
+ROLLUP_COLUMNS = ["score_sum", "score_count"] + [f"count_{s}" for s in SCORES]
+
+
+async def add_to_score_rollup(
+    db: AsyncSession, assignee_id: int, day: date, score: int
+) -> None:
+    """
+    Атомарно прибавляет оценку к сводке исполнителя за день
+    (INSERT ... ON CONFLICT DO UPDATE).
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    values = {column: 0 for column in ROLLUP_COLUMNS}
+    values.update(score_sum=score, score_count=1, **{f"count_{score}": 1})
+
+    stmt = dialect.insert(EvaluationDailyScore).values(
+        assignee_id=assignee_id, day=day, **values
+    )
+    table = EvaluationDailyScore.__table__
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.assignee_id, table.c.day],
+            set_={
+                column: table.c[column] + stmt.excluded[column]
+                for column in ROLLUP_COLUMNS
+            },
+        )
+    )
+
+
+def raw_score_rollups(assignee_ids=None):
+    """
+    Сводка, посчитанная заново по таблице evaluations и её архиву.
+    """
+    scores = []
+    for evaluation, task in [(Evaluation, Task), (EvaluationArchive, TaskArchive)]:
+        stmt = (
+            select(task.assignee_id, evaluation.score, evaluation.evaluated_at)
+            .join(task, evaluation.task_id == task.id)
+            .where(task.assignee_id.is_not(None))
+        )
+        if assignee_ids is not None:
+            stmt = stmt.where(task.assignee_id.in_(assignee_ids))
+        scores.append(stmt)
+    scores = union_all(*scores).subquery()
+
+    day = type_coerce(func.date(scores.c.evaluated_at), Date)
+    return select(
+        scores.c.assignee_id,
+        day.label("day"),
+        func.sum(scores.c.score).label("score_sum"),
+        func.count().label("score_count"),
+        *[
+            func.sum(case((scores.c.score == s, 1), else_=0)).label(f"count_{s}")
+            for s in SCORES
+        ],
+    ).group_by(scores.c.assignee_id, day)
+
+
+async def rebuild_score_rollups(db: AsyncSession, assignee_ids=None) -> int:
+    """
+    Пересчёт сводки по исходным оценкам: целиком или для указанных
+    исполнителей. Вызывающий код делает commit.
+    """
+    stmt = delete(EvaluationDailyScore)
+    if assignee_ids is not None:
+        assignee_ids = {i for i in assignee_ids if i is not None}
+        if not assignee_ids:
+            return 0
+        stmt = stmt.where(EvaluationDailyScore.assignee_id.in_(assignee_ids))
+    await db.execute(stmt)
+
+    result = await db.execute(
+        insert(EvaluationDailyScore).from_select(
+            ["assignee_id", "day"] + ROLLUP_COLUMNS, raw_score_rollups(assignee_ids)
+        )
+    )
+    return result.rowcount
+
+
+async def rebuild_task_score_rollups(db: AsyncSession, task_ids) -> None:
+    """
+    Пересчёт сводки исполнителей указанных задач (правки оценок в админке).
+    """
+    result = await db.execute(
+        select(Task.assignee_id).where(Task.id.in_(set(task_ids))).distinct()
+    )
+    await rebuild_score_rollups(db, result.scalars().all())
+
+
+async def check_score_rollups(db: AsyncSession) -> list:
+    """
+    Расхождения сводки с исходными оценками: пустой список - всё сходится.
+    """
+    expected = {
+        (row.assignee_id, row.day): tuple(row[2:])
+        for row in await db.execute(raw_score_rollups())
+    }
+    actual = {
+        (row.assignee_id, row.day): tuple(row[2:])
+        for row in await db.execute(
+            select(
+                EvaluationDailyScore.assignee_id,
+                EvaluationDailyScore.day,
+                *[getattr(EvaluationDailyScore, c) for c in ROLLUP_COLUMNS],
+            )
+        )
+    }
+
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        if expected.get(key) != actual.get(key):
+            mismatches.append(
+                {
+                    "assignee_id": key[0],
+                    "day": key[1],
+                    "expected": expected.get(key),
+                    "actual": actual.get(key),
+                }
+            )
+    return mismatches
+
+
+async def create_evaluation(
+    db: AsyncSession, current_user: User, evaluation_data: EvaluationCreate
+):
+    """
+    Оценка выполненной задачи своей команды (от 1 до 5).
+    """
+    if not (1 <= evaluation_data.score <= 5):
+        raise HTTPException(status_code=400, detail="Оценка должны быть от 1 до 5")
+
+    result = await db.execute(
+        select(Task).where(
+            Task.id == evaluation_data.task_id, Task.team_id == current_user.team_id
+        )
+    )
+    task = result.scalars().first()
+    if not task:
+        raise HTTPException(
+            status_code=404, detail="Задача не найдена или вы не в команде"
+        )
+
+    if task.status != TaskStatus.done:
+        raise HTTPException(
+            status_code=400, detail="Оценивать можно только выполненые задачи"
+        )
+
+    result = await db.execute(
+        select(Evaluation).where(Evaluation.task_id == evaluation_data.task_id)
+    )
+
+    if result.scalars().first():
+        raise HTTPException(status_code=400, detail="Задача уже оценена")
+
+    evaluation = Evaluation(
+        task_id=evaluation_data.task_id,
+        user_id=current_user.id,
+        score=evaluation_data.score,
+        evaluated_at=datetime.utcnow(),
+    )
+
+    db.add(evaluation)
+    if task.assignee_id is not None:
+        await add_to_score_rollup(
+            db, task.assignee_id, evaluation.evaluated_at.date(), evaluation.score
+        )
+    await db.commit()
+    analytics_cache.invalidate(task.team_id)
+    await db.refresh(evaluation)
+    return evaluation
+
+
+async def get_user_evaluations(
+    db: AsyncSession,
+    current_user: User,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+):
+    """
+    Оценки задач, где пользователь - исполнитель, от новых к старым.
+    Ключ страницы - id: он растёт вместе с evaluated_at (server_default now()).
+    Архив читается, только когда страница заходит за его границу.
+    """
+    hot, archived = [
+        select(
+            evaluation.id,
+            evaluation.task_id,
+            evaluation.user_id,
+            evaluation.score,
+            evaluation.evaluated_at,
+        )
+        .join(task, evaluation.task_id == task.id)
+        .where(task.assignee_id == current_user.id)
+        for evaluation, task in [(Evaluation, Task), (EvaluationArchive, TaskArchive)]
+    ]
+    return await paginate_with_archive(
+        db, hot, archived, "evaluated_at", cursor, limit, with_total
+    )
+
+
+async def get_user_evaluations_expanded(
+    db: AsyncSession,
+    current_user: User,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+):
+    """
+    Оценки пользователя вместе с данными задачи и именем оценившего.
+    Один запрос с JOIN вместо запроса задачи на каждую оценку.
+    """
+    evaluator = aliased(User)
+    hot, archived = [
+        select(
+            evaluation.id,
+            evaluation.task_id,
+            evaluation.user_id,
+            evaluation.score,
+            evaluation.evaluated_at,
+            task.title.label("task_title"),
+            task.status.label("task_status"),
+            task.deadline.label("task_deadline"),
+            func.coalesce(evaluator.full_name, evaluator.email).label(
+                "evaluator_name"
+            ),
+        )
+        .join(task, evaluation.task_id == task.id)
+        .outerjoin(evaluator, evaluation.user_id == evaluator.id)
+        .where(task.assignee_id == current_user.id)
+        for evaluation, task in [(Evaluation, Task), (EvaluationArchive, TaskArchive)]
+    ]
+    return await paginate_with_archive(
+        db, hot, archived, "evaluated_at", cursor, limit, with_total
+    )
+
+
+def score_window(
+    period: str, date_from: Optional[date] = None, date_to: Optional[date] = None
+):
+    """
+    Окно [start, end] в днях: week, month, quarter (до сегодня включительно)
+    или custom с date_from и date_to.
+    """
+    if period == "custom":
+        if date_from is None or date_to is None:
+            raise HTTPException(
+                status_code=400, detail="Для period=custom нужны date_from и date_to"
+            )
+        if date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from должна быть не позже date_to"
+            )
+        if (date_to - date_from).days >= SCORE_PERIOD_MAX_DAYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Период не больше {SCORE_PERIOD_MAX_DAYS} дней",
+            )
+        return date_from, date_to
+
+    if period not in SCORE_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail="period должен быть 'week', 'month', 'quarter' или 'custom'",
+        )
+    today = datetime.utcnow().date()
+    return today - timedelta(days=SCORE_PERIODS[period] - 1), today
+
+
+async def get_score_totals(db: AsyncSession, user_id: int, start: date, end: date):
+    result = await db.execute(
+        select(
+            *[func.sum(getattr(EvaluationDailyScore, c)) for c in ROLLUP_COLUMNS]
+        ).where(
+            EvaluationDailyScore.assignee_id == user_id,
+            EvaluationDailyScore.day >= start,
+            EvaluationDailyScore.day <= end,
+        )
+    )
+    return [value or 0 for value in result.one()]
+
+
+async def get_average_score(
+    db: AsyncSession,
+    current_user: User,
+    period: str = "week",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    """
+    Средняя оценка за период по дневной сводке.
+    """
+    start, end = score_window(period, date_from, date_to)
+    score_sum, score_count, *_ = await get_score_totals(
+        db, current_user.id, start, end
+    )
+    return {
+        "average_score": round(score_sum / score_count, 2) if score_count else 0.0,
+        "count": score_count,
+        "from": start,
+        "to": end,
+    }
+
+
+async def get_score_trend(
+    db: AsyncSession,
+    current_user: User,
+    period: str = "month",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    bucket: str = "day",
+):
+    """
+    Средняя оценка по дням или неделям периода. Пустые интервалы
+    тоже возвращаются (count 0, average null).
+    """
+    start, end = score_window(period, date_from, date_to)
+    if bucket not in ("day", "week"):
+        raise HTTPException(
+            status_code=400, detail="bucket должен быть 'day' или 'week'"
+        )
+    size = 7 if bucket == "week" else 1
+
+    points = []
+    for offset in range(0, (end - start).days + 1, size):
+        points.append({"start": start + timedelta(days=offset), "sum": 0, "count": 0})
+
+    result = await db.execute(
+        select(
+            EvaluationDailyScore.day,
+            EvaluationDailyScore.score_sum,
+            EvaluationDailyScore.score_count,
+        ).where(
+            EvaluationDailyScore.assignee_id == current_user.id,
+            EvaluationDailyScore.day >= start,
+            EvaluationDailyScore.day <= end,
+        )
+    )
+    for day, score_sum, score_count in result:
+        point = points[(day - start).days // size]
+        point["sum"] += score_sum
+        point["count"] += score_count
+
+    return {
+        "from": start,
+        "to": end,
+        "bucket": bucket,
+        "points": [
+            {
+                "start": point["start"],
+                "average": (
+                    round(point["sum"] / point["count"], 2) if point["count"] else None
+                ),
+                "count": point["count"],
+            }
+            for point in points
+        ],
+    }
+
+
+async def get_score_percentiles(
+    db: AsyncSession,
+    current_user: User,
+    period: str = "month",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    """
+    Процентили оценок за период (метод ближайшего ранга)
+    по числу оценок каждого значения в сводке.
+    """
+    start, end = score_window(period, date_from, date_to)
+    _, score_count, *counts = await get_score_totals(db, current_user.id, start, end)
+
+    percentiles = {}
+    for p in SCORE_PERCENTILES:
+        value = None
+        if score_count:
+            rank = max(1, -(-p * score_count // 100))
+            seen = 0
+            for score, count in zip(SCORES, counts):
+                seen += count
+                if seen >= rank:
+                    value = score
+                    break
+        percentiles[f"p{p}"] = value
+
+    return {"from": start, "to": end, "count": score_count, "percentiles": percentiles}
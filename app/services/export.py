@@ -0,0 +1,189 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, List
+
+from decouple import config
+from fastapi import HTTPException
+from sqlalchemy import select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import EvaluationArchive, MeetingArchive, TaskArchive
+from app.models.evaluation import Evaluation
+from app.models.meeting import Meeting
+from app.models.task import Task
+from app.models.team import Team
+from app.models.user import RoleEnum, User
+
+# Строк на одну выборку из курсора и на один кусок ответа
+EXPORT_BATCH_SIZE = int(config("EXPORT_BATCH_SIZE", 1000))
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def export_queries(team_id: int) -> dict:
+    """
+    Запросы выгрузки по сущностям, в порядке id (индексы по team_id).
+    Выгрузка - за всё время, поэтому архивные строки тоже входят.
+    """
+    parts = {"tasks": [], "meetings": [], "evaluations": []}
+    for task, meeting, evaluation in [
+        (Task, Meeting, Evaluation),
+        (TaskArchive, MeetingArchive, EvaluationArchive),
+    ]:
+        parts["tasks"].append(
+            select(
+                task.id,
+                task.title,
+                task.description,
+                task.status,
+                task.deadline,
+                task.created_at,
+                task.completed_at,
+                task.creator_id,
+                task.assignee_id,
+            ).where(task.team_id == team_id)
+        )
+        parts["meetings"].append(
+            select(
+                meeting.id,
+                meeting.title,
+                meeting.description,
+                meeting.start_time,
+                meeting.end_time,
+            ).where(meeting.team_id == team_id)
+        )
+        parts["evaluations"].append(
+            select(
+                evaluation.id,
+                evaluation.task_id,
+                evaluation.user_id.label("evaluator_id"),
+                task.assignee_id,
+                evaluation.score,
+                evaluation.evaluated_at,
+            )
+            .join(task, task.id == evaluation.task_id)
+            .where(task.team_id == team_id)
+        )
+
+    queries = {}
+    for entity, selects in parts.items():
+        rows = union_all(*selects).subquery()
+        queries[entity] = select(rows).order_by(rows.c.id)
+    return queries
+
+
+EXPORT_ENTITIES = tuple(export_queries(0))
+
+
+def parse_entities(entities: str) -> List[str]:
+    """
+    "tasks,meetings" -> ["tasks", "meetings"] с проверкой имён.
+    """
+    names = [name.strip() for name in entities.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPORT_ENTITIES]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400,
+            detail=f"entities - через запятую из: {', '.join(EXPORT_ENTITIES)}",
+        )
+    return list(dict.fromkeys(names))
+
+
+def export_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def check_export_access(db: AsyncSession, current_user: User, team_id: int):
+    """
+    Выгрузка - только своей команды (admin и суперпользователь - любой).
+    """
+    if current_user.role != RoleEnum.admin and not current_user.is_superuser:
+        if current_user.team_id != team_id:
+            raise HTTPException(
+                status_code=403, detail="Нет доступа к объекту из другой команды"
+            )
+
+    result = await db.execute(select(Team.id).where(Team.id == team_id))
+    if result.scalar() is None:
+        raise HTTPException(status_code=404, detail="Команда не найдена")
+
+
+async def export_rows(
+    db: AsyncSession, team_id: int, entities: List[str]
+) -> AsyncIterator[tuple]:
+    """
+    Пачки строк (сущность, ключи, строки) по EXPORT_BATCH_SIZE.
+    db.stream - серверный курсор: в памяти только текущая пачка.
+    """
+    queries = export_queries(team_id)
+    for entity in entities:
+        result = await db.stream(
+            queries[entity].execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        keys = list(result.keys())
+        async for rows in result.partitions():
+            yield entity, keys, rows
+
+
+async def export_ndjson(
+    db: AsyncSession, team_id: int, entities: List[str]
+) -> AsyncIterator[str]:
+    """
+    По строке JSON на объект: {"entity": "tasks", "id": ..., ...}.
+    """
+    async for entity, keys, rows in export_rows(db, team_id, entities):
+        yield "".join(
+            json.dumps(
+                {"entity": entity, **{k: export_value(v) for k, v in zip(keys, row)}},
+                ensure_ascii=False,
+            )
+            + "\n"
+            for row in rows
+        )
+
+
+async def export_csv(
+    db: AsyncSession, team_id: int, entities: List[str]
+) -> AsyncIterator[str]:
+    """
+    Один CSV на все сущности: первый столбец entity, дальше объединение
+    столбцов выбранных сущностей (чужие столбцы строки пустые).
+    """
+    columns = []
+    for entity in entities:
+        for column in export_queries(team_id)[entity].selected_columns:
+            if column.key not in columns:
+                columns.append(column.key)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["entity", *columns])
+    yield buffer.getvalue()
+
+    async for entity, keys, rows in export_rows(db, team_id, entities):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            values = dict(zip(keys, row))
+            writer.writerow(
+                [entity, *(export_value(values.get(c)) for c in columns)]
+            )
+        yield buffer.getvalue()
+
+
+def export_team(
+    db: AsyncSession, team_id: int, entities: List[str], export_format: str
+) -> AsyncIterator[str]:
+    if export_format == "csv":
+        return export_csv(db, team_id, entities)
+    return export_ndjson(db, team_id, entities)
@@ -0,0 +1,280 @@
+from datetime import date, datetime, timedelta
+from fastapi import HTTPException
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select
+from sqlalchemy.orm import selectinload
+
+from app.models.user import User, RoleEnum
+from app.models.meeting import Meeting
+from app.models.meeting_participant import (
+    MeetingParticipant,
+    MEETING_OVERLAP_CONSTRAINT,
+)
+from app.schemas.meeting import MeetingCreate
+from app.services.calendar import bump_calendar_versions
+from app.utils.availability import SlotGrid
+from app.utils.pagination import paginate
+
+# Максимальное окно поиска свободного времени, дней
+AVAILABILITY_MAX_DAYS = 62
+
+
+async def find_conflicts(
+    db: AsyncSession, user_ids: list, start_time: datetime, end_time: datetime
+) -> list:
+    """
+    Встречи пользователей user_ids, пересекающиеся с [start_time, end_time).
+    Условие без функций над столбцами, чтобы работали индексы.
+    """
+    result = await db.execute(
+        select(
+            MeetingParticipant.user_id,
+            User.email,
+            Meeting.id,
+            Meeting.title,
+            Meeting.start_time,
+            Meeting.end_time,
+        )
+        .join(Meeting, MeetingParticipant.meeting_id == Meeting.id)
+        .join(User, MeetingParticipant.user_id == User.id)
+        .where(
+            MeetingParticipant.user_id.in_(user_ids),
+            Meeting.start_time < end_time,
+            Meeting.end_time > start_time,
+        )
+        .order_by(MeetingParticipant.user_id, Meeting.start_time)
+    )
+    return [
+        {
+            "user_id": row.user_id,
+            "email": row.email,
+            "meeting_id": row.id,
+            "title": row.title,
+            "start_time": row.start_time.isoformat(),
+            "end_time": row.end_time.isoformat(),
+        }
+        for row in result
+    ]
+
+
+async def get_team_participants(
+    db: AsyncSession, current_user: User, participant_ids: list
+):
+    """
+    Участники встречи; все должны быть в команде текущего пользователя.
+    """
+    # Проверка: пользователь в команде
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+
+    # Проверка: все участники - из одной команды
+    participants = await db.execute(select(User).where(User.id.in_(participant_ids)))
+    participants = participants.scalars().all()
+
+    if len(participants) != len(participant_ids):
+        raise HTTPException(
+            status_code=400, detail="Один или несколько участников не найдены"
+        )
+
+    for p in participants:
+        if p.team_id != current_user.team_id:
+            raise HTTPException(
+                status_code=400, detail="Все участники должны быть в одной команде"
+            )
+    return participants
+
+
+def overlap_enforced_by_db(db: AsyncSession) -> bool:
+    """
+    На PostgreSQL пересечения запрещает exclusion constraint,
+    на остальных СУБД (SQLite в тестах) нужна проверка перед вставкой.
+    """
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def is_overlap_violation(error: IntegrityError) -> bool:
+    return MEETING_OVERLAP_CONSTRAINT in str(error.orig)
+
+
+def conflicts_error(conflicts: list) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={
+            "message": "У участников есть пересекающиеся встречи",
+            "conflicts": conflicts,
+        },
+    )
+
+
+async def create_meeting(
+    db: AsyncSession, current_user: User, meeting_data: MeetingCreate
+):
+    """
+    Создание встречи с проверкой пересечения времени для всех участников.
+    """
+    participants = await get_team_participants(
+        db, current_user, meeting_data.participant_ids
+    )
+
+    if meeting_data.start_time >= meeting_data.end_time:
+        raise HTTPException(
+            status_code=400,
+            detail="Время начала должно быть раньше времени окончания"
+        )
+
+    # Проверяем, что start_time и end_time в один и тот же день
+    if meeting_data.start_time.date() != meeting_data.end_time.date():
+        raise HTTPException(
+            status_code=400,
+            detail="Встреча должна начинаться и заканчиваться в один день"
+        )
+
+    # Без ограничения в БД - проверка пересечений до вставки
+    # (все пары участник-встреча одним запросом)
+    optimistic = overlap_enforced_by_db(db)
+    if not optimistic:
+        conflicts = await find_conflicts(
+            db,
+            meeting_data.participant_ids,
+            meeting_data.start_time,
+            meeting_data.end_time,
+        )
+        if conflicts:
+            raise conflicts_error(conflicts)
+
+    # Создаем встречу
+    meeting = Meeting(
+        title=meeting_data.title,
+        description=meeting_data.description,
+        start_time=meeting_data.start_time,
+        end_time=meeting_data.end_time,
+        team_id=current_user.team_id,
+    )
+
+    db.add(meeting)
+    await db.flush()  # Чтобы получить ID
+
+    # Добавляем участников (один executemany). На PostgreSQL пересечение
+    # отклонит exclusion constraint, в том числе при параллельных запросах.
+    try:
+        await db.execute(
+            insert(MeetingParticipant),
+            [
+                {
+                    "meeting_id": meeting.id,
+                    "user_id": p.id,
+                    "start_time": meeting.start_time,
+                    "end_time": meeting.end_time,
+                }
+                for p in participants
+            ],
+        )
+        await bump_calendar_versions(db, [p.id for p in participants])
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not (optimistic and is_overlap_violation(e)):
+            raise
+        conflicts = await find_conflicts(
+            db,
+            meeting_data.participant_ids,
+            meeting_data.start_time,
+            meeting_data.end_time,
+        )
+        raise conflicts_error(conflicts)
+    await db.refresh(meeting)
+    return meeting
+
+
+async def find_free_slots(
+    db: AsyncSession,
+    current_user: User,
+    participant_ids: list,
+    date_from: date,
+    date_to: date,
+    duration: int,
+    limit: int = 10,
+):
+    """
+    Ближайшие общие свободные слоты длиной duration минут в рабочее время.
+    Занятость всех участников загружается одним запросом по диапазону.
+    """
+    await get_team_participants(db, current_user, participant_ids)
+
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=400, detail="date_from должна быть не позже date_to"
+        )
+    if (date_to - date_from).days >= AVAILABILITY_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Окно поиска не больше {AVAILABILITY_MAX_DAYS} дней",
+        )
+
+    # DISTINCT: общая встреча нескольких участников - один интервал
+    grid = SlotGrid(date_from, date_to)
+    result = await db.execute(
+        select(MeetingParticipant.start_time, MeetingParticipant.end_time)
+        .where(
+            MeetingParticipant.user_id.in_(participant_ids),
+            MeetingParticipant.start_time < grid.end,
+            MeetingParticipant.end_time > grid.start,
+        )
+        .distinct()
+    )
+    grid.add_busy_intervals(result.all())
+
+    return [
+        {"start_time": start, "end_time": end}
+        for start, end in grid.free_slots(timedelta(minutes=duration), limit)
+    ]
+
+
+async def get_user_meetings(
+    db: AsyncSession,
+    current_user: User,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+):
+    """
+    Встречи, в которых учавствует пользователь, по времени начала.
+    """
+    return await paginate(
+        db,
+        select(Meeting)
+        .join(Meeting.participants)
+        .where(MeetingParticipant.user_id == current_user.id),
+        [Meeting.start_time, Meeting.id],
+        cursor,
+        limit,
+        with_total=with_total,
+    )
+
+
+async def delete_meeting(db: AsyncSession, current_user: User, meeting_id: int):
+    # Команда нужна для проверки прав, участники - для каскада и ленты ICS
+    result = await db.execute(
+        select(Meeting)
+        .options(selectinload(Meeting.team), selectinload(Meeting.participants))
+        .where(Meeting.id == meeting_id)
+    )
+
+    meeting = result.scalars().first()
+
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Встреча не найдена")
+
+    # Проверка прав
+    if (
+        meeting.team.creator_id != current_user.id
+        and current_user.role != RoleEnum.admin
+    ):
+        raise HTTPException(status_code=403, detail="Нет парв на удаление")
+
+    participant_ids = [p.user_id for p in meeting.participants]
+    await db.delete(meeting)
+    await bump_calendar_versions(db, participant_ids)
+    await db.commit()
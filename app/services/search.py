@@ -0,0 +1,269 @@
+import html
+import re
+from decouple import config
+from fastapi import HTTPException
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Float,
+    Integer,
+    String,
+    and_,
+    case,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    true,
+    tuple_,
+    union_all,
+)
+
+from app.models.comment import Comment
+from app.models.search import SEARCH_CONFIG
+from app.models.task import Task
+from app.models.user import User
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Слов в запросе (остальные отбрасываются)
+SEARCH_MAX_TERMS = int(config("SEARCH_MAX_TERMS", 8))
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Виртуальная таблица FTS5 (SQLite), см. app/models/search.py
+search_index = table(
+    "search_index",
+    column("rowid", Integer),
+    column("title", String),
+    column("body", String),
+    column("team_id", Integer),
+)
+
+
+def search_terms(q: str) -> list:
+    """
+    Слова запроса: только буквы и цифры, так что их можно подставлять
+    в синтаксис tsquery и FTS5 без экранирования.
+    """
+    terms = re.findall(r"\w+", q.lower())[:SEARCH_MAX_TERMS]
+    if not terms:
+        raise HTTPException(status_code=400, detail="Пустой поисковый запрос")
+    return terms
+
+
+def highlight_text(text: Optional[str], terms: list, words: int = 0) -> str:
+    """
+    Выделение слов запроса (как префиксов) - для SQLite, где ts_headline нет.
+    words > 0 - фрагмент из стольких слов вокруг первого совпадения.
+    Текст экранируется для HTML, разметка - только HIGHLIGHT_START/STOP.
+    """
+    if not text:
+        return ""
+    pattern = re.compile(
+        r"\b(?:%s)\w*" % "|".join(re.escape(t) for t in terms), re.IGNORECASE
+    )
+    if words:
+        tokens = text.split()
+        first = next((i for i, t in enumerate(tokens) if pattern.search(t)), 0)
+        start = max(0, min(first - words // 3, len(tokens) - words))
+        text = " ".join(tokens[start : start + words])
+        if start > 0:
+            text = "… " + text
+        if start + words < len(tokens):
+            text += " …"
+
+    parts, position = [], 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[position : match.start()]))
+        parts.append(f"{HIGHLIGHT_START}{html.escape(match.group(0))}{HIGHLIGHT_STOP}")
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return "".join(parts)
+
+
+def html_escape(text):
+    """
+    Экранирование для HTML в SQL (как html.escape) - до ts_headline,
+    чтобы в результате разметкой были только HIGHLIGHT_START/STOP.
+    """
+    text = func.coalesce(text, "")
+    for char, entity in [
+        ("&", "&amp;"),
+        ("<", "&lt;"),
+        (">", "&gt;"),
+        ('"', "&quot;"),
+        ("'", "&#x27;"),
+    ]:
+        text = func.replace(text, char, entity)
+    return text
+
+
+def postgres_hits(team_id: int, terms: list):
+    """
+    Совпадения в задачах и комментариях команды с рангом ts_rank_cd.
+    Каждое слово - префикс (задач:*), все слова обязательны.
+    """
+    query = func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{t}:*" for t in terms))
+    task_vector = literal_column("tasks.search_vector")
+    comment_vector = literal_column("comments.search_vector")
+    tasks = select(
+        literal("task").label("kind"),
+        Task.id.label("id"),
+        Task.id.label("task_id"),
+        func.ts_rank_cd(task_vector, query).label("rank"),
+    ).where(Task.team_id == team_id, task_vector.op("@@")(query))
+    comments = (
+        select(
+            literal("comment").label("kind"),
+            Comment.id.label("id"),
+            Comment.task_id.label("task_id"),
+            func.ts_rank_cd(comment_vector, query).label("rank"),
+        )
+        .join(Task, Task.id == Comment.task_id)
+        .where(Task.team_id == team_id, comment_vector.op("@@")(query))
+    )
+    return union_all(tasks, comments).subquery("hits"), query
+
+
+def headline(text, query, highlight_all: bool = False):
+    options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}"
+    if highlight_all:
+        options += ", HighlightAll=true"
+    else:
+        options += ", MaxWords=30, MinWords=10"
+    return func.ts_headline(SEARCH_CONFIG, html_escape(text), query, options)
+
+
+def after_cursor(hits, cursor: Optional[str]):
+    """
+    Строки после курсора при порядке rank DESC, kind, id.
+    """
+    if not cursor:
+        return true()
+    rank, kind, item_id = decode_cursor(cursor, [hits.c.rank, hits.c.kind, hits.c.id])
+    return or_(
+        hits.c.rank < literal(rank, Float),
+        and_(
+            hits.c.rank == literal(rank, Float),
+            tuple_(hits.c.kind, hits.c.id) > tuple_(literal(kind), literal(item_id)),
+        ),
+    )
+
+
+def sqlite_search(team_id: int, terms: list, cursor: Optional[str], limit: int):
+    """
+    Поиск по FTS5: страница по рангу, затем текст её строк по rowid.
+    bm25 меньше - лучше, поэтому ранг с обратным знаком; столбец team_id
+    в ранге не участвует. highlight() и snippet() здесь не подходят: во
+    внешнем запросе они повторяют MATCH для каждой строки страницы.
+    """
+    fts = literal_column("search_index")
+    phrases = " ".join(f'"{t}"*' for t in terms)
+    match = fts.match(f'team_id : "{team_id}" AND {{title body}} : ({phrases})')
+    rowid = search_index.c.rowid
+    hits = (
+        select(
+            rowid,
+            case((rowid % 2 == 1, "comment"), else_="task").label("kind"),
+            (rowid // 2).label("id"),
+            (-func.bm25(fts, 10.0, 1.0, 0.0)).label("rank"),
+        )
+        .where(match)
+        .subquery("hits")
+    )
+    page = (
+        select(hits)
+        .where(after_cursor(hits, cursor))
+        .order_by(hits.c.rank.desc(), hits.c.kind, hits.c.id)
+        .limit(limit + 1)
+        .subquery("page")
+    )
+    task_id = func.coalesce(Comment.task_id, page.c.id)
+    return (
+        select(
+            page.c.kind,
+            page.c.id,
+            task_id.label("task_id"),
+            page.c.rank,
+            Task.title,
+            search_index.c.body.label("snippet"),
+        )
+        .select_from(page)
+        .join(search_index, rowid == page.c.rowid)
+        .outerjoin(Comment, and_(page.c.kind == "comment", Comment.id == page.c.id))
+        .join(Task, Task.id == task_id)
+        .order_by(page.c.rank.desc(), page.c.kind, page.c.id)
+    )
+
+
+async def search(
+    db: AsyncSession,
+    current_user: User,
+    q: str,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+):
+    """
+    Поиск по названиям и описаниям задач и по комментариям своей команды.
+    Результаты - по убыванию релевантности, совпадения в title и snippet
+    выделены HIGHLIGHT_START/HIGHLIGHT_STOP, остальной текст экранирован
+    для HTML.
+    Пагинация: cursor - ранг и ключ последнего результата.
+    """
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+    terms = search_terms(q)
+
+    if db.get_bind().dialect.name == "postgresql":
+        hits, query = postgres_hits(current_user.team_id, terms)
+        # Выделение (ts_headline) дорогое - только для строк страницы
+        page = (
+            select(hits)
+            .where(after_cursor(hits, cursor))
+            .order_by(hits.c.rank.desc(), hits.c.kind, hits.c.id)
+            .limit(limit + 1)
+            .subquery("page")
+        )
+        stmt = (
+            select(
+                page.c.kind,
+                page.c.id,
+                page.c.task_id,
+                page.c.rank,
+                headline(Task.title, query, highlight_all=True).label("title"),
+                headline(
+                    case(
+                        (page.c.kind == "comment", Comment.content),
+                        else_=Task.description,
+                    ),
+                    query,
+                ).label("snippet"),
+            )
+            .join(Task, Task.id == page.c.task_id)
+            .outerjoin(
+                Comment, and_(page.c.kind == "comment", Comment.id == page.c.id)
+            )
+            .order_by(page.c.rank.desc(), page.c.kind, page.c.id)
+        )
+    else:
+        stmt = sqlite_search(current_user.team_id, terms, cursor, limit)
+
+    rows = (await db.execute(stmt)).mappings().all()
+    if db.get_bind().dialect.name != "postgresql":
+        rows = [
+            {
+                **row,
+                "title": highlight_text(row["title"], terms),
+                "snippet": highlight_text(row["snippet"], terms, words=24),
+            }
+            for row in rows
+        ]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([last["rank"], last["kind"], last["id"]])
+    return {"items": rows, "next_cursor": next_cursor, "total_estimate": None}
@@ -0,0 +1,489 @@
+from collections import Counter
+from decouple import config
+from fastapi import HTTPException
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.core.analytics_cache import analytics_cache
+from app.models.comment import Comment
+from app.models.evaluation import Evaluation
+from app.models.task import Task, TaskStatus
+from app.models.user import User, RoleEnum
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskDetailOut,
+    TaskFilter,
+    TaskOut,
+    TaskUpdate,
+)
+from app.schemas.user import UserShort
+from app.services.calendar import bump_calendar_versions
+from app.services.evaluation import rebuild_score_rollups
+from app.services.team import change_team_counters, task_status_deltas
+from app.utils.pagination import paginate
+
+
+async def create_task(db: AsyncSession, current_user: User, task_data: TaskCreate):
+    """
+    Создание задачи в команде текущего пользователя.
+    """
+    # Проверка: команда сущуствует и пользователь в ней
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+
+    # Проверка исполнителя (если указан)
+    if task_data.assignee_id:
+        result = await db.execute(
+            select(User).where(
+                User.id == task_data.assignee_id, User.team_id == current_user.team_id
+            )
+        )
+        assignee = result.scalars().first()
+        if not assignee:
+            raise HTTPException(
+                status_code=400, detail="Исполнитель не найден или не в вашей команде"
+            )
+
+    task = Task(
+        **task_data.model_dump(exclude_unset=True),
+        creator_id=current_user.id,
+        team_id=current_user.team_id,
+        status=TaskStatus.open
+    )
+    db.add(task)
+    await change_team_counters(
+        db, task.team_id, task_status_deltas(new_status=task.status)
+    )
+    await bump_calendar_versions(db, [task.assignee_id])
+    await db.commit()
+    analytics_cache.invalidate(task.team_id)
+    await db.refresh(task)
+    return task
+
+
+# Максимум задач в одном запросе /tasks/bulk
+TASK_BULK_MAX = int(config("TASK_BULK_MAX", 1000))
+
+
+def bulk_error(index: int, status_code: int, detail: str) -> dict:
+    return {"index": index, "status_code": status_code, "task": None, "error": detail}
+
+
+def bulk_result(mode: str, results: list) -> dict:
+    """
+    Итог bulk-запроса. В режиме atomic при любой ошибке ничего
+    не сохраняется: 400 со списком ошибок по позициям.
+    """
+    errors = [r for r in results if r["error"]]
+    if mode == "atomic" and errors:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Задачи не сохранены: есть ошибки", "errors": errors},
+        )
+    return {
+        "mode": mode,
+        "succeeded": len(results) - len(errors),
+        "failed": len(errors),
+        "items": results,
+    }
+
+
+async def get_team_member_ids(db: AsyncSession, current_user: User, user_ids) -> set:
+    """
+    Какие из user_ids состоят в команде текущего пользователя (один IN).
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return set()
+
+    result = await db.execute(
+        select(User.id).where(
+            User.id.in_(user_ids), User.team_id == current_user.team_id
+        )
+    )
+    return set(result.scalars())
+
+
+async def create_tasks_bulk(
+    db: AsyncSession, current_user: User, bulk_data: TaskBulkCreate
+):
+    """
+    Создание задач пачкой: исполнители проверяются одним запросом,
+    вставка - один INSERT ... RETURNING на все задачи.
+    """
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+    if len(bulk_data.items) > TASK_BULK_MAX:
+        raise HTTPException(
+            status_code=400, detail=f"Не больше {TASK_BULK_MAX} задач за запрос"
+        )
+
+    members = await get_team_member_ids(
+        db, current_user, [item.assignee_id for item in bulk_data.items]
+    )
+
+    results = [None] * len(bulk_data.items)
+    rows, positions = [], []
+    for index, item in enumerate(bulk_data.items):
+        if item.assignee_id is not None and item.assignee_id not in members:
+            results[index] = bulk_error(
+                index, 400, "Исполнитель не найден или не в вашей команде"
+            )
+            continue
+        rows.append(
+            {
+                **item.model_dump(),
+                "creator_id": current_user.id,
+                "team_id": current_user.team_id,
+                "status": TaskStatus.open,
+            }
+        )
+        positions.append(index)
+
+    if any(r is not None for r in results) and bulk_data.mode == "atomic":
+        return bulk_result(bulk_data.mode, [r for r in results if r is not None])
+
+    if rows:
+        # Многострочный INSERT ... RETURNING; строки результата - в порядке
+        # параметров, так что задача сопоставляется со своим индексом
+        tasks = await db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True), rows
+        )
+        for index, task in zip(positions, tasks.all()):
+            results[index] = {
+                "index": index,
+                "status_code": 201,
+                "task": TaskOut.model_validate(task),
+                "error": None,
+            }
+        await change_team_counters(
+            db,
+            current_user.team_id,
+            task_status_deltas(new_status=TaskStatus.open, count=len(rows)),
+        )
+        await bump_calendar_versions(db, [row["assignee_id"] for row in rows])
+        await db.commit()
+        analytics_cache.invalidate(current_user.team_id)
+
+    return bulk_result(bulk_data.mode, results)
+
+
+async def update_tasks_bulk(
+    db: AsyncSession, current_user: User, bulk_data: TaskBulkUpdate
+):
+    """
+    Изменение задач пачкой: задачи и исполнители загружаются двумя
+    запросами, изменения уходят одним flush (executemany по набору полей).
+    """
+    if len(bulk_data.items) > TASK_BULK_MAX:
+        raise HTTPException(
+            status_code=400, detail=f"Не больше {TASK_BULK_MAX} задач за запрос"
+        )
+
+    result = await db.execute(
+        select(Task)
+        .where(
+            Task.id.in_({item.id for item in bulk_data.items}),
+            Task.team_id == current_user.team_id,
+        )
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    tasks = {task.id: task for task in result.scalars()}
+    members = await get_team_member_ids(
+        db, current_user, [item.assignee_id for item in bulk_data.items]
+    )
+
+    results, valid, seen = [], [], set()
+    for index, item in enumerate(bulk_data.items):
+        task = tasks.get(item.id)
+        changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        if item.id in seen:
+            results.append(bulk_error(index, 400, "Задача указана несколько раз"))
+        elif task is None:
+            results.append(bulk_error(index, 404, "Задача не найдена"))
+        elif not can_edit_task(current_user, task):
+            results.append(bulk_error(index, 403, "Нет прав на редактивроение"))
+        elif changes.get("assignee_id") is not None and item.assignee_id not in members:
+            results.append(
+                bulk_error(index, 400, "Исполнитель не найден или не в вашей команде")
+            )
+        else:
+            results.append(None)
+            valid.append((index, task, changes))
+        seen.add(item.id)
+
+    if len(valid) < len(results) and bulk_data.mode == "atomic":
+        return bulk_result(bulk_data.mode, [r for r in results if r is not None])
+
+    affected, reassigned, deltas = [], [], Counter()
+    for index, task, changes in valid:
+        old_assignee, old_status = task.assignee_id, task.status
+        for key, value in changes.items():
+            setattr(task, key, value)
+        if "status" in changes:
+            set_completed_at(task)
+            deltas.update(task_status_deltas(old_status, task.status))
+        affected += [old_assignee, task.assignee_id]
+        if old_assignee != task.assignee_id:
+            reassigned += [old_assignee, task.assignee_id]
+
+    if valid:
+        await db.flush()
+        await change_team_counters(db, current_user.team_id, deltas)
+        await bump_calendar_versions(db, affected)
+        if reassigned:
+            await rebuild_score_rollups(db, reassigned)
+        for index, task, _ in valid:
+            results[index] = {
+                "index": index,
+                "status_code": 200,
+                "task": TaskOut.model_validate(task),
+                "error": None,
+            }
+        await db.commit()
+        analytics_cache.invalidate(current_user.team_id)
+
+    return bulk_result(bulk_data.mode, results)
+
+
+def set_completed_at(task: Task) -> None:
+    # Время выполнения фиксируется при переходе в done
+    if task.status == TaskStatus.done:
+        task.completed_at = task.completed_at or datetime.utcnow()
+    else:
+        task.completed_at = None
+
+
+# Ключи сортировки: столбцы keyset-ключа и направление.
+# created_at сортируется по id: id выдаются в порядке создания задач,
+# а (team_id, id) уже покрыт индексом.
+TASK_SORT_KEYS = {
+    "id": ([Task.id], False),
+    "-id": ([Task.id], True),
+    "created_at": ([Task.id], False),
+    "-created_at": ([Task.id], True),
+    "deadline": ([Task.deadline, Task.id], False),
+    "-deadline": ([Task.deadline, Task.id], True),
+}
+
+
+def apply_task_filter(stmt, current_user: User, filters: TaskFilter):
+    """
+    Фильтры списка задач в виде условий WHERE.
+    """
+    if filters.status:
+        stmt = stmt.where(Task.status.in_(filters.status))
+    if filters.assignee_id is not None:
+        stmt = stmt.where(Task.assignee_id == filters.assignee_id)
+    if filters.creator_id is not None:
+        stmt = stmt.where(Task.creator_id == filters.creator_id)
+    if filters.mine:
+        stmt = stmt.where(Task.assignee_id == current_user.id)
+    if filters.deadline_from is not None:
+        stmt = stmt.where(Task.deadline >= filters.deadline_from)
+    if filters.deadline_to is not None:
+        stmt = stmt.where(Task.deadline < filters.deadline_to)
+    if filters.created_from is not None:
+        stmt = stmt.where(Task.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        stmt = stmt.where(Task.created_at < filters.created_to)
+    if filters.overdue:
+        stmt = stmt.where(
+            Task.deadline < datetime.utcnow(), Task.status != TaskStatus.done
+        )
+    return stmt
+
+
+async def get_team_tasks(
+    db: AsyncSession,
+    current_user: User,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+    filters: Optional[TaskFilter] = None,
+    sort: str = "id",
+):
+    """
+    Задачи команды текущего пользователя с фильтрами, постранично
+    по ключу сортировки (индексы ix_tasks_team_id_*).
+    """
+    if sort not in TASK_SORT_KEYS:
+        raise HTTPException(status_code=400, detail="Неизвестный ключ сортировки")
+    order_columns, descending = TASK_SORT_KEYS[sort]
+
+    stmt = select(Task).where(Task.team_id == current_user.team_id)
+    if filters is not None:
+        stmt = apply_task_filter(stmt, current_user, filters)
+
+    return await paginate(
+        db,
+        stmt,
+        order_columns,
+        cursor,
+        limit,
+        descending=descending,
+        with_total=with_total,
+    )
+
+
+async def get_team_task(
+    db: AsyncSession, current_user: User, task_id: int, for_update: bool = False
+):
+    """
+    Задача команды текущего пользователя, иначе 404.
+    for_update - строка блокируется до commit: статус, от которого
+    считаются дельты счётчиков команды, не поменяется параллельно.
+    """
+    stmt = select(Task).where(Task.id == task_id, Task.team_id == current_user.team_id)
+    if for_update:
+        stmt = stmt.with_for_update()
+    result = await db.execute(stmt)
+
+    task = result.scalars().first()
+    if not task:
+        raise HTTPException(status_code=404, detail="Задача не найдена")
+    return task
+
+
+async def get_task_detail(db: AsyncSession, current_user: User, task_id: int):
+    """
+    Задача со всем, что нужно странице просмотра и редактирования:
+    создатель, исполнитель, комментарии, оценки и состав команды.
+    """
+    result = await db.execute(
+        select(Task)
+        .options(
+            joinedload(Task.creator),
+            joinedload(Task.assignee),
+            selectinload(Task.comments),
+            selectinload(Task.evaluations),
+        )
+        .where(Task.id == task_id, Task.team_id == current_user.team_id)
+    )
+
+    task = result.scalars().first()
+    if not task:
+        raise HTTPException(status_code=404, detail="Задача не найдена")
+
+    # Для выбора исполнителя достаточно id, имени и email
+    members = await db.execute(
+        select(User.id, User.full_name, User.email)
+        .where(User.team_id == task.team_id)
+        .order_by(User.id)
+    )
+
+    detail = TaskDetailOut.model_validate(task)
+    detail.team_members = [UserShort.model_validate(m) for m in members.mappings()]
+    return detail
+
+
+def can_edit_task(current_user: User, task: Task) -> bool:
+    return current_user.id == task.creator_id or current_user.role in [
+        RoleEnum.manager,
+        RoleEnum.admin,
+    ]
+
+
+async def update_task(
+    db: AsyncSession, current_user: User, task_id: int, task_data: TaskUpdate
+):
+    task = await get_team_task(db, current_user, task_id, for_update=True)
+
+    # Проверка: автор или менеджер
+    if not can_edit_task(current_user, task):
+        raise HTTPException(status_code=403, detail="Нет прав на редактивроение")
+
+    # Календарь меняется у прежнего и нового исполнителя
+    affected, old_status = [task.assignee_id], task.status
+    changes = task_data.model_dump(exclude_unset=True)
+    for key, value in changes.items():
+        setattr(task, key, value)
+    affected.append(task.assignee_id)
+    if "status" in changes:
+        set_completed_at(task)
+
+    db.add(task)
+    await change_team_counters(
+        db, task.team_id, task_status_deltas(old_status, task.status)
+    )
+    await bump_calendar_versions(db, affected)
+    if affected[0] != affected[1]:
+        # Оценки задачи переходят к новому исполнителю
+        await db.flush()
+        await rebuild_score_rollups(db, affected)
+    await db.commit()
+    analytics_cache.invalidate(task.team_id)
+    await db.refresh(task)
+    return task
+
+
+async def delete_task(db: AsyncSession, current_user: User, task_id: int):
+    task = await get_team_task(db, current_user, task_id, for_update=True)
+
+    if current_user.id != task.creator_id and current_user.role != RoleEnum.manager:
+        raise HTTPException(status_code=403, detail="Нет прав на удаление")
+
+    # Комментарии и оценки задачи обрабатывает ondelete внешних ключей.
+    # SQLite (тесты) без PRAGMA foreign_keys его не выполняет - делаем сами.
+    if db.get_bind().dialect.name != "postgresql":
+        await db.execute(delete(Comment).where(Comment.task_id == task.id))
+        await db.execute(
+            update(Evaluation)
+            .where(Evaluation.task_id == task.id)
+            .values(task_id=None)
+        )
+
+    await db.delete(task)
+    await change_team_counters(
+        db, task.team_id, task_status_deltas(old_status=task.status)
+    )
+    await bump_calendar_versions(db, [task.assignee_id])
+    # Оценки удалённой задачи выпадают из сводки
+    await db.flush()
+    await rebuild_score_rollups(db, [task.assignee_id])
+    await db.commit()
+    analytics_cache.invalidate(task.team_id)
+
+
+async def change_task_status(
+    db: AsyncSession,
+    current_user: User,
+    task_id: int,
+    from_status: TaskStatus,
+    to_status: TaskStatus,
+    error_detail: str,
+):
+    """
+    Перевод задачи исполнителем из статуса from_status в to_status.
+    """
+    result = await db.execute(
+        select(Task).where(Task.id == task_id).with_for_update()
+    )
+    task = result.scalars().first()
+    if not task:
+        raise HTTPException(status_code=404, detail="Задача не найдена")
+
+    # Проверка: пользователь — исполнитель
+    if task.assignee_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Вы не назначены на эту задачу")
+
+    if task.status != from_status:
+        raise HTTPException(status_code=400, detail=error_detail)
+
+    task.status = to_status
+    set_completed_at(task)
+    db.add(task)
+    await change_team_counters(
+        db, task.team_id, task_status_deltas(from_status, to_status)
+    )
+    await bump_calendar_versions(db, [task.assignee_id])
+    await db.commit()
+    analytics_cache.invalidate(task.team_id)
+    await db.refresh(task)
+    return task
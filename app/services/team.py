@@ -0,0 +1,211 @@
+from collections import Counter
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, union_all, update
+from typing import Optional
+from uuid import uuid4
+
+from app.models.archive import TaskArchive
+from app.models.task import Task, TaskStatus
+from app.models.team import Team
+from app.models.user import User, RoleEnum
+from app.schemas.team import TeamCreate
+from app.core.user_cache import user_cache
+from app.utils.pagination import paginate
+
+# Счётчик задач команды по статусу
+TASK_COUNTERS = {
+    TaskStatus.open: "open_task_count",
+    TaskStatus.in_progress: "in_progress_task_count",
+    TaskStatus.done: "done_task_count",
+}
+TEAM_COUNTERS = ["member_count"] + list(TASK_COUNTERS.values())
+
+
+def task_status_deltas(old_status=None, new_status=None, count: int = 1) -> Counter:
+    """
+    Изменения счётчиков задач при переходе old_status -> new_status
+    (None - задачи не было или больше нет).
+    """
+    deltas = Counter()
+    if old_status == new_status:
+        return deltas
+    if old_status in TASK_COUNTERS:
+        deltas[TASK_COUNTERS[old_status]] -= count
+    if new_status in TASK_COUNTERS:
+        deltas[TASK_COUNTERS[new_status]] += count
+    return deltas
+
+
+async def change_team_counters(db: AsyncSession, team_id: int, deltas) -> None:
+    """
+    Счётчики команды меняются в БД (counter + delta) в транзакции
+    вызывающего кода: параллельные изменения не теряются.
+    """
+    values = {
+        name: getattr(Team, name) + delta for name, delta in deltas.items() if delta
+    }
+    if team_id is None or not values:
+        return
+    await db.execute(
+        update(Team)
+        .where(Team.id == team_id)
+        .values(**values)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def create_team(db: AsyncSession, user: User, team_data: TeamCreate):
+    """
+    Создание команды с уникальным team_code.
+    """
+    # Поверка: имя команды уникально
+    result = await db.execute(select(Team).where(Team.name == team_data.name))
+    if result.scalars().first():
+        raise HTTPException(
+            status_code=400, detail="Команда с таким имененм уже существует"
+        )
+
+    team_code = str(uuid4()).split("-")[0]  # уникальный код
+    team = Team(name=team_data.name, team_code=team_code, creator_id=user.id)
+    db.add(team)
+    await db.commit()
+    await db.refresh(team)
+    return team
+
+
+async def join_team(db: AsyncSession, current_user: User, team_code: str):
+    """
+    Присоединение пользователя к команде по коду.
+    """
+    if current_user.team_id is not None:
+        raise HTTPException(status_code=400, detail="Вы уже состоите в команде")
+
+    result = await db.execute(select(Team).where(Team.team_code == team_code))
+    team = result.scalars().first()
+
+    if not team:
+        raise HTTPException(status_code=404, detail="Команда с таким кодом не найдена")
+    result = await db.execute(select(User).where(User.id == current_user.id))
+    user = result.scalar_one()
+
+    user.team_id = team.id
+    db.add(user)
+    await change_team_counters(db, team.id, {"member_count": 1})
+
+    await db.commit()
+    await db.refresh(user)
+    user_cache.invalidate(user.id)
+
+    return team
+
+
+async def get_team_members(db: AsyncSession, current_user: User):
+    """
+    Все участники команды текущего пользователя (для выпадающих списков).
+    """
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+
+    result = await db.execute(
+        select(User).where(User.team_id == current_user.team_id).order_by(User.id)
+    )
+    return result.scalars().all()
+
+
+async def get_team_members_page(
+    db: AsyncSession,
+    current_user: User,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    with_total: bool = False,
+):
+    """
+    Участники команды текущего пользователя, постранично по id.
+    """
+    if not current_user.team_id:
+        raise HTTPException(status_code=400, detail="Вы не состоите в команде")
+
+    return await paginate(
+        db,
+        select(User).where(User.team_id == current_user.team_id),
+        [User.id],
+        cursor,
+        limit,
+        with_total=with_total,
+    )
+
+
+async def get_team_summary(db: AsyncSession, current_user: User, team_id: int):
+    """
+    Участники и задачи команды по статусам - из счётчиков, без COUNT.
+    Своя команда, admin и суперпользователь - любая.
+    """
+    if current_user.role != RoleEnum.admin and not current_user.is_superuser:
+        if current_user.team_id != team_id:
+            raise HTTPException(
+                status_code=403, detail="Нет доступа к объекту из другой команды"
+            )
+
+    team = await db.get(Team, team_id)
+    if not team:
+        raise HTTPException(status_code=404, detail="Команда не найдена")
+    return {
+        **{name: getattr(team, name) for name in ["id", "name"] + TEAM_COUNTERS},
+        "task_count": sum(getattr(team, name) for name in TASK_COUNTERS.values()),
+    }
+
+
+async def reconcile_team_counters(db: AsyncSession, team_ids=None) -> list:
+    """
+    Сверка счётчиков с users и tasks и исправление расхождений: все
+    команды или указанные. Выполненные задачи в архиве (tasks_archive)
+    тоже считаются. Возвращает исправленные команды (было/стало).
+    Строки команд блокируются до подсчёта (PostgreSQL), так что изменения,
+    закоммиченные позже, прибавят свою дельту к уже исправленному значению.
+    Вызывающий код делает commit.
+    """
+    teams = select(Team.id, *[getattr(Team, name) for name in TEAM_COUNTERS])
+    members = select(User.team_id, func.count()).group_by(User.team_id)
+    task_rows = [
+        select(Task.team_id, Task.status),
+        select(TaskArchive.team_id, TaskArchive.status),
+    ]
+    if team_ids is not None:
+        team_ids = {i for i in team_ids if i is not None}
+        if not team_ids:
+            return []
+        teams = teams.where(Team.id.in_(team_ids))
+        members = members.where(User.team_id.in_(team_ids))
+        task_rows = [
+            stmt.where(stmt.selected_columns.team_id.in_(team_ids))
+            for stmt in task_rows
+        ]
+    task_rows = union_all(*task_rows).subquery()
+    tasks = select(task_rows.c.team_id, task_rows.c.status, func.count()).group_by(
+        task_rows.c.team_id, task_rows.c.status
+    )
+
+    actual = {
+        row.id: dict(zip(TEAM_COUNTERS, row[1:]))
+        for row in await db.execute(teams.order_by(Team.id).with_for_update())
+    }
+    expected = {team_id: dict.fromkeys(TEAM_COUNTERS, 0) for team_id in actual}
+    for team_id, count in await db.execute(members):
+        if team_id in expected:
+            expected[team_id]["member_count"] = count
+    for team_id, task_status, count in await db.execute(tasks):
+        if team_id in expected and task_status in TASK_COUNTERS:
+            expected[team_id][TASK_COUNTERS[task_status]] = count
+
+    drift = [
+        {"team_id": team_id, "expected": expected[team_id], "actual": counters}
+        for team_id, counters in actual.items()
+        if counters != expected[team_id]
+    ]
+    if drift:
+        await db.execute(
+            update(Team),
+            [{"id": item["team_id"], **item["expected"]} for item in drift],
+        )
+    return drift
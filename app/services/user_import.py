@@ -0,0 +1,247 @@
+import csv
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+
+from decouple import config
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import Team
+from app.models.user import RoleEnum, User
+from app.services.team import change_team_counters
+from app.utils.security import get_password_hash
+
+IMPORT_BATCH_SIZE = int(config("IMPORT_BATCH_SIZE", 1000))
+# Процессы для argon2; по умолчанию - по числу ядер
+IMPORT_HASH_WORKERS = int(config("IMPORT_HASH_WORKERS", os.cpu_count() or 1))
+
+# Та же проверка email, что в схемах API (UserCreate)
+email_adapter = TypeAdapter(EmailStr)
+
+# Столбцы users, которые заполняет импорт (порядок для COPY)
+USER_COLUMNS = [
+    "email",
+    "hashed_password",
+    "full_name",
+    "role",
+    "is_active",
+    "is_superuser",
+    "team_id",
+]
+
+
+def read_records(path: str, file_format: Optional[str] = None) -> Iterator[dict]:
+    """
+    Строки файла CSV (с заголовком) или JSONL как словари.
+    Формат - по расширению, если не указан явно.
+    """
+    file_format = file_format or ("jsonl" if path.endswith(".jsonl") else "csv")
+    with open(path, encoding="utf-8", newline="") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def clean_record(record: dict) -> dict:
+    """
+    Проверка строки импорта. Ошибка - ValueError с причиной.
+    Email приводится к нижнему регистру: вход (get_by_email) ищет его
+    без учёта регистра и ждёт не больше одного пользователя.
+    """
+    email = (record.get("email") or "").strip()
+    password = record.get("password") or ""
+    role = (record.get("role") or RoleEnum.user.value).strip()
+
+    try:
+        email = email_adapter.validate_python(email).lower()
+    except ValidationError:
+        raise ValueError("некорректный email")
+    if len(password) < 6:
+        raise ValueError("пароль короче 6 символов")
+    if role not in RoleEnum.__members__:
+        raise ValueError(f"неизвестная роль {role}")
+
+    return {
+        "email": email,
+        "password": password,
+        "full_name": (record.get("full_name") or "").strip() or None,
+        "role": RoleEnum[role],
+        "team_code": (record.get("team_code") or "").strip() or None,
+        "team_name": (record.get("team_name") or "").strip() or None,
+    }
+
+
+async def upsert_teams(db: AsyncSession, teams: dict) -> dict:
+    """
+    Команды по team_code: новые создаются, у существующих обновляется
+    название (если оно указано). Возвращает {team_code: id}.
+    """
+    if not teams:
+        return {}
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(Team).values(
+        [{"team_code": code, "name": name or code} for code, name in teams.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Team.team_code],
+        set_={"name": stmt.excluded.name},
+        where=stmt.excluded.name != stmt.excluded.team_code,
+    )
+    await db.execute(stmt)
+
+    result = await db.execute(
+        select(Team.team_code, Team.id).where(Team.team_code.in_(list(teams)))
+    )
+    return dict(result.all())
+
+
+async def load_users(db: AsyncSession, rows: list) -> None:
+    """
+    Загрузка пачки пользователей: COPY на PostgreSQL (asyncpg),
+    иначе один executemany.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        connection = await db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            User.__tablename__,
+            records=[
+                tuple(
+                    row[c].name if c == "role" else row[c] for c in USER_COLUMNS
+                )
+                for row in rows
+            ],
+            columns=USER_COLUMNS,
+        )
+    else:
+        await db.execute(insert(User), rows)
+
+
+async def assign_team_creators(db: AsyncSession, team_ids) -> None:
+    """
+    Командам без создателя - первый импортированный менеджер команды.
+    """
+    for team_id in team_ids:
+        manager = (
+            select(User.id)
+            .where(User.team_id == team_id, User.role == RoleEnum.manager)
+            .order_by(User.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        await db.execute(
+            update(Team)
+            .where(Team.id == team_id, Team.creator_id.is_(None))
+            .values(creator_id=manager)
+        )
+
+
+async def import_users(
+    db: AsyncSession,
+    path: str,
+    file_format: Optional[str] = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    workers: int = IMPORT_HASH_WORKERS,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Импорт пользователей и команд из CSV/JSONL.
+    Столбцы: email, password, full_name, role, team_code, team_name.
+    Пароли хэшируются в процессах, пользователи с уже занятым email
+    пропускаются, каждая пачка - отдельная транзакция.
+    """
+    start = time.perf_counter()
+    stats = {"read": 0, "created": 0, "existing": 0, "invalid": 0, "errors": []}
+
+    records, teams, seen = [], {}, set()
+    for line, record in enumerate(read_records(path, file_format), start=1):
+        stats["read"] += 1
+        try:
+            record = clean_record(record)
+        except ValueError as e:
+            stats["invalid"] += 1
+            stats["errors"].append({"line": line, "error": str(e)})
+            continue
+        if record["email"] in seen:
+            stats["invalid"] += 1
+            stats["errors"].append({"line": line, "error": "email повторяется"})
+            continue
+        seen.add(record["email"])
+        if record["team_code"]:
+            teams[record["team_code"]] = (
+                record["team_name"] or teams.get(record["team_code"])
+            )
+        records.append(record)
+
+    team_ids = await upsert_teams(db, teams)
+    await db.commit()
+    stats["teams"] = len(team_ids)
+
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        for offset in range(0, len(records), batch_size):
+            batch = records[offset : offset + batch_size]
+
+            # Email в пачке уже в нижнем регистре, в базе - как ввели
+            email = func.lower(User.email)
+            result = await db.execute(
+                select(email).where(email.in_([r["email"] for r in batch]))
+            )
+            existing = set(result.scalars())
+            batch = [r for r in batch if r["email"] not in existing]
+            stats["existing"] += len(existing)
+
+            hashes = pool.map(
+                get_password_hash,
+                [r["password"] for r in batch],
+                chunksize=max(1, len(batch) // (workers * 4)),
+            )
+            rows = [
+                {
+                    "email": r["email"],
+                    "hashed_password": hashed,
+                    "full_name": r["full_name"],
+                    "role": r["role"],
+                    "is_active": True,
+                    "is_superuser": False,
+                    "team_id": team_ids.get(r["team_code"]),
+                }
+                for r, hashed in zip(batch, hashes)
+            ]
+            if rows:
+                await load_users(db, rows)
+                # Счётчики участников - в той же транзакции, что и пачка
+                members = Counter(row["team_id"] for row in rows if row["team_id"])
+                for team_id in sorted(members):
+                    await change_team_counters(
+                        db, team_id, {"member_count": members[team_id]}
+                    )
+                await db.commit()
+            stats["created"] += len(rows)
+
+            if progress:
+                elapsed = time.perf_counter() - start
+                progress(
+                    {
+                        "done": min(offset + batch_size, len(records)),
+                        "total": len(records),
+                        "created": stats["created"],
+                        "rate": stats["created"] / elapsed if elapsed else 0.0,
+                    }
+                )
+
+    await assign_team_creators(db, team_ids.values())
+    await db.commit()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rate"] = stats["created"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
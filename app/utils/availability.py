@@ -0,0 +1,95 @@
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+
+from decouple import config
+
+# Сетка поиска свободного времени
+SLOT_MINUTES = int(config("AVAILABILITY_SLOT_MINUTES", 15))
+WORK_DAY_START = time.fromisoformat(config("WORK_DAY_START", default="09:00"))
+WORK_DAY_END = time.fromisoformat(config("WORK_DAY_END", default="18:00"))
+# Рабочие дни недели (0 - понедельник)
+WORK_WEEKDAYS = {
+    int(day) for day in config("WORK_WEEKDAYS", default="0,1,2,3,4").split(",")
+}
+
+
+class SlotGrid:
+    """
+    Окно [date_from, date_to] в виде битовой маски: бит i - слот
+    SLOT_MINUTES минут от начала окна, 1 - занято. Маски участников
+    объединяются через OR, свободные отрезки ищутся сдвигами, поэтому
+    стоимость почти не зависит от числа участников и встреч.
+    """
+
+    def __init__(
+        self,
+        date_from: date,
+        date_to: date,
+        slot_minutes: int = SLOT_MINUTES,
+        day_start: time = WORK_DAY_START,
+        day_end: time = WORK_DAY_END,
+        weekdays: set = WORK_WEEKDAYS,
+    ):
+        self.start = datetime.combine(date_from, time.min)
+        self.end = datetime.combine(date_to + timedelta(days=1), time.min)
+        self.slot = timedelta(minutes=slot_minutes)
+        self.size = (self.end - self.start) // self.slot
+        self.busy = self._non_working_mask(day_start, day_end, weekdays)
+
+    def _non_working_mask(self, day_start: time, day_end: time, weekdays: set) -> int:
+        slots_per_day = timedelta(days=1) // self.slot
+        first = (datetime.combine(date.min, day_start) - datetime.min) // self.slot
+        last = -(-(datetime.combine(date.min, day_end) - datetime.min) // self.slot)
+        working_day = ((1 << (last - first)) - 1) << first
+
+        working = 0
+        day = self.start
+        for offset in range(0, self.size, slots_per_day):
+            if day.weekday() in weekdays:
+                working |= working_day << offset
+            day += timedelta(days=1)
+        return ((1 << self.size) - 1) & ~working
+
+    def add_busy(self, start_time: datetime, end_time: datetime):
+        self.add_busy_intervals([(start_time, end_time)])
+
+    def add_busy_intervals(self, intervals: Iterable):
+        # Горячий цикл: целые секунды вместо операций над timedelta
+        window_start, window_end = self.start, self.end
+        slot = int(self.slot.total_seconds())
+        busy = self.busy
+        for start_time, end_time in intervals:
+            if start_time >= window_end or end_time <= window_start:
+                continue
+            first = max(0, int((start_time - window_start).total_seconds()) // slot)
+            # округление вверх: слот занят, даже если встреча задевает его частично
+            last = min(
+                self.size, -(-int((end_time - window_start).total_seconds()) // slot)
+            )
+            busy |= ((1 << (last - first)) - 1) << first
+        self.busy = busy
+
+    def free_slots(self, duration: timedelta, limit: int) -> list:
+        """
+        Первые limit непересекающихся свободных отрезков длиной duration
+        (в пределах одного рабочего дня), от ранних к поздним.
+        """
+        length = -(-duration // self.slot)
+        free = ((1 << self.size) - 1) & ~self.busy
+
+        # Бит i в starts - с слота i свободно length слотов подряд
+        starts = free
+        covered = 1
+        while covered < length:
+            step = min(covered, length - covered)
+            starts &= starts >> step
+            covered += step
+
+        slots = []
+        while starts and len(slots) < limit:
+            first = (starts & -starts).bit_length() - 1
+            begin = self.start + first * self.slot
+            slots.append((begin, begin + duration))
+            # следующий вариант - не раньше конца этого
+            starts &= ~((1 << (first + length)) - 1)
+        return slots
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Iterable, Iterator
+
+PRODID = "-//Final Project FastAPI//Calendar//RU"
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    Перенос строк длиннее 75 октетов (RFC 5545, 3.1), не разрывая
+    многобайтовые символы UTF-8.
+    """
+    if len(line.encode()) <= 75:
+        return line
+
+    parts, current, size = [], "", 0
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > 75:
+            parts.append(current)
+            current, size = " ", 1
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n".join(parts)
+
+
+def format_datetime(value: datetime) -> str:
+    # Время без зоны - "плавающее", как и в остальном API
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def format_utc(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def event_lines(
+    uid: str,
+    summary: str,
+    start: datetime,
+    end: datetime,
+    stamp: datetime,
+    description: str = None,
+) -> Iterator[str]:
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield f"DTSTAMP:{format_utc(stamp)}"
+    yield f"DTSTART:{format_datetime(start)}"
+    yield f"DTEND:{format_datetime(end)}"
+    yield f"SUMMARY:{escape_text(summary)}"
+    if description:
+        yield f"DESCRIPTION:{escape_text(description)}"
+    yield "END:VEVENT"
+
+
+def calendar_lines(name: str, events: Iterable[Iterable[str]]) -> Iterator[str]:
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield f"PRODID:{PRODID}"
+    yield "CALSCALE:GREGORIAN"
+    yield "METHOD:PUBLISH"
+    yield f"X-WR-CALNAME:{escape_text(name)}"
+    for event in events:
+        yield from event
+    yield "END:VCALENDAR"
+
+
+def render(lines: Iterable[str]) -> str:
+    return "".join(fold_line(line) + "\r\n" for line in lines)
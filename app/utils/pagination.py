@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import DateTime, and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Непрозрачный курсор: значения ключа сортировки последней строки.
+    """
+    data = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        if not isinstance(data, list) or len(data) != len(columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v)
+            if v is not None and isinstance(col.type, DateTime)
+            else v
+            for col, v in zip(columns, data)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+
+def _after(columns: list, values: list, descending: bool):
+    key = tuple_(*columns)
+    bound = tuple_(*[literal(v, col.type) for col, v in zip(columns, values)])
+    return key < bound if descending else key > bound
+
+
+def keyset_condition(order_columns: list, values: list, descending: bool = False):
+    """
+    Условие "строки после курсора". Первый столбец ключа может быть
+    nullable (например, deadline): NULL идут в конце (NULLS LAST).
+    """
+    first = order_columns[0]
+    if not getattr(first, "nullable", False):
+        return _after(order_columns, values, descending)
+
+    if values[0] is None:
+        return and_(
+            first.is_(None), _after(order_columns[1:], values[1:], descending)
+        )
+    return or_(_after(order_columns, values, descending), first.is_(None))
+
+
+async def estimate_total(db: AsyncSession, stmt) -> int:
+    """
+    Оценка числа строк без COUNT(*): на PostgreSQL берётся из плана
+    запроса (EXPLAIN), на остальных СУБД - обычный COUNT.
+    """
+    stmt = stmt.order_by(None)
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql":
+        sql = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        conn = await db.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    return result.scalar()
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt,
+    order_columns: list,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = False,
+    with_total: bool = False,
+    scalars: bool = True,
+) -> dict:
+    """
+    Keyset-пагинация: WHERE (ключ) > (курсор) ORDER BY ключ LIMIT limit + 1.
+    Стоимость страницы не зависит от того, насколько далеко она от начала.
+    """
+    total_estimate = await estimate_total(db, stmt) if with_total else None
+
+    if cursor:
+        values = decode_cursor(cursor, order_columns)
+        stmt = stmt.where(keyset_condition(order_columns, values, descending))
+
+    order = [col.desc() if descending else col.asc() for col in order_columns]
+    if getattr(order_columns[0], "nullable", False):
+        order[0] = order[0].nulls_last()
+    result = await db.execute(stmt.order_by(*order).limit(limit + 1))
+    rows = result.scalars().all() if scalars else result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(
+            [getattr(rows[-1], col.key) for col in order_columns]
+        )
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+        "total_estimate": total_estimate,
+    }
+
+
+def set_link_header(request: Request, response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{url}>; rel="next"'
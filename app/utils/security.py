@@ -1,7 +1,16 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from decouple import config
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
 
+HASH_POOL_SIZE = int(config("HASH_POOL_SIZE", 4))
+HASH_QUEUE_SIZE = int(config("HASH_QUEUE_SIZE", 32))
+
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +18,74 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class HashPool:
+    """
+    Пул потоков для argon2/bcrypt, чтобы хэширование не блокировало event loop.
+    argon2-cffi и bcrypt отпускают GIL, поэтому потоков достаточно.
+    Очередь ограничена: если заняты все workers + queue_size мест,
+    запрос сразу получает 503 вместо ожидания.
+    """
+
+    def __init__(
+        self, workers: int = HASH_POOL_SIZE, queue_size: int = HASH_QUEUE_SIZE
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self.in_flight = 0
+        self.rejected = 0
+        self.completed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    async def run(self, func, *args):
+        if self.in_flight >= self.workers + self.queue_size:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Сервер перегружен, повторите попытку позже",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.in_flight -= 1
+            self.completed += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - self.workers),
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "avg_latency_ms": (
+                round(self.total_seconds / self.completed * 1000, 2)
+                if self.completed
+                else 0.0
+            ),
+            "max_latency_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+hash_pool = HashPool()
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await hash_pool.run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hash_pool.run(verify_password, plain_password, hashed_password)
@@ -0,0 +1,167 @@
+"""
+Бенчмарк GET /meetings/availability: 50 участников, окно 4 недели.
+
+Замеряет отдельно битовый движок (SlotGrid) на готовых интервалах и весь
+сервис find_free_slots вместе с запросом занятости к БД. Запуск из корня
+проекта:
+
+    python -m benchmarks.meeting_availability
+    python -m benchmarks.meeting_availability --url postgresql+asyncpg://...
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database.database import Base
+from app.models import Meeting, MeetingParticipant, Team, User
+from app.services.meeting import find_free_slots
+from app.utils.availability import SlotGrid
+
+DATE_FROM = date(2025, 4, 7)
+WEEKS = 4
+
+
+def busy_intervals(participants: int, per_day: int) -> dict:
+    """
+    Случайные встречи по 30-90 минут в рабочее время, per_day в день
+    на участника.
+    """
+    rnd = random.Random(42)
+    intervals = {}
+    for user_id in range(1, participants + 1):
+        items = []
+        for day in range(WEEKS * 7):
+            base = datetime.combine(DATE_FROM, datetime.min.time())
+            base += timedelta(days=day, hours=9)
+            for _ in range(per_day):
+                start = base + timedelta(minutes=15 * rnd.randrange(32))
+                length = timedelta(minutes=rnd.choice([30, 60, 90]))
+                items.append((start, start + length))
+        intervals[user_id] = items
+    return intervals
+
+
+def timed(fn, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[max(0, int(repeat * 0.95) - 1)]
+
+
+async def seed(session_factory, intervals: dict):
+    async with session_factory() as db:
+        await db.execute(
+            insert(Team),
+            [{"id": 1, "name": "Bench", "team_code": "bench", "creator_id": 1}],
+        )
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench{user_id}@example.com",
+                    "hashed_password": "x",
+                    "team_id": 1,
+                }
+                for user_id in intervals
+            ],
+        )
+        meeting_id = 0
+        meetings, links = [], []
+        for user_id, items in intervals.items():
+            for start, end in items:
+                meeting_id += 1
+                meetings.append(
+                    {
+                        "id": meeting_id,
+                        "title": "Занято",
+                        "start_time": start,
+                        "end_time": end,
+                        "team_id": 1,
+                    }
+                )
+                links.append(
+                    {
+                        "meeting_id": meeting_id,
+                        "user_id": user_id,
+                        "start_time": start,
+                        "end_time": end,
+                    }
+                )
+        await db.execute(insert(Meeting), meetings)
+        await db.execute(insert(MeetingParticipant), links)
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_availability.db")
+    parser.add_argument("--participants", type=int, default=50)
+    parser.add_argument("--per-day", type=int, default=3)
+    parser.add_argument("--duration", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    intervals = busy_intervals(args.participants, args.per_day)
+    date_to = DATE_FROM + timedelta(days=WEEKS * 7 - 1)
+    flat = [item for items in intervals.values() for item in items]
+    duration = timedelta(minutes=args.duration)
+
+    def engine_only():
+        grid = SlotGrid(DATE_FROM, date_to)
+        grid.add_busy_intervals(flat)
+        return grid.free_slots(duration, 10)
+
+    print(
+        f"участников: {args.participants}, окно: {WEEKS} недели, "
+        f"встреч: {len(flat)}, длительность: {args.duration} мин"
+    )
+    print(f"{'сценарий':<28}{'p50, мс':>10}{'p95, мс':>10}")
+    p50, p95 = timed(engine_only, args.repeat)
+    print(f"{'SlotGrid':<28}{p50:>10.2f}{p95:>10.2f}")
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, intervals)
+
+    user = User(id=1, team_id=1)
+    participant_ids = list(intervals)
+    timings = []
+    async with session_factory() as db:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            await find_free_slots(
+                db, user, participant_ids, DATE_FROM, date_to, args.duration
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p50 = statistics.median(timings)
+    p95 = timings[max(0, int(args.repeat * 0.95) - 1)]
+    print(f"{'find_free_slots (с БД)':<28}{p50:>10.2f}{p95:>10.2f}")
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
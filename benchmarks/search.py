@@ -0,0 +1,130 @@
+"""
+Бенчмарк GET /search: 1 млн задач в 100 командах, у части задач
+комментарии. Ищется редкое слово, частое слово и два слова сразу
+в одной команде.
+
+Вызывается сервис без HTTP. Запуск из корня проекта:
+
+    python -m benchmarks.search
+    python -m benchmarks.search --url postgresql+asyncpg://...
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database.database import Base
+from app.models import Comment, Task, Team, User
+from app.services.search import search
+
+TEAMS = 100
+CHUNK = 10_000
+# Частые слова встречаются почти в каждой задаче, редкие - в единицах
+COMMON = ["задача", "проект", "сделать", "проверить", "обновить", "отчёт"]
+RARE = [f"модуль{i}" for i in range(2000)]
+QUERIES = {
+    "редкое слово": "модуль42",
+    "частое слово": "задач",
+    "два слова": "проверить отчёт",
+}
+
+
+def percentiles(timings: list) -> tuple:
+    timings.sort()
+    return statistics.median(timings), timings[max(0, int(len(timings) * 0.95) - 1)]
+
+
+def text(rnd: random.Random, words: int) -> str:
+    return " ".join(
+        rnd.choice(RARE) if rnd.random() < 0.05 else rnd.choice(COMMON)
+        for _ in range(words)
+    )
+
+
+async def seed(bench_engine, session_factory, tasks: int):
+    rnd = random.Random(42)
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as db:
+        await db.execute(
+            insert(Team),
+            [
+                {"id": i, "name": f"Team {i}", "team_code": f"t{i}", "creator_id": 1}
+                for i in range(1, TEAMS + 1)
+            ],
+        )
+        await db.execute(
+            insert(User),
+            [{"id": 1, "email": "bench@example.com", "hashed_password": "x"}],
+        )
+        for start in range(0, tasks, CHUNK):
+            ids = range(start + 1, min(start + CHUNK, tasks) + 1)
+            await db.execute(
+                insert(Task),
+                [
+                    {
+                        "id": task_id,
+                        "title": text(rnd, 4),
+                        "description": text(rnd, 12),
+                        "creator_id": 1,
+                        "team_id": task_id % TEAMS + 1,
+                    }
+                    for task_id in ids
+                ],
+            )
+            await db.execute(
+                insert(Comment),
+                [
+                    {"task_id": task_id, "user_id": 1, "content": text(rnd, 8)}
+                    for task_id in ids
+                    if task_id % 5 == 0
+                ],
+            )
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_search.db")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    if not args.no_seed:
+        await seed(bench_engine, session_factory, args.tasks)
+
+    user = User(id=1, team_id=1)
+    print(f"задач: {args.tasks}, команд: {TEAMS}")
+    print(f"{'запрос':<16}{'найдено':>10}{'p50, мс':>10}{'p95, мс':>10}")
+    async with session_factory() as db:
+        for name, q in QUERIES.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                page = await search(db, user, q, limit=20)
+                timings.append((time.perf_counter() - start) * 1000)
+            p50, p95 = percentiles(timings)
+            print(f"{name:<16}{len(page['items']):>10}{p50:>10.2f}{p95:>10.2f}")
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""
+Бенчмарк импорта задач: 10 тыс. задач по одной (POST /tasks/) против
+пачек POST /tasks/bulk, и то же для изменения (PATCH).
+
+Вызываются сервисы без HTTP, так что разница - только работа с БД:
+проверка исполнителя, INSERT и refresh на каждую задачу против одного
+IN-запроса и INSERT ... RETURNING на пачку. Запуск из корня проекта:
+
+    python -m benchmarks.task_bulk
+    python -m benchmarks.task_bulk --url postgresql+asyncpg://...
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database.database import Base
+from app.models import Team, User
+from app.models.user import RoleEnum
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskUpdate,
+)
+from app.services.task import (
+    TASK_BULK_MAX,
+    create_task,
+    create_tasks_bulk,
+    update_task,
+    update_tasks_bulk,
+)
+
+MEMBERS = 20
+
+
+async def prepare(bench_engine, session_factory):
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as db:
+        await db.execute(
+            insert(Team),
+            [{"id": 1, "name": "Bench", "team_code": "bench", "creator_id": 1}],
+        )
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench{user_id}@example.com",
+                    "hashed_password": "x",
+                    "team_id": 1,
+                    "role": RoleEnum.manager,
+                }
+                for user_id in range(1, MEMBERS + 1)
+            ],
+        )
+        await db.commit()
+
+
+def chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_bulk.db")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=TASK_BULK_MAX)
+    args = parser.parse_args()
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    manager = User(id=1, team_id=1, role=RoleEnum.manager)
+    items = [
+        TaskCreate(title=f"Задача {i}", assignee_id=i % MEMBERS + 1)
+        for i in range(args.tasks)
+    ]
+    ids = range(1, args.tasks + 1)
+    timings = {}
+
+    await prepare(bench_engine, session_factory)
+    async with session_factory() as db:
+        start = time.perf_counter()
+        for item in items:
+            await create_task(db, manager, item)
+        timings["POST по одной"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for task_id in ids:
+            await update_task(db, manager, task_id, TaskUpdate(title="Правка"))
+        timings["PATCH по одной"] = time.perf_counter() - start
+
+    await prepare(bench_engine, session_factory)
+    async with session_factory() as db:
+        start = time.perf_counter()
+        for batch in chunks(items, args.batch):
+            await create_tasks_bulk(db, manager, TaskBulkCreate(items=batch))
+        timings[f"POST /bulk по {args.batch}"] = time.perf_counter() - start
+
+        updates = [{"id": task_id, "title": "Правка"} for task_id in ids]
+        start = time.perf_counter()
+        for batch in chunks(updates, args.batch):
+            await update_tasks_bulk(db, manager, TaskBulkUpdate(items=batch))
+        timings[f"PATCH /bulk по {args.batch}"] = time.perf_counter() - start
+
+    print(f"задач: {args.tasks}")
+    print(f"{'сценарий':<26}{'всего, с':>10}{'задач/с':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<26}{seconds:>10.2f}{args.tasks / seconds:>10.0f}")
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""
+Бенчмарк GET /tasks/: задержка страницы с фильтрами и без на большой таблице.
+
+Заполняет отдельную БД (по умолчанию SQLite-файл) и вызывает сервис
+get_team_tasks напрямую, без HTTP. Запуск из корня проекта:
+
+    python -m benchmarks.task_filters --rows 1000000
+    python -m benchmarks.task_filters --url postgresql+asyncpg://... --rows 1000000
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database.database import Base
+from app.models import Task, Team, User
+from app.models.task import TaskStatus
+from app.schemas.task import TaskFilter
+from app.services.task import get_team_tasks
+
+TEAMS = 10
+USERS_PER_TEAM = 20
+CHUNK = 10000
+
+
+async def seed(session_factory, rows: int):
+    now = datetime.utcnow()
+    rnd = random.Random(42)
+    async with session_factory() as db:
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": i + 1,
+                    "email": f"bench{i}@example.com",
+                    "hashed_password": "x",
+                    "full_name": f"Bench {i}",
+                    "team_id": None,
+                }
+                for i in range(TEAMS * USERS_PER_TEAM)
+            ],
+        )
+        await db.execute(
+            insert(Team),
+            [
+                {
+                    "id": t + 1,
+                    "name": f"Team {t}",
+                    "team_code": f"bench{t}",
+                    "creator_id": t * USERS_PER_TEAM + 1,
+                }
+                for t in range(TEAMS)
+            ],
+        )
+        for t in range(TEAMS):
+            first = t * USERS_PER_TEAM + 1
+            await db.execute(
+                update(User)
+                .where(User.id.between(first, first + USERS_PER_TEAM - 1))
+                .values(team_id=t + 1)
+            )
+        await db.commit()
+
+        statuses = list(TaskStatus)
+        for start in range(0, rows, CHUNK):
+            batch = []
+            for i in range(start, min(start + CHUNK, rows)):
+                team = i % TEAMS
+                member = team * USERS_PER_TEAM + 1 + rnd.randrange(USERS_PER_TEAM)
+                batch.append(
+                    {
+                        "title": f"Task {i}",
+                        "status": rnd.choice(statuses),
+                        "deadline": (
+                            now + timedelta(days=rnd.randint(-365, 365))
+                            if rnd.random() < 0.9
+                            else None
+                        ),
+                        "created_at": now - timedelta(minutes=rows - i),
+                        "creator_id": team * USERS_PER_TEAM + 1,
+                        "assignee_id": member,
+                        "team_id": team + 1,
+                    }
+                )
+            await db.execute(insert(Task), batch)
+            await db.commit()
+            done = min(start + CHUNK, rows)
+            print(f"\rзаписано {done}/{rows}", end="", flush=True)
+        print()
+
+
+async def measure(session_factory, user, repeat: int, **kwargs) -> tuple:
+    timings = []
+    async with session_factory() as db:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await get_team_tasks(db, user, **kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    return statistics.median(timings), p95
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_tasks.db")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    if not args.skip_seed:
+        async with bench_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(session_factory, args.rows)
+
+    user = User(id=2, team_id=1)
+    # Курсор на середину списка команды - keyset не должен замедляться
+    async with session_factory() as db:
+        page = await get_team_tasks(db, user, limit=args.rows // TEAMS // 2)
+    deep_cursor = page["next_cursor"]
+
+    scenarios = {
+        "без фильтров": {},
+        "без фильтров, середина списка": {"cursor": deep_cursor},
+        "status=done": {"filters": TaskFilter(status=[TaskStatus.done])},
+        "assignee_id": {"filters": TaskFilter(assignee_id=2)},
+        "mine, sort=deadline": {
+            "filters": TaskFilter(mine=True),
+            "sort": "deadline",
+        },
+        "overdue": {"filters": TaskFilter(overdue=True)},
+        "overdue, sort=deadline": {
+            "filters": TaskFilter(overdue=True),
+            "sort": "deadline",
+        },
+        "sort=-deadline": {"sort": "-deadline"},
+        "created за 7 дней": {
+            "filters": TaskFilter(
+                created_from=datetime.utcnow() - timedelta(days=7)
+            )
+        },
+        "без фильтров + with_total": {"with_total": True},
+    }
+
+    print(
+        f"{args.url}, задач: {args.rows}, limit={args.limit}, "
+        f"повторов: {args.repeat}"
+    )
+    print(f"{'сценарий':<32}{'p50, мс':>10}{'p95, мс':>10}")
+    for name, kwargs in scenarios.items():
+        p50, p95 = await measure(
+            session_factory, user, args.repeat, limit=args.limit, **kwargs
+        )
+        print(f"{name:<32}{p50:>10.2f}{p95:>10.2f}")
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
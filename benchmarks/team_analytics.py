@@ -0,0 +1,141 @@
+"""
+Бенчмарк GET /team/{id}/analytics: команда из 20 человек, 100 тыс. задач,
+у выполненных - оценки.
+
+Замеряет отдельно расчёт в NumPy (compute_analytics) на готовых строках
+и весь сервис без кэша вместе с запросом к БД. Запуск из корня проекта:
+
+    python -m benchmarks.team_analytics
+    python -m benchmarks.team_analytics --url postgresql+asyncpg://...
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.analytics_cache import analytics_cache
+from app.database.database import Base
+from app.models import Evaluation, Task, Team, User
+from app.models.task import TaskStatus
+from app.models.user import RoleEnum
+from app.services.analytics import compute_analytics, get_team_analytics, load_groups
+
+MEMBERS = 20
+NOW = datetime(2025, 6, 1)
+
+
+def percentiles(timings: list) -> tuple:
+    timings.sort()
+    return statistics.median(timings), timings[max(0, int(len(timings) * 0.95) - 1)]
+
+
+async def seed(session_factory, tasks: int):
+    rnd = random.Random(42)
+    statuses = list(TaskStatus)
+    async with session_factory() as db:
+        await db.execute(
+            insert(Team),
+            [{"id": 1, "name": "Bench", "team_code": "bench", "creator_id": 1}],
+        )
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench{user_id}@example.com",
+                    "hashed_password": "x",
+                    "team_id": 1,
+                }
+                for user_id in range(1, MEMBERS + 1)
+            ],
+        )
+        rows, evaluations = [], []
+        for task_id in range(1, tasks + 1):
+            created = NOW - timedelta(minutes=rnd.randrange(180 * 24 * 60))
+            deadline = created + timedelta(days=rnd.randrange(1, 14))
+            status = rnd.choice(statuses)
+            completed = None
+            if status == TaskStatus.done:
+                completed = created + timedelta(hours=rnd.randrange(1, 20 * 24))
+                evaluations.append(
+                    {
+                        "task_id": task_id,
+                        "user_id": 1,
+                        "score": rnd.randint(1, 5),
+                        "evaluated_at": completed + timedelta(hours=1),
+                    }
+                )
+            rows.append(
+                {
+                    "id": task_id,
+                    "title": f"Задача {task_id}",
+                    "status": status,
+                    "deadline": deadline,
+                    "created_at": created,
+                    "completed_at": completed,
+                    "creator_id": 1,
+                    "assignee_id": rnd.randint(1, MEMBERS),
+                    "team_id": 1,
+                }
+            )
+        await db.execute(insert(Task), rows)
+        await db.execute(insert(Evaluation), evaluations)
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_analytics.db")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, args.tasks)
+
+    manager = User(id=1, team_id=1, role=RoleEnum.manager, is_superuser=False)
+    member_ids = list(range(1, MEMBERS + 1))
+    compute, service = [], []
+    async with session_factory() as db:
+        groups = await load_groups(db, 1, NOW)
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            compute_analytics(groups, member_ids, NOW)
+            compute.append((time.perf_counter() - start) * 1000)
+
+            analytics_cache.clear()
+            start = time.perf_counter()
+            await get_team_analytics(db, manager, 1)
+            service.append((time.perf_counter() - start) * 1000)
+
+    rows = sum(len(columns["count"]) for columns in groups.values())
+    print(f"задач: {args.tasks}, участников: {MEMBERS}, строк групп: {rows}")
+    print(f"{'сценарий':<32}{'p50, мс':>10}{'p95, мс':>10}")
+    p50, p95 = percentiles(compute)
+    print(f"{'compute_analytics (NumPy)':<32}{p50:>10.2f}{p95:>10.2f}")
+    p50, p95 = percentiles(service)
+    print(f"{'get_team_analytics (с БД)':<32}{p50:>10.2f}{p95:>10.2f}")
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Бенчмарк GET /team/{id}/export: выгрузка задач команды при разном
+числе строк.
+
+Генератор ответа читается целиком, как это делает StreamingResponse;
+замеряются время, скорость и пик памяти Python (tracemalloc). Пик не
+должен расти вместе с числом строк. Запуск из корня проекта:
+
+    python -m benchmarks.team_export
+    python -m benchmarks.team_export --url postgresql+asyncpg://...
+
+Переменные окружения приложения (.env) должны быть заданы, как для uvicorn.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database.database import Base
+from app.models import Task, Team, User
+from app.services.export import export_team
+
+CHUNK = 10_000
+
+
+async def seed(bench_engine, session_factory, tasks: int):
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as db:
+        await db.execute(
+            insert(Team),
+            [{"id": 1, "name": "Bench", "team_code": "bench", "creator_id": 1}],
+        )
+        await db.execute(
+            insert(User),
+            [{"id": 1, "email": "bench@example.com", "hashed_password": "x"}],
+        )
+        for start in range(0, tasks, CHUNK):
+            await db.execute(
+                insert(Task),
+                [
+                    {
+                        "title": f"Задача {i}",
+                        "description": "Описание задачи " * 4,
+                        "creator_id": 1,
+                        "assignee_id": 1,
+                        "team_id": 1,
+                    }
+                    for i in range(start, min(start + CHUNK, tasks))
+                ],
+            )
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench_export.db")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10_000, 200_000])
+    args = parser.parse_args()
+
+    bench_engine = create_async_engine(args.url)
+    session_factory = async_sessionmaker(
+        bind=bench_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    print(f"{'задач':>10}{'формат':>8}{'всего, с':>10}{'строк/с':>10}{'пик, МБ':>10}")
+    for tasks in args.tasks:
+        await seed(bench_engine, session_factory, tasks)
+        for export_format in ("ndjson", "csv"):
+            async with session_factory() as db:
+                tracemalloc.start()
+                start = time.perf_counter()
+                size = 0
+                async for chunk in export_team(db, 1, ["tasks"], export_format):
+                    size += len(chunk)
+                seconds = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            print(
+                f"{tasks:>10}{export_format:>8}{seconds:>10.2f}"
+                f"{tasks / seconds:>10.0f}{peak / 2**20:>10.1f}"
+            )
+
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,6 +15,9 @@ from app.models.meeting_participant import MeetingParticipant
 from app.models.meeting import Meeting
 
 from app.utils.security import get_password_hash
+from app.core.user_cache import user_cache
+from app.core.calendar_cache import calendar_cache
+from app.core.analytics_cache import analytics_cache
 
 # тестовая база в памяти
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -38,6 +41,18 @@ async def db_session():
             await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+def clear_user_cache():
+    # База пересоздаётся в каждом тесте, id пользователей повторяются
+    user_cache.clear()
+    calendar_cache.clear()
+    analytics_cache.clear()
+    yield
+    user_cache.clear()
+    calendar_cache.clear()
+    analytics_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function", autouse=True)
 def override_dependency(db_session):
 
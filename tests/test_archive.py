@@ -0,0 +1,189 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, func, select
+
+from app.database.database import engine
+
+
+@pytest.mark.asyncio
+async def test_archive_old_tasks_and_meetings(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.core.analytics_cache import analytics_cache
+    from app.models.archive import (
+        CommentArchive,
+        EvaluationArchive,
+        MeetingParticipantArchive,
+        TaskArchive,
+    )
+    from app.models.comment import Comment
+    from app.models.evaluation import Evaluation
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+    from app.models.task import Task, TaskStatus
+    from app.models.team import Team
+    from app.services.archive import ARCHIVE_AFTER_DAYS, run_archive
+    from app.services.evaluation import check_score_rollups, rebuild_score_rollups
+    from app.services.team import reconcile_team_counters
+
+    now = datetime.utcnow()
+    old = now - timedelta(days=ARCHIVE_AFTER_DAYS + 30)
+    recent = now - timedelta(days=5)
+
+    team = Team(name="Archive Team", team_code="arc123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+
+    def task(title, status, when):
+        return Task(
+            title=title,
+            status=status,
+            deadline=when,
+            completed_at=when if status == TaskStatus.done else None,
+            creator_id=manager_user.id,
+            assignee_id=regular_user.id,
+            team_id=team.id,
+        )
+
+    archived = task("Старая выполненная", TaskStatus.done, old)
+    old_open = task("Старая открытая", TaskStatus.open, old)
+    fresh = [task(f"Свежая {i}", TaskStatus.done, recent) for i in range(2)]
+    db_session.add_all([archived, old_open, *fresh])
+    await db_session.commit()
+
+    db_session.add(
+        Comment(content="Итоги", user_id=manager_user.id, task_id=archived.id)
+    )
+    db_session.add_all(
+        [
+            Evaluation(
+                task_id=t.id, user_id=manager_user.id, score=score, evaluated_at=when
+            )
+            for t, score, when in [
+                (archived, 3, old),
+                (fresh[0], 4, recent),
+                (fresh[1], 5, recent + timedelta(hours=1)),
+            ]
+        ]
+    )
+    past = Meeting(
+        title="Старая встреча",
+        start_time=old,
+        end_time=old + timedelta(hours=1),
+        team_id=team.id,
+    )
+    db_session.add(past)
+    await db_session.commit()
+    db_session.add(
+        MeetingParticipant(
+            meeting_id=past.id,
+            user_id=regular_user.id,
+            start_time=past.start_time,
+            end_time=past.end_time,
+        )
+    )
+    await rebuild_score_rollups(db_session)
+    await reconcile_team_counters(db_session)
+    await db_session.commit()
+    archived_id, past_id = archived.id, past.id
+
+    with pytest.raises(ValueError):
+        await run_archive(db_session, days=ARCHIVE_AFTER_DAYS - 1)
+
+    # Пачки по одной: перенос идёт несколькими транзакциями,
+    # кэш аналитики команды сбрасывается
+    analytics_cache.set(team.id, {"tasks": {"total": 4}})
+    stats = await run_archive(db_session, batch_size=1)
+    assert {k: stats[k] for k in ["tasks", "comments", "evaluations", "meetings"]} == {
+        "tasks": 1,
+        "comments": 1,
+        "evaluations": 1,
+        "meetings": 1,
+    }
+    db_session.expunge_all()
+    assert await db_session.get(Task, archived_id) is None
+    assert await db_session.get(Task, old_open.id) is not None
+    assert (await db_session.get(TaskArchive, archived_id)).title == "Старая выполненная"
+    for model in [CommentArchive, EvaluationArchive, MeetingParticipantArchive]:
+        count = await db_session.scalar(select(func.count()).select_from(model))
+        assert count == 1
+    assert await db_session.get(Meeting, past_id) is None
+    assert analytics_cache.get(team.id) is None
+
+    # Сводки и счётчики учитывают архив
+    await rebuild_score_rollups(db_session)
+    assert await check_score_rollups(db_session) == []
+    assert await reconcile_team_counters(db_session) == []
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        # Первая страница целиком из свежих оценок - архив не читается
+        response = await client.get("/evaluations/my?limit=1")
+        page = response.json()
+        assert [e["task_id"] for e in page["items"]] == [fresh[1].id]
+        assert not any("_archive" in s for s in statements)
+
+        # Календарь за недавний период - тоже без архива
+        day = recent.date()
+        response = await client.get(f"/calendar/range?from={day}&to={day}")
+        assert len(response.json()["days"][str(day)]["tasks"]) == 2
+        assert not any("_archive" in s for s in statements)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    # Дальше страницы доходят до архива
+    task_ids = [e["task_id"] for e in page["items"]]
+    while page["next_cursor"]:
+        response = await client.get(
+            f"/evaluations/my?limit=1&cursor={page['next_cursor']}"
+        )
+        page = response.json()
+        task_ids += [e["task_id"] for e in page["items"]]
+    assert task_ids == [fresh[1].id, fresh[0].id, archived_id]
+
+    response = await client.get("/evaluations/my?expand=task&with_total=true")
+    page = response.json()
+    assert page["total_estimate"] == 3
+    assert page["items"][-1]["task_title"] == "Старая выполненная"
+    assert page["items"][-1]["task_status"] == "done"
+
+    # История календаря объединяет горячие и архивные строки
+    day = old.date()
+    response = await client.get(f"/calendar/range?from={day}&to={day}")
+    days = response.json()["days"][str(day)]
+    assert sorted(t["id"] for t in days["tasks"]) == sorted([archived_id, old_open.id])
+    assert [m["id"] for m in days["meetings"]] == [past_id]
+
+    # Выгрузка команды - за всё время
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    response = await client.get(f"/team/{team.id}/export?entities=tasks,meetings")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert archived_id in [r["id"] for r in rows if r["entity"] == "tasks"]
+    assert [r["id"] for r in rows if r["entity"] == "meetings"] == [past_id]
+
+    # Аналитика, как и счётчики, учитывает архивные задачи и оценки
+    analytics = (await client.get(f"/team/{team.id}/analytics")).json()
+    assert analytics["tasks"]["total"] == 4
+    assert analytics["tasks"]["by_status"]["done"] == 3
+    assert analytics["scores"]["count"] == 3
@@ -30,3 +30,111 @@ async def test_login_user(client: AsyncClient, registered_user):
 
     assert "access_token" in data
     assert data["token_type"] == "bearer"
+
+
+@pytest.mark.asyncio
+async def test_single_connection_checkout_per_request(client: AsyncClient, regular_user):
+    from sqlalchemy import event
+
+    from app.main import app as fastapi_app
+    from app.database.database import engine, get_db
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    # Настоящая get_db вместо тестовой сессии - считаем обращения к пулу
+    fastapi_app.dependency_overrides.pop(get_db)
+    checkouts = []
+
+    def on_checkout(dbapi_conn, conn_record, conn_proxy):
+        checkouts.append(conn_record)
+
+    event.listen(engine.sync_engine, "checkout", on_checkout)
+    try:
+        response = await client.get("/tasks/")
+    finally:
+        event.remove(engine.sync_engine, "checkout", on_checkout)
+
+    assert response.status_code == 200
+    # Аутентификация и обработчик используют одну сессию
+    assert len(checkouts) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_hit_skips_user_lookup(
+    client: AsyncClient, regular_user, db_session
+):
+    from sqlalchemy import event
+
+    from app.database.database import engine
+    from app.core.user_cache import user_cache
+    from app.models.team import Team
+
+    team = Team(name="Cache Team", team_code="cache123", creator_id=regular_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    # Первый запрос - промах, пользователь читается из БД
+    response = await client.get("/tasks/")
+    assert response.status_code == 200
+    assert user_cache.misses == 1
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        response = await client.get("/tasks/")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    assert response.status_code == 200
+    assert user_cache.hits == 1
+    assert not [s for s in statements if "FROM users" in s]
+
+    # Вступление в команду сбрасывает кэш - team_id виден сразу
+    response = await client.post("/team/join?team_code=cache123")
+    assert response.status_code == 200
+
+    response = await client.get("/users/")
+    assert response.status_code == 200
+    assert [u["email"] for u in response.json()["items"]] == ["user@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_hash_pool_full(
+    client: AsyncClient, registered_user, monkeypatch
+):
+    from app.utils.security import hash_pool
+
+    # Все места пула и очереди заняты
+    monkeypatch.setattr(
+        hash_pool, "in_flight", hash_pool.workers + hash_pool.queue_size
+    )
+    response = await client.post(
+        "/auth/jwt/login",
+        data={"username": "newuser@example.com", "password": "password123"},
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert hash_pool.rejected >= 1
+
+    # Форма входа показывает сообщение вместо JSON-ошибки
+    response = await client.post(
+        "/login", data={"email": "newuser@example.com", "password": "password123"}
+    )
+    assert response.status_code == 303
+    assert response.headers["location"] == "/login"
+    response = await client.get("/login")
+    assert "Сервер перегружен, попробуйте позже" in response.text
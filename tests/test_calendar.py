@@ -0,0 +1,235 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from datetime import datetime, timedelta
+
+
+@pytest.mark.asyncio
+async def test_calendar_range_day_and_month(
+    client: AsyncClient, manager_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Cal Team", team_code="cal123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    db_session.add(
+        Task(
+            title="Отчёт",
+            deadline=datetime(2025, 4, 30, 18, 0),
+            creator_id=manager_user.id,
+            assignee_id=manager_user.id,
+            team_id=team.id,
+        )
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.post(
+        "/meetings/",
+        json={
+            "title": "Планёрка",
+            "start_time": "2025-04-30T10:00:00",
+            "end_time": "2025-04-30T11:00:00",
+            "participant_ids": [manager_user.id],
+        },
+    )
+    assert response.status_code == 201
+
+    response = await client.get(
+        "/calendar/range", params={"from": "2025-04-29", "to": "2025-05-01"}
+    )
+    assert response.status_code == 200
+    days = response.json()["days"]
+    assert list(days) == ["2025-04-29", "2025-04-30", "2025-05-01"]
+    assert [t["title"] for t in days["2025-04-30"]["tasks"]] == ["Отчёт"]
+    assert days["2025-04-30"]["meetings"][0]["time"] == "10:00:00 - 11:00:00"
+    assert days["2025-04-29"] == {"tasks": [], "meetings": []}
+
+    response = await client.get(
+        "/calendar/day", params={"target_date": "2025-04-30"}
+    )
+    data = response.json()
+    assert data["date"] == "2025-04-30"
+    assert data["tasks"][0]["status"] == "open"
+    assert [m["title"] for m in data["meetings"]] == ["Планёрка"]
+
+    response = await client.get(
+        "/calendar/month", params={"target_month": 4, "target_year": 2025}
+    )
+    calendar = response.json()["calendar"]
+    assert len(calendar) == 30
+    assert [m["title"] for m in calendar["2025-04-30"]["meetings"]] == ["Планёрка"]
+
+    response = await client.get(
+        "/calendar/range", params={"from": "2025-05-01", "to": "2025-04-01"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_calendar_range_includes_meetings_crossing_window(
+    client: AsyncClient, manager_user, db_session
+):
+    from app.models.team import Team
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+
+    team = Team(name="Cal Team", team_code="cal456", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    # Ночная встреча (например, заведена в админке): 30.04 22:00 - 01.05 02:00
+    start, end = datetime(2025, 4, 30, 22, 0), datetime(2025, 5, 1, 2, 0)
+    meeting = Meeting(title="Релиз", start_time=start, end_time=end, team_id=team.id)
+    db_session.add(meeting)
+    await db_session.flush()
+    db_session.add(
+        MeetingParticipant(
+            meeting_id=meeting.id,
+            user_id=manager_user.id,
+            start_time=start,
+            end_time=end,
+        )
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    for target_date in ("2025-04-30", "2025-05-01"):
+        response = await client.get(
+            "/calendar/day", params={"target_date": target_date}
+        )
+        assert [m["title"] for m in response.json()["meetings"]] == ["Релиз"]
+
+    response = await client.get(
+        "/calendar/range", params={"from": "2025-05-01", "to": "2025-05-02"}
+    )
+    days = response.json()["days"]
+    assert [m["title"] for m in days["2025-05-01"]["meetings"]] == ["Релиз"]
+    assert days["2025-05-02"]["meetings"] == []
+
+    # Потоком - по строке на день, содержимое то же, что в JSON
+    params = {"from": "2025-04-29", "to": "2025-05-02"}
+    days = (await client.get("/calendar/range", params=params)).json()["days"]
+    response = await client.get(
+        "/calendar/range", params={**params, "format": "ndjson"}
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.pop("date") for line in lines] == list(days)
+    assert lines == list(days.values())
+    assert [len(line["meetings"]) for line in lines] == [0, 1, 1, 0]
+
+    response = await client.get(
+        "/calendar/range",
+        params={"from": "2025-05-02", "to": "2025-05-01", "format": "ndjson"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_calendar_ics_feed_conditional_get(
+    client: AsyncClient, manager_user, db_session
+):
+    from sqlalchemy import event
+    from app.database.database import engine
+    from app.models.team import Team
+
+    team = Team(name="Cal Team", team_code="cal789", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    start = (datetime.utcnow() + timedelta(days=1)).replace(
+        hour=10, minute=0, second=0, microsecond=0
+    )
+    response = await client.post(
+        "/meetings/",
+        json={
+            "title": "Планёрка, еженедельная",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+            "participant_ids": [manager_user.id],
+        },
+    )
+    assert response.status_code == 201
+
+    url = (await client.get("/calendar/feed")).json()["url"]
+    assert url.endswith(".ics")
+    assert (await client.get("/calendar/feed")).json()["url"] == url
+
+    # Лента доступна по ссылке без авторизации
+    del client.headers["Authorization"]
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    body = response.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert "SUMMARY:Планёрка\\, еженедельная\r\n" in body
+    assert f"DTSTART:{start:%Y%m%dT%H%M%S}" in body
+    etag = response.headers["etag"]
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        response = await client.get(
+            url, headers={"If-Modified-Since": response.headers["last-modified"]}
+        )
+        assert response.status_code == 304
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    assert statements
+    assert not [s for s in statements if "tasks" in s or "meetings" in s]
+
+    # Новая задача пользователя меняет ETag
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    response = await client.post(
+        "/tasks/",
+        json={
+            "title": "Отчёт",
+            "deadline": (start + timedelta(days=1)).isoformat(),
+            "assignee_id": manager_user.id,
+        },
+    )
+    assert response.status_code == 201
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "SUMMARY:Дедлайн: Отчёт" in response.text
+
+    # После сброса старая ссылка не работает
+    response = await client.post("/calendar/feed/reset")
+    assert response.json()["url"] != url
+    assert (await client.get(url)).status_code == 404
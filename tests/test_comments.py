@@ -0,0 +1,118 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+
+from app.database.database import engine
+
+
+@pytest.mark.asyncio
+async def test_task_comments(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+    from app.models.comment import Comment
+    from app.models.evaluation import Evaluation
+
+    team = Team(name="Comment Team", team_code="com123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    task = Task(
+        title="Обсуждаемая задача",
+        creator_id=manager_user.id,
+        assignee_id=regular_user.id,
+        team_id=team.id,
+    )
+    db_session.add(task)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    user_token = login.json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {user_token}"
+
+    ids = []
+    for i in range(3):
+        response = await client.post(
+            f"/tasks/{task.id}/comments/", json={"content": f"Комментарий {i}"}
+        )
+        assert response.status_code == 201
+        assert response.json()["user_id"] == regular_user.id
+        ids.append(response.json()["id"])
+
+    response = await client.post(f"/tasks/{task.id}/comments/", json={"content": ""})
+    assert response.status_code == 422
+    response = await client.get(f"/tasks/{task.id}")
+    assert response.json()["comment_count"] == 3
+
+    # Keyset-пагинация в обе стороны
+    response = await client.get(f"/tasks/{task.id}/comments/?limit=2")
+    page = response.json()
+    assert [c["id"] for c in page["items"]] == ids[:2]
+    assert "rel=\"next\"" in response.headers["link"]
+    response = await client.get(
+        f"/tasks/{task.id}/comments/?limit=2&cursor={page['next_cursor']}"
+    )
+    assert [c["id"] for c in response.json()["items"]] == ids[2:]
+    assert response.json()["next_cursor"] is None
+    response = await client.get(f"/tasks/{task.id}/comments/?sort=-id&limit=2")
+    assert [c["id"] for c in response.json()["items"]] == ids[::-1][:2]
+
+    response = await client.patch(
+        f"/tasks/{task.id}/comments/{ids[0]}", json={"content": "Исправлено"}
+    )
+    assert response.status_code == 200
+    assert response.json()["content"] == "Исправлено"
+
+    # Чужая задача и чужой комментарий
+    response = await client.get(f"/tasks/{task.id + 1}/comments/")
+    assert response.status_code == 404
+    response = await client.delete(f"/tasks/{task.id}/comments/{ids[-1] + 1}")
+    assert response.status_code == 404
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    response = await client.patch(
+        f"/tasks/{task.id}/comments/{ids[1]}", json={"content": "Не моё"}
+    )
+    assert response.status_code == 403
+    response = await client.delete(f"/tasks/{task.id}/comments/{ids[1]}")
+    assert response.status_code == 204
+    response = await client.get(f"/tasks/{task.id}")
+    assert response.json()["comment_count"] == 2
+
+    db_session.add(Evaluation(task_id=task.id, user_id=manager_user.id, score=4))
+    await db_session.commit()
+
+    # Удаление задачи не читает комментарии и оценки
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.delete(f"/tasks/{task.id}")
+        assert response.status_code == 204
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    assert not [
+        s
+        for s in statements
+        if s.lstrip().startswith("SELECT")
+        and ("FROM comments" in s or "FROM evaluations" in s)
+    ]
+
+    result = await db_session.execute(select(Comment.id))
+    assert result.all() == []
+    result = await db_session.execute(select(Evaluation.task_id))
+    assert result.scalars().all() == [None]
@@ -52,3 +52,182 @@ async def test_create_evaluation_by_manager(
 
     assert response.status_code == 201
     assert response.json()["score"] == 5
+
+
+@pytest.mark.asyncio
+async def test_my_evaluations_expand_task(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+    from app.models.evaluation import Evaluation
+
+    team = Team(name="Team", team_code="evalexp1", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            status="done",
+            creator_id=manager_user.id,
+            team_id=team.id,
+            assignee_id=regular_user.id,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    db_session.add_all(
+        [Evaluation(task_id=t.id, user_id=manager_user.id, score=4) for t in tasks]
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get("/evaluations/my", params={"expand": "task"})
+    assert response.status_code == 200
+    data = response.json()["items"]
+    assert len(data) == 3
+    assert {ev["task_title"] for ev in data} == {"Task 0", "Task 1", "Task 2"}
+    assert all(ev["task_status"] == "done" for ev in data)
+    assert all(ev["evaluator_name"] == "Manager" for ev in data)
+
+    # Без expand - прежний формат
+    response = await client.get("/evaluations/my", params={"limit": 2})
+    data = response.json()["items"]
+    assert len(data) == 2
+    assert "task_title" not in data[0]
+
+
+@pytest.mark.asyncio
+async def test_score_rollups_average_trend_percentiles(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from datetime import date, datetime, timedelta
+    from app.models.team import Team
+    from app.models.task import Task, TaskStatus
+    from app.models.evaluation import Evaluation
+    from app.services.evaluation import check_score_rollups, rebuild_score_rollups
+
+    team = Team(name="Team", team_code="evalsum1", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            status=TaskStatus.done,
+            creator_id=manager_user.id,
+            team_id=team.id,
+            assignee_id=regular_user.id,
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    for task, score in zip(tasks, [5, 4, 2, 5]):
+        response = await client.post(
+            "/evaluations/", json={"task_id": task.id, "score": score}, headers=headers
+        )
+        assert response.status_code == 201
+
+    # Старая оценка, заведённая в обход сервиса, попадает в сводку после пересчёта
+    old_task = Task(
+        title="Old",
+        status=TaskStatus.done,
+        creator_id=manager_user.id,
+        team_id=team.id,
+        assignee_id=regular_user.id,
+    )
+    db_session.add(old_task)
+    await db_session.commit()
+    db_session.add(
+        Evaluation(
+            task_id=old_task.id,
+            user_id=manager_user.id,
+            score=1,
+            evaluated_at=datetime.utcnow() - timedelta(days=20),
+        )
+    )
+    await db_session.commit()
+    assert len(await check_score_rollups(db_session)) == 1
+    await rebuild_score_rollups(db_session)
+    await db_session.commit()
+    assert await check_score_rollups(db_session) == []
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get("/evaluations/average")
+    assert response.json()["average_score"] == 4.0
+    assert response.json()["count"] == 4
+
+    response = await client.get("/evaluations/average", params={"period": "month"})
+    assert response.json()["average_score"] == 3.4
+
+    today = datetime.utcnow().date()
+    response = await client.get(
+        "/evaluations/average",
+        params={
+            "period": "custom",
+            "date_from": str(today - timedelta(days=25)),
+            "date_to": str(today - timedelta(days=15)),
+        },
+    )
+    assert response.json()["average_score"] == 1.0
+
+    response = await client.get(
+        "/evaluations/trend", params={"period": "month", "bucket": "week"}
+    )
+    points = response.json()["points"]
+    assert len(points) == 5
+    assert sum(p["count"] for p in points) == 5
+    assert points[-1]["average"] == 4.0
+
+    response = await client.get("/evaluations/percentiles")
+    assert response.json()["count"] == 5
+    assert response.json()["percentiles"] == {
+        "p25": 2,
+        "p50": 4,
+        "p75": 5,
+        "p90": 5,
+    }
+
+    response = await client.get("/evaluations/average", params={"period": "year"})
+    assert response.status_code == 400
+
+    # Переназначение задачи переносит её оценку
+    response = await client.patch(
+        f"/tasks/{tasks[0].id}",
+        json={"assignee_id": manager_user.id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert await check_score_rollups(db_session) == []
+    response = await client.get("/evaluations/average")
+    assert response.json()["count"] == 3
+    assert isinstance(date.fromisoformat(response.json()["from"]), date)
@@ -0,0 +1,113 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_tasks_page_renders_team_tasks(
+    client: AsyncClient, manager_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Front Team", team_code="front123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    db_session.add(
+        Task(title="Задача со страницы", creator_id=manager_user.id, team_id=team.id)
+    )
+    await db_session.commit()
+
+    # Логин через форму (кука auth)
+    login = await client.post(
+        "/login",
+        data={"email": "manager@example.com", "password": "password123"},
+    )
+    assert login.status_code == 303
+
+    # Страница собирается в процессе, без HTTP-запросов к localhost:8000
+    response = await client.get("/view/tasks")
+    assert response.status_code == 200
+    assert "Задача со страницы" in response.text
+    assert "open" in response.text
+
+
+@pytest.mark.asyncio
+async def test_task_detail_and_edit_pages(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Front Team", team_code="front456", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    task = Task(
+        title="Детали",
+        creator_id=manager_user.id,
+        assignee_id=regular_user.id,
+        team_id=team.id,
+    )
+    db_session.add(task)
+    await db_session.commit()
+
+    await client.post(
+        "/login",
+        data={"email": "manager@example.com", "password": "password123"},
+    )
+
+    response = await client.get(f"/view/tasks/{task.id}")
+    assert response.status_code == 200
+    assert "Manager" in response.text
+    assert "User" in response.text
+
+    response = await client.get(f"/view/tasks/{task.id}/edit")
+    assert response.status_code == 200
+    assert f'value="{regular_user.id}" selected' in response.text
+
+    # Некорректный статус - сообщение и возврат к задаче, а не 500
+    response = await client.post(
+        f"/view/tasks/{task.id}/edit", data={"title": "Детали", "status": "closed"}
+    )
+    assert response.status_code == 303
+    assert response.headers["location"] == f"/view/tasks/{task.id}"
+    response = await client.get(f"/view/tasks/{task.id}")
+    assert "Некорректное значение поля status" in response.text
+
+
+@pytest.mark.asyncio
+async def test_calendar_day_page(client: AsyncClient, manager_user, db_session):
+    from datetime import datetime, time
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Front Team", team_code="front789", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    db_session.add(
+        Task(
+            title="Сдать сегодня",
+            deadline=datetime.combine(datetime.now().date(), time(18, 0)),
+            creator_id=manager_user.id,
+            assignee_id=manager_user.id,
+            team_id=team.id,
+        )
+    )
+    await db_session.commit()
+
+    await client.post(
+        "/login",
+        data={"email": "manager@example.com", "password": "password123"},
+    )
+    response = await client.get("/calendar/view/day")
+    assert response.status_code == 200
+    assert "Сдать сегодня (open)" in response.text
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.models.team import Team
+from app.models.user import RoleEnum, User
+from app.services.user_import import import_users
+from app.utils.security import verify_password
+
+
+@pytest.mark.asyncio
+async def test_import_users_csv_and_jsonl(db_session, manager_user, tmp_path):
+    # Существующая команда обновляется по team_code, новая создаётся
+    db_session.add(Team(name="Старое имя", team_code="dev", creator_id=None))
+    await db_session.commit()
+
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "email,password,full_name,role,team_code,team_name\n"
+        "lead@example.com,secret1,Lead,manager,dev,Разработка\n"
+        "dev1@example.com,secret2,Dev One,user,dev,\n"
+        "manager@example.com,secret3,Уже есть,user,dev,\n"
+        "bad-email,secret4,,user,,\n"
+        "dev1@example.com,secret5,Повтор,user,dev,\n"
+        "qa1@example.com,123,Short,user,qa,QA\n"
+        "qa2@example.com,secret6,QA Two,boss,qa,QA\n",
+        encoding="utf-8",
+    )
+    progress = []
+    stats = await import_users(
+        db_session, str(csv_path), batch_size=2, workers=2, progress=progress.append
+    )
+    assert stats["read"] == 7
+    assert stats["created"] == 2
+    assert stats["existing"] == 1
+    assert stats["invalid"] == 4
+    assert [e["line"] for e in stats["errors"]] == [4, 5, 6, 7]
+    assert stats["teams"] == 1
+    assert [p["done"] for p in progress] == [2, 3]
+
+    team = (
+        await db_session.execute(select(Team).where(Team.team_code == "dev"))
+    ).scalar_one()
+    await db_session.refresh(team)
+    assert team.name == "Разработка"
+    assert team.member_count == 2
+
+    lead = (
+        await db_session.execute(select(User).where(User.email == "lead@example.com"))
+    ).scalar_one()
+    assert lead.role == RoleEnum.manager
+    assert lead.team_id == team.id
+    assert lead.is_active and not lead.is_superuser
+    assert verify_password("secret1", lead.hashed_password)
+    assert team.creator_id == lead.id
+
+    jsonl_path = tmp_path / "more.jsonl"
+    jsonl_path.write_text(
+        "\n".join(
+            json.dumps(row)
+            for row in [
+                {"email": "qa1@example.com", "password": "secret7", "team_code": "qa"},
+                {"email": "lead@example.com", "password": "secret8"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    stats = await import_users(db_session, str(jsonl_path), workers=1)
+    assert stats["created"] == 1
+    assert stats["existing"] == 1
+
+    qa = (
+        await db_session.execute(select(Team).where(Team.team_code == "qa"))
+    ).scalar_one()
+    assert qa.name == "qa"
+    assert qa.creator_id is None  # менеджеров в команде нет
+    assert qa.member_count == 1
+
+
+@pytest.mark.asyncio
+async def test_import_users_email_case_insensitive(db_session, tmp_path):
+    from app.core.auth import UserManager
+    from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+
+    # В базе адрес со смешанным регистром (как ввели при регистрации)
+    db_session.add(
+        User(email="Alice@corp.com", hashed_password="x", role=RoleEnum.user)
+    )
+    await db_session.commit()
+
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "email,password\n"
+        "alice@CORP.com,secret1\n"
+        "Bob@corp.com,secret2\n"
+        "bob@corp.com,secret3\n"
+        "bob@,secret4\n",
+        encoding="utf-8",
+    )
+    stats = await import_users(db_session, str(csv_path), workers=1)
+    assert stats["created"] == 1
+    assert stats["existing"] == 1
+    assert [e["line"] for e in stats["errors"]] == [3, 4]
+
+    result = await db_session.execute(
+        select(User.email).where(User.email.ilike("%@corp.com")).order_by(User.id)
+    )
+    assert result.scalars().all() == ["Alice@corp.com", "bob@corp.com"]
+
+    # Вход ищет email без учёта регистра - находится ровно один пользователь
+    manager = UserManager(SQLAlchemyUserDatabase(db_session, User))
+    assert (await manager.get_by_email("alice@corp.com")).email == "Alice@corp.com"
+    assert (await manager.get_by_email("BOB@corp.com")).email == "bob@corp.com"
@@ -0,0 +1,55 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.database import TimedQueuePool, get_pool_status, prewarm_pool
+
+
+@pytest.mark.asyncio
+async def test_db_pool_endpoint_requires_superuser(client: AsyncClient, admin_user):
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "admin@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get("/internal/db/pool")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_db_pool_endpoint(client: AsyncClient, admin_user, db_session):
+    admin_user.is_superuser = True
+    db_session.add(admin_user)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "admin@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get("/internal/db/pool")
+    assert response.status_code == 200
+    assert "pool_class" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_timed_pool(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=3,
+        max_overflow=2,
+    )
+    try:
+        await prewarm_pool(10, target_engine=engine)
+
+        status = get_pool_status(engine)
+        assert status["size"] == 3
+        assert status["checked_in"] == 3
+        assert status["checked_out"] == 0
+        assert status["overflow"] == 0
+        assert status["wait"]["count"] == 3
+    finally:
+        await engine.dispose()
@@ -51,3 +51,190 @@ async def test_create_meeting_no_overlap(
         },
     )
     assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_create_meeting_lists_all_conflicts(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+
+    team = Team(name="Team", team_code="conf123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    for title, start, end, ids in [
+        ("Планёрка", "10:00", "11:00", [manager_user.id, regular_user.id]),
+        ("Созвон", "11:00", "12:00", [regular_user.id]),
+    ]:
+        response = await client.post(
+            "/meetings/",
+            json={
+                "title": title,
+                "start_time": f"2025-04-05T{start}:00",
+                "end_time": f"2025-04-05T{end}:00",
+                "participant_ids": ids,
+            },
+        )
+        assert response.status_code == 201
+
+    response = await client.post(
+        "/meetings/",
+        json={
+            "title": "Ретро",
+            "start_time": "2025-04-05T10:30:00",
+            "end_time": "2025-04-05T11:30:00",
+            "participant_ids": [manager_user.id, regular_user.id],
+        },
+    )
+    assert response.status_code == 400
+    conflicts = response.json()["detail"]["conflicts"]
+    assert [(c["email"], c["title"]) for c in conflicts] == [
+        ("manager@example.com", "Планёрка"),
+        ("user@example.com", "Планёрка"),
+        ("user@example.com", "Созвон"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_overlap_violation_from_db_maps_to_400(
+    client: AsyncClient, manager_user, regular_user, db_session, monkeypatch
+):
+    # Путь PostgreSQL: вставка без предварительной проверки, нарушение
+    # ограничения -> 400. Exclusion constraint эмулируется триггером SQLite.
+    from sqlalchemy import text
+    from app.models.team import Team
+    from app.models.meeting_participant import MEETING_OVERLAP_CONSTRAINT
+    from app.services import meeting as meeting_service
+
+    team = Team(name="Team", team_code="excl123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.execute(
+        text(
+            f"""
+            CREATE TRIGGER no_overlap BEFORE INSERT ON meeting_participants
+            WHEN EXISTS (
+                SELECT 1 FROM meeting_participants
+                WHERE user_id = NEW.user_id
+                  AND start_time < NEW.end_time AND end_time > NEW.start_time
+            )
+            BEGIN SELECT RAISE(ABORT, '{MEETING_OVERLAP_CONSTRAINT}'); END
+            """
+        )
+    )
+    await db_session.commit()
+
+    checks = []
+
+    async def counting_find_conflicts(*args):
+        checks.append(args)
+        return await find_conflicts(*args)
+
+    find_conflicts = meeting_service.find_conflicts
+    monkeypatch.setattr(meeting_service, "overlap_enforced_by_db", lambda db: True)
+    monkeypatch.setattr(meeting_service, "find_conflicts", counting_find_conflicts)
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    try:
+        meeting = {
+            "title": "Планёрка",
+            "start_time": "2025-04-05T10:00:00",
+            "end_time": "2025-04-05T11:00:00",
+            "participant_ids": [manager_user.id, regular_user.id],
+        }
+        response = await client.post("/meetings/", json=meeting)
+        assert response.status_code == 201
+        assert not checks  # успешная вставка - без проверочных запросов
+
+        meeting["title"] = "Ретро"
+        response = await client.post("/meetings/", json=meeting)
+        assert response.status_code == 400
+        conflicts = response.json()["detail"]["conflicts"]
+        assert {c["title"] for c in conflicts} == {"Планёрка"}
+        assert len(conflicts) == 2
+
+        # Встреча, которую отклонило ограничение, не сохранилась
+        response = await client.get("/meetings/")
+        assert [m["title"] for m in response.json()["items"]] == ["Планёрка"]
+    finally:
+        await db_session.execute(text("DROP TRIGGER no_overlap"))
+        await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_meeting_availability(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+
+    team = Team(name="Team", team_code="free123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    # Понедельник: у менеджера 9:00-10:00, у пользователя 10:00-10:20
+    for start, end, ids in [
+        ("09:00", "10:00", [manager_user.id]),
+        ("10:00", "10:20", [regular_user.id]),
+    ]:
+        response = await client.post(
+            "/meetings/",
+            json={
+                "title": "Занято",
+                "start_time": f"2025-04-07T{start}:00",
+                "end_time": f"2025-04-07T{end}:00",
+                "participant_ids": ids,
+            },
+        )
+        assert response.status_code == 201
+
+    params = {
+        "participant_ids": [manager_user.id, regular_user.id],
+        "date_from": "2025-04-05",
+        "date_to": "2025-04-07",
+        "duration": 60,
+        "limit": 3,
+    }
+    response = await client.get("/meetings/availability", params=params)
+    assert response.status_code == 200
+    # Выходные пропущены, 10:20 округляется до слота 10:30
+    assert response.json() == [
+        {"start_time": "2025-04-07T10:30:00", "end_time": "2025-04-07T11:30:00"},
+        {"start_time": "2025-04-07T11:30:00", "end_time": "2025-04-07T12:30:00"},
+        {"start_time": "2025-04-07T12:30:00", "end_time": "2025-04-07T13:30:00"},
+    ]
+
+    params["date_to"] = "2025-04-01"
+    response = await client.get("/meetings/availability", params=params)
+    assert response.status_code == 400
@@ -0,0 +1,124 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.database.database import engine
+
+HOT_TABLES = (
+    "tasks",
+    "meetings",
+    "meeting_participants",
+    "evaluations",
+    "evaluation_daily_scores",
+    "comments",
+    "users",
+)
+FULL_SCAN = re.compile(r"^SCAN (%s)\b" % "|".join(HOT_TABLES))
+
+
+async def _setup(client: AsyncClient, manager_user, regular_user, db_session):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Plan Team", team_code="plan123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    task = Task(
+        title="Plan task",
+        status="done",
+        creator_id=manager_user.id,
+        assignee_id=manager_user.id,
+        team_id=team.id,
+    )
+    db_session.add(task)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    return task
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    task = await _setup(client, manager_user, regular_user, db_session)
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        requests = [
+            ("GET", "/tasks/", None),
+            ("GET", "/tasks/?status=open&status=done&sort=-id", None),
+            ("GET", f"/tasks/?assignee_id={manager_user.id}", None),
+            ("GET", f"/tasks/?creator_id={manager_user.id}", None),
+            ("GET", "/tasks/?mine=true&sort=deadline", None),
+            ("GET", "/tasks/?overdue=true", None),
+            ("GET", "/tasks/?deadline_from=2025-01-01T00:00:00", None),
+            ("GET", "/tasks/?created_from=2025-01-01T00:00:00", None),
+            ("GET", f"/tasks/{task.id}", None),
+            ("GET", f"/tasks/{task.id}/detail", None),
+            ("PATCH", f"/tasks/{task.id}", {"title": "Plan task 2"}),
+            ("POST", f"/tasks/{task.id}/comments/", {"content": "Plan comment"}),
+            ("GET", f"/tasks/{task.id}/comments/?sort=-id", None),
+            ("GET", "/calendar/day", None),
+            ("GET", "/calendar/month", None),
+            ("GET", "/calendar/range?from=2025-04-01&to=2025-04-30", None),
+            (
+                "POST",
+                "/meetings/",
+                {
+                    "title": "Plan meeting",
+                    "start_time": "2025-04-05T10:00:00",
+                    "end_time": "2025-04-05T11:00:00",
+                    "participant_ids": [manager_user.id, regular_user.id],
+                },
+            ),
+            ("GET", "/meetings/", None),
+            (
+                "GET",
+                f"/meetings/availability?participant_ids={manager_user.id}"
+                f"&participant_ids={regular_user.id}"
+                "&date_from=2025-04-01&date_to=2025-04-28&duration=30",
+                None,
+            ),
+            ("POST", "/evaluations/", {"task_id": task.id, "score": 5}),
+            ("GET", "/evaluations/my", None),
+            ("GET", "/evaluations/my?expand=task", None),
+            ("GET", "/evaluations/average", None),
+            ("GET", "/evaluations/trend?bucket=week", None),
+            ("GET", "/evaluations/percentiles?period=quarter", None),
+            ("GET", f"/team/{task.team_id}/analytics", None),
+            ("GET", f"/team/{task.team_id}/summary", None),
+            ("GET", "/search/?q=plan", None),
+        ]
+        for method, url, body in requests:
+            response = await client.request(method, url, json=body)
+            assert response.status_code < 400, (url, response.text)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    assert statements
+
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )
+            plan = [row[-1] for row in result]
+            scans = [line for line in plan if FULL_SCAN.match(line)]
+            assert not scans, f"Полный проход по таблице:\n{statement}\n{plan}"
@@ -0,0 +1,61 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import database
+from app.database.database import Base
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_except_after_write(
+    client: AsyncClient, manager_user, db_session, tmp_path, monkeypatch
+):
+    from app.models.team import Team
+
+    # Отдельный файл SQLite вместо реплики: схема есть, данных нет
+    replica_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    )
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    monkeypatch.setattr(
+        database,
+        "ReadSessionLocal",
+        async_sessionmaker(
+            bind=replica_engine, class_=AsyncSession, expire_on_commit=False
+        ),
+    )
+
+    team = Team(name="Replica Team", team_code="repl123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    client.cookies.clear()
+
+    try:
+        response = await client.post("/tasks/", json={"title": "Только в primary"})
+        assert response.status_code == 201
+
+        # Сразу после записи чтение идёт в primary - задача видна,
+        # в том числе у клиента, который не возвращает куку сессии
+        response = await client.get("/tasks/")
+        assert [t["title"] for t in response.json()["items"]] == ["Только в primary"]
+        client.cookies.clear()
+        response = await client.get("/tasks/")
+        assert [t["title"] for t in response.json()["items"]] == ["Только в primary"]
+
+        # Без отметки о записи чтение идёт в реплику (она пустая)
+        database.sticky_clients.clear()
+        response = await client.get("/tasks/")
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+    finally:
+        await replica_engine.dispose()
@@ -0,0 +1,131 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_and_comments(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+    from app.models.comment import Comment
+
+    team = Team(name="Search Team", team_code="srch123", creator_id=manager_user.id)
+    other = Team(name="Other Team", team_code="oth123", creator_id=regular_user.id)
+    db_session.add_all([team, other])
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    tasks = [
+        Task(title="Миграция базы данных", description="Перенести отчёты"),
+        Task(title="Отчёт за квартал", description="Собрать данные из базы"),
+        Task(title="Обновить зависимости", description=None),
+    ]
+    for task in tasks:
+        task.creator_id = manager_user.id
+        task.team_id = team.id
+    hidden = Task(
+        title="Миграция чужой команды", creator_id=regular_user.id, team_id=other.id
+    )
+    db_session.add_all(tasks + [hidden])
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.post(
+        f"/tasks/{tasks[2].id}/comments/",
+        json={"content": "После обновления нужна миграция"},
+    )
+    assert response.status_code == 201
+    db_session.add(
+        Comment(content="Тест", user_id=regular_user.id, task_id=hidden.id)
+    )
+    await db_session.commit()
+
+    # Совпадение в названии выше, чем в комментарии; чужая команда не видна
+    response = await client.get("/search/?q=миграц")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(i["kind"], i["task_id"]) for i in items] == [
+        ("task", tasks[0].id),
+        ("comment", tasks[2].id),
+    ]
+    assert items[0]["title"] == "<mark>Миграция</mark> базы данных"
+    assert "<mark>миграция</mark>" in items[1]["snippet"]
+    assert items[1]["title"] == "Обновить зависимости"
+    assert items[0]["rank"] > items[1]["rank"]
+
+    # Все слова обязательны
+    response = await client.get("/search/?q=миграц квартал")
+    assert [i["task_id"] for i in response.json()["items"]] == []
+    response = await client.get("/search/?q=данн баз")
+    assert {i["task_id"] for i in response.json()["items"]} == {
+        tasks[0].id,
+        tasks[1].id,
+    }
+
+    # Постранично по курсору ранга
+    seen = []
+    url = "/search/?q=данн&limit=1"
+    while url:
+        response = await client.get(url)
+        page = response.json()
+        seen += [i["task_id"] for i in page["items"]]
+        cursor = page["next_cursor"]
+        url = f"/search/?q=данн&limit=1&cursor={cursor}" if cursor else None
+    assert sorted(seen) == sorted([tasks[0].id, tasks[1].id])
+
+    # Изменения задачи и удаление попадают в индекс
+    response = await client.patch(
+        f"/tasks/{tasks[1].id}", json={"title": "Квартальная миграция"}
+    )
+    assert response.status_code == 200
+    response = await client.get("/search/?q=квартальн")
+    assert [i["id"] for i in response.json()["items"]] == [tasks[1].id]
+    response = await client.delete(f"/tasks/{tasks[2].id}")
+    assert response.status_code == 204
+    response = await client.get("/search/?q=обновлени")
+    assert response.json()["items"] == []
+
+    response = await client.get("/search/?q=!!!")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_escapes_html(client: AsyncClient, manager_user, db_session):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Xss Team", team_code="xss123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    db_session.add(
+        Task(
+            title="<script>alert(1)</script> релиз",
+            description='Релиз <img src=x onerror="alert(1)">',
+            creator_id=manager_user.id,
+            team_id=team.id,
+        )
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get("/search/?q=релиз")
+    [item] = response.json()["items"]
+    assert item["title"] == (
+        "&lt;script&gt;alert(1)&lt;/script&gt; <mark>релиз</mark>"
+    )
+    assert "<img" not in item["snippet"]
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in item["snippet"]
@@ -39,3 +39,239 @@ async def test_create_task_by_manager(client: AsyncClient, manager_user, db_sess
     data = response.json()
     assert data["title"] == "Новая задача"
     assert data["status"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_get_task_detail(client: AsyncClient, manager_user, regular_user, db_session):
+    from app.models.team import Team
+    from app.models.task import Task
+    from app.models.comment import Comment
+
+    team = Team(name="Detail Team", team_code="det123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    task = Task(
+        title="Детальная задача",
+        creator_id=manager_user.id,
+        assignee_id=regular_user.id,
+        team_id=team.id,
+    )
+    db_session.add(task)
+    await db_session.commit()
+    db_session.add(Comment(content="Первый", user_id=regular_user.id, task_id=task.id))
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get(f"/tasks/{task.id}/detail")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["creator"]["email"] == "manager@example.com"
+    assert data["assignee"]["email"] == "user@example.com"
+    assert [c["content"] for c in data["comments"]] == ["Первый"]
+    assert data["evaluations"] == []
+    assert {m["email"] for m in data["team_members"]} == {
+        "manager@example.com",
+        "user@example.com",
+    }
+    assert set(data["team_members"][0]) == {"id", "full_name", "email"}
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_cursor_pagination(
+    client: AsyncClient, manager_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task
+
+    team = Team(name="Page Team", team_code="page123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+    db_session.add_all(
+        [
+            Task(title=f"Task {i}", team_id=team.id, creator_id=manager_user.id)
+            for i in range(5)
+        ]
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    titles = []
+    params = {"limit": 2, "with_total": True}
+    while True:
+        response = await client.get("/tasks/", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_estimate"] == 5
+        titles += [t["title"] for t in data["items"]]
+        if not data["next_cursor"]:
+            assert "Link" not in response.headers
+            break
+        assert 'rel="next"' in response.headers["Link"]
+        params = {"limit": 2, "with_total": True, "cursor": data["next_cursor"]}
+
+    assert titles == [f"Task {i}" for i in range(5)]
+
+    response = await client.get("/tasks/", params={"cursor": "не-курсор"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_filters_and_sort(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from app.models.team import Team
+    from app.models.task import Task, TaskStatus
+
+    team = Team(name="Filter Team", team_code="flt123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+
+    def task(title, status, assignee, deadline):
+        return Task(
+            title=title,
+            status=status,
+            assignee_id=assignee.id if assignee else None,
+            deadline=deadline,
+            creator_id=manager_user.id,
+            team_id=team.id,
+        )
+
+    db_session.add_all(
+        [
+            task("Просрочена", TaskStatus.open, regular_user, datetime(2020, 1, 1)),
+            task("Выполнена", TaskStatus.done, regular_user, datetime(2020, 1, 2)),
+            task("Моя", TaskStatus.in_progress, manager_user, datetime(2999, 1, 1)),
+            task("Без срока", TaskStatus.open, None, None),
+        ]
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    async def titles(**params):
+        response = await client.get("/tasks/", params=params)
+        assert response.status_code == 200, response.text
+        return [t["title"] for t in response.json()["items"]]
+
+    assert await titles(status=["open", "in_progress"]) == [
+        "Просрочена",
+        "Моя",
+        "Без срока",
+    ]
+    assert await titles(assignee_id=regular_user.id) == ["Просрочена", "Выполнена"]
+    assert await titles(mine=True) == ["Моя"]
+    assert await titles(overdue=True) == ["Просрочена"]
+    assert await titles(deadline_from="2020-01-02T00:00:00") == ["Выполнена", "Моя"]
+    assert await titles(created_to="2000-01-01T00:00:00") == []
+
+    # Сортировка по дедлайну по страницам: задачи без срока - в конце
+    expected = ["Моя", "Выполнена", "Просрочена", "Без срока"]
+    collected, params = [], {"sort": "-deadline", "limit": 1}
+    while True:
+        data = (await client.get("/tasks/", params=params)).json()
+        collected += [t["title"] for t in data["items"]]
+        if not data["next_cursor"]:
+            break
+        params["cursor"] = data["next_cursor"]
+    assert collected == expected
+
+    response = await client.get("/tasks/", params={"sort": "title"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_and_update_tasks(
+    client: AsyncClient, manager_user, regular_user, admin_user, db_session
+):
+    from app.models.team import Team
+
+    team = Team(name="Bulk Team", team_code="bulk123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    items = [
+        {"title": "Первая", "assignee_id": regular_user.id},
+        # admin не в команде
+        {"title": "Чужой исполнитель", "assignee_id": admin_user.id},
+        {"title": "Третья", "deadline": "2025-04-10T10:00:00"},
+    ]
+
+    # atomic: одна ошибка - ничего не создано
+    response = await client.post("/tasks/bulk", json={"items": items})
+    assert response.status_code == 400
+    assert [e["index"] for e in response.json()["detail"]["errors"]] == [1]
+    response = await client.get("/tasks/")
+    assert response.json()["items"] == []
+
+    response = await client.post(
+        "/tasks/bulk", json={"items": items, "mode": "best_effort"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (2, 1)
+    assert [r["status_code"] for r in data["items"]] == [201, 400, 201]
+    first, third = data["items"][0]["task"], data["items"][2]["task"]
+    assert first["title"] == "Первая"
+    assert first["assignee_id"] == regular_user.id
+    assert third["deadline"] == "2025-04-10T10:00:00"
+    assert first["created_at"]
+
+    updates = [
+        {"id": first["id"], "status": "done"},
+        {"id": third["id"], "title": "Третья (правка)"},
+        {"id": third["id"], "title": "Повтор"},
+        {"id": 10_000, "title": "Нет такой"},
+    ]
+    response = await client.patch("/tasks/bulk", json={"items": updates})
+    assert response.status_code == 400
+    errors = response.json()["detail"]["errors"]
+    assert [(e["index"], e["status_code"]) for e in errors] == [(2, 400), (3, 404)]
+
+    response = await client.patch(
+        "/tasks/bulk", json={"items": updates, "mode": "best_effort"}
+    )
+    data = response.json()
+    assert [r["status_code"] for r in data["items"]] == [200, 200, 400, 404]
+    assert data["items"][0]["task"]["status"] == "done"
+    assert data["items"][0]["task"]["completed_at"] is not None
+
+    response = await client.get(f"/tasks/{third['id']}")
+    assert response.json()["title"] == "Третья (правка)"
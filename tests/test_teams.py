@@ -42,3 +42,285 @@ async def test_join_team_by_code(client: AsyncClient, regular_user, db_session):
 
     assert response.status_code == 200
     assert response.json()["team_code"] == "abcd1234"
+
+
+@pytest.mark.asyncio
+async def test_team_analytics(
+    client: AsyncClient, manager_user, regular_user, db_session
+):
+    from datetime import datetime, timedelta
+    from app.models.team import Team
+    from app.models.task import Task, TaskStatus
+    from app.models.evaluation import Evaluation
+
+    team = Team(name="Stats Team", team_code="stats123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+
+    manager_user.team_id = team.id
+    regular_user.team_id = team.id
+    db_session.add_all([manager_user, regular_user])
+    await db_session.commit()
+
+    now = datetime.utcnow().replace(microsecond=0)
+    tasks = [
+        # выполнена в срок
+        Task(
+            title="On time",
+            status=TaskStatus.done,
+            deadline=now + timedelta(days=1),
+            completed_at=now - timedelta(days=1),
+        ),
+        # выполнена с опозданием
+        Task(
+            title="Late",
+            status=TaskStatus.done,
+            deadline=now - timedelta(days=3),
+            completed_at=now - timedelta(days=2),
+        ),
+        # просрочена
+        Task(title="Overdue", deadline=now - timedelta(days=1)),
+        Task(title="Open"),
+    ]
+    for task in tasks:
+        task.creator_id = manager_user.id
+        task.assignee_id = regular_user.id
+        task.team_id = team.id
+    db_session.add_all(tasks)
+    await db_session.commit()
+    db_session.add_all(
+        [
+            Evaluation(
+                task_id=tasks[0].id,
+                user_id=manager_user.id,
+                score=5,
+                evaluated_at=now - timedelta(days=1),
+            ),
+            Evaluation(
+                task_id=tasks[1].id,
+                user_id=manager_user.id,
+                score=2,
+                evaluated_at=now,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    response = await client.get(f"/team/{team.id}/analytics")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tasks"]["total"] == 4
+    assert data["tasks"]["by_status"] == {"open": 2, "in_progress": 0, "done": 2}
+    assert data["tasks"]["overdue"] == 1
+    assert data["tasks"]["deadline_hit_ratio"] == 0.5
+    assert data["scores"]["average"] == 3.5
+    assert data["scores"]["histogram"] == {"1": 0, "2": 1, "3": 0, "4": 0, "5": 1}
+
+    members = {m["user_id"]: m for m in data["members"]}
+    assert members[regular_user.id]["average_score"] == 3.5
+    assert members[regular_user.id]["overdue"] == 1
+    assert members[manager_user.id]["tasks"] == 0
+    assert members[manager_user.id]["average_score"] is None
+
+    trend = data["trend"]
+    assert trend["daily_average"][-2:] == [5.0, 2.0]
+    assert trend["moving_average"][-1] == 3.5
+    assert sum(trend["daily_completed"]) == 2
+
+    # Закрытие задачи сбрасывает кэш
+    response = await client.get(f"/team/{team.id}/analytics")
+    assert response.json()["generated_at"] == data["generated_at"]
+    response = await client.patch(f"/tasks/{tasks[3].id}", json={"status": "done"})
+    assert response.status_code == 200
+    assert response.json()["completed_at"] is not None
+    response = await client.get(f"/team/{team.id}/analytics")
+    assert response.json()["tasks"]["by_status"]["done"] == 3
+
+    # Чужая команда и обычный пользователь - 403
+    response = await client.get(f"/team/{team.id + 1}/analytics")
+    assert response.status_code == 403
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "user@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    response = await client.get(f"/team/{team.id}/analytics")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_team_export(
+    client: AsyncClient, manager_user, db_session, monkeypatch
+):
+    import csv
+    import io
+    import json
+    from datetime import datetime, timedelta
+    from app.models.team import Team
+    from app.models.task import Task, TaskStatus
+    from app.models.meeting import Meeting
+    from app.models.evaluation import Evaluation
+    from app.services import export as export_service
+
+    team = Team(name="Export Team", team_code="exp123", creator_id=manager_user.id)
+    db_session.add(team)
+    await db_session.commit()
+    manager_user.team_id = team.id
+    db_session.add(manager_user)
+
+    now = datetime(2025, 6, 1, 12, 0)
+    tasks = [
+        Task(
+            title=f"Задача {i}",
+            status=TaskStatus.done if i % 2 else TaskStatus.open,
+            creator_id=manager_user.id,
+            assignee_id=manager_user.id,
+            team_id=team.id,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(tasks)
+    db_session.add(
+        Meeting(
+            title='Планёрка, "итоги"',
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+            team_id=team.id,
+        )
+    )
+    await db_session.commit()
+    db_session.add(
+        Evaluation(
+            task_id=tasks[1].id, user_id=manager_user.id, score=4, evaluated_at=now
+        )
+    )
+    await db_session.commit()
+
+    login = await client.post(
+        "/auth/jwt/login",
+        data={"username": "manager@example.com", "password": "password123"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    # Маленькие пачки: ответ собирается из нескольких кусков
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2)
+    response = await client.get(f"/team/{team.id}/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["entity"] for line in lines] == (
+        ["tasks"] * 5 + ["meetings", "evaluations"]
+    )
+    assert [line["id"] for line in lines[:5]] == [t.id for t in tasks]
+    assert lines[1]["status"] == "done"
+    assert lines[5]["start_time"] == "2025-06-01T12:00:00"
+    assert lines[6]["score"] == 4
+    assert lines[6]["assignee_id"] == manager_user.id
+
+    response = await client.get(
+        f"/team/{team.id}/export",
+        params={"format": "csv", "entities": "meetings,evaluations"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["entity"] for row in rows] == ["meetings", "evaluations"]
+    assert rows[0]["title"] == 'Планёрка, "итоги"'
+    assert rows[0]["score"] == ""
+    assert rows[1]["score"] == "4"
+
+    response = await client.get(
+        f"/team/{team.id}/export", params={"entities": "tasks,users"}
+    )
+    assert response.status_code == 400
+    response = await client.get(f"/team/{team.id + 1}/export")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_team_counters(
+    client: AsyncClient, manager_user, regular_user, admin_user, db_session
+):
+    from sqlalchemy import update
+    from app.models.team import Team
+    from app.services.team import reconcile_team_counters
+
+    team = Team(name="Counter Team", team_code="cnt123", creator_id=manager_user.id)
+    other = Team(name="Other Team", team_code="oth123", creator_id=admin_user.id)
+    db_session.add_all([team, other])
+    await db_session.commit()
+
+    async def login(email):
+        response = await client.post(
+            "/auth/jwt/login", data={"username": email, "password": "password123"}
+        )
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+    # Участники считаются при входе в команду
+    for email in ["user@example.com", "manager@example.com"]:
+        await login(email)
+        response = await client.post("/team/join?team_code=cnt123")
+        assert response.status_code == 200
+    assert response.json()["member_count"] == 2
+
+    # Задачи - при создании, смене статуса и удалении
+    response = await client.post(
+        "/tasks/", json={"title": "Моя", "assignee_id": regular_user.id}
+    )
+    mine = response.json()["id"]
+    response = await client.post(
+        "/tasks/bulk", json={"items": [{"title": "A"}, {"title": "B"}, {"title": "C"}]}
+    )
+    created = [item["task"]["id"] for item in response.json()["items"]]
+    response = await client.patch(
+        "/tasks/bulk",
+        json={"items": [{"id": created[0], "status": "done"}, {"id": created[1]}]},
+    )
+    assert response.json()["succeeded"] == 2
+    response = await client.patch(f"/tasks/{created[1]}", json={"status": "done"})
+    assert response.status_code == 200
+    response = await client.delete(f"/tasks/{created[2]}")
+    assert response.status_code == 204
+
+    await login("user@example.com")
+    response = await client.get(f"/view/tasks/{mine}/start")
+    assert response.status_code == 303
+
+    response = await client.get(f"/team/{team.id}/summary")
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": team.id,
+        "name": "Counter Team",
+        "member_count": 2,
+        "open_task_count": 0,
+        "in_progress_task_count": 1,
+        "done_task_count": 2,
+        "task_count": 3,
+    }
+    response = await client.get(f"/team/{other.id}/summary")
+    assert response.status_code == 403
+
+    await login("admin@example.com")
+    response = await client.get(f"/team/{other.id}/summary")
+    assert response.json()["task_count"] == 0
+    response = await client.get("/team/999999/summary")
+    assert response.status_code == 404
+
+    # Сверка находит и исправляет расхождение
+    await db_session.execute(
+        update(Team).where(Team.id == team.id).values(open_task_count=5)
+    )
+    await db_session.commit()
+    drift = await reconcile_team_counters(db_session)
+    await db_session.commit()
+    assert [(d["team_id"], d["actual"]["open_task_count"]) for d in drift] == [
+        (team.id, 5)
+    ]
+    assert drift[0]["expected"]["open_task_count"] == 0
+    assert await reconcile_team_counters(db_session) == []